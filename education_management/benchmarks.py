@@ -0,0 +1,94 @@
+"""Ad-hoc performance benchmarks.
+
+Run against a development site, e.g.:
+
+    bench --site <site> execute education_management.benchmarks.rank_writer --kwargs "{'rows': 20000}"
+
+Benchmarks insert synthetic data inside the current transaction and roll it back
+when done, so nothing is left behind on the site.
+"""
+
+import random
+import time
+
+import frappe
+
+from education_management.ranking import refresh_ranks
+
+
+def rank_writer(rows=5000):
+    """Compare the per-row `set_value` rank writer with the bulk partitioned rank writer"""
+    academic_year = insert_synthetic_submissions(rows)
+
+    filters = {
+        "academic_year": academic_year,
+        "docstatus": 1,
+        "validation_status": "Validated",
+        "submission_status": "Approved"
+    }
+
+    try:
+        start = time.perf_counter()
+        legacy_rank_writer(filters)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        refresh_ranks(filters)
+        bulk_seconds = time.perf_counter() - start
+    finally:
+        frappe.db.rollback()
+
+    return {
+        "rows": rows,
+        "legacy_seconds": round(legacy_seconds, 3),
+        "legacy_rows_per_sec": round(rows / legacy_seconds, 1),
+        "bulk_seconds": round(bulk_seconds, 3),
+        "bulk_rows_per_sec": round(rows / bulk_seconds, 1),
+    }
+
+
+def legacy_rank_writer(filters):
+    """Rank writer as it was before bulk updates: two UPDATEs per submission"""
+    submissions = frappe.get_all(
+        "Merit Score Submission",
+        filters=filters,
+        fields=["name", "student_category"],
+        order_by="total_merit_score desc, percentage_score desc"
+    )
+
+    overall_rank = 1
+    category_ranks = {}
+
+    for submission in submissions:
+        frappe.db.set_value("Merit Score Submission", submission.name, "merit_rank", overall_rank)
+        overall_rank += 1
+
+        category = submission.student_category or "General"
+        if category not in category_ranks:
+            category_ranks[category] = 1
+
+        frappe.db.set_value("Merit Score Submission", submission.name, "category_rank", category_ranks[category])
+        category_ranks[category] += 1
+
+
+def insert_synthetic_submissions(rows, categories=("General", "OBC", "SC", "ST")):
+    """Bulk insert approved submissions under a throwaway academic year"""
+    academic_year = f"BENCH-{frappe.generate_hash(length=8)}"
+    now = frappe.utils.now()
+    fields = [
+        "name", "creation", "modified", "owner", "modified_by", "docstatus",
+        "student_applicant", "academic_year", "student_category", "total_merit_score",
+        "maximum_possible_score", "percentage_score", "submission_status", "validation_status"
+    ]
+
+    values = []
+    for idx in range(rows):
+        score = round(random.uniform(200, 500), 2)
+        values.append((
+            f"{academic_year}-{idx}", now, now, "Administrator", "Administrator", 1,
+            f"{academic_year}-APP-{idx}", academic_year, random.choice(categories), score,
+            500, round(score / 5, 2), "Approved", "Validated"
+        ))
+
+    frappe.db.bulk_insert("Merit Score Submission", fields, values)
+    return academic_year
@@ -0,0 +1,42 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("regrade-merit-scores")
+@click.option("--academic-year", help="Only regrade submissions for this academic year")
+@click.option("--program", help="Only regrade submissions for this program")
+@click.option("--workers", type=int, default=1, help="Worker processes; programs are split between them")
+@click.option("--dry-run", is_flag=True, default=False, help="Count rows that would change without writing")
+@pass_context
+def regrade_merit_scores(context, academic_year=None, program=None, workers=1, dry_run=False):
+    """Recompute merit percentages and grades after grading settings change"""
+    from education_management.regrade import get_program_filters, get_regrade_filters, regrade_program
+
+    site = get_site(context)
+    filters = get_regrade_filters(academic_year, program)
+
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        tasks = get_program_filters(filters)
+    finally:
+        frappe.destroy()
+
+    # Each worker opens its own site connection, so start them fresh
+    with ProcessPoolExecutor(max_workers=max(workers, 1), mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(regrade_program, site, task, dry_run) for task in tasks]
+        for future in futures:
+            program, result = future.result()
+            click.echo(
+                f"{program}: "
+                f"{result['submissions_changed']}/{result['submissions']} submissions, "
+                f"{result['subject_rows_changed']}/{result['subject_rows']} subject rows "
+                f"{'would change' if dry_run else 'updated'}"
+            )
+
+
+commands = [regrade_merit_scores]
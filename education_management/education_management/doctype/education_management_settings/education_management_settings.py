@@ -2,10 +2,17 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import cint
 
+from education_management.utils import (
+    clear_education_management_settings_cache,
+    get_education_management_settings,
+)
+
 
 class EducationManagementSettings(Document):
     def validate(self):
         self.validate_file_size()
+        self.validate_tie_breaking_order()
+        self.validate_grade_boundaries()
 
     def validate_file_size(self):
         if self.max_file_size_mb and self.max_file_size_mb <= 0:
@@ -14,45 +21,49 @@ class EducationManagementSettings(Document):
         if self.max_file_size_mb and self.max_file_size_mb > 100:
             frappe.throw("Maximum file size cannot exceed 100 MB")
 
+    def validate_tie_breaking_order(self):
+        from education_management.ranking import parse_tie_breakers
+
+        # Normalise the chain and reject unknown criteria before they reach ranking
+        self.tie_breaking_order = "\n".join(parse_tie_breakers(self.tie_breaking_order))
+
+    def validate_grade_boundaries(self):
+        from education_management.grading import parse_grade_boundaries
+
+        scale = parse_grade_boundaries(self.grade_boundaries)
+        self.grade_boundaries = "\n".join(
+            f"{grade}: {minimum:g}" for grade, minimum in zip(reversed(scale.grades), reversed(scale.minimums), strict=True)
+        )
+
     def on_update(self):
-        # Clear cache when settings are updated
-        frappe.clear_cache()
+        # Only settings consumers are affected; leave the rest of the site cache alone
+        clear_education_management_settings_cache()
 
 
 @frappe.whitelist()
 def get_merit_list_settings():
     """Get education management settings for merit list"""
-    settings = frappe.get_single("Education Management Settings")
+    settings = get_education_management_settings()
 
     return {
-        "enable_merit_list_process": cint(settings.enable_merit_list_process),
-        "merit_list_mandatory": cint(settings.merit_list_mandatory),
-        "merit_validation_required": cint(settings.merit_validation_required),
-        "document_upload_mandatory": cint(settings.document_upload_mandatory),
-        "auto_approve_if_documents_verified": cint(settings.auto_approve_if_documents_verified),
-        "default_minimum_merit_score": settings.default_minimum_merit_score or 0,
-        "max_file_size_mb": settings.max_file_size_mb or 10,
-        "enable_category_wise_ranking": cint(settings.enable_category_wise_ranking),
-        "enable_program_wise_ranking": cint(settings.enable_program_wise_ranking),
-        "auto_generate_rankings": cint(settings.auto_generate_rankings)
+        fieldname: settings[fieldname]
+        for fieldname in (
+            "enable_merit_list_process", "merit_list_mandatory", "merit_validation_required",
+            "document_upload_mandatory", "auto_approve_if_documents_verified",
+            "default_minimum_merit_score", "max_file_size_mb", "enable_category_wise_ranking",
+            "enable_program_wise_ranking", "auto_generate_rankings"
+        )
     }
 
 
 @frappe.whitelist()
 def is_merit_list_enabled():
     """Check if merit list process is enabled"""
-    try:
-        settings = frappe.get_single("Education Management Settings")
-        return cint(settings.enable_merit_list_process)
-    except:
-        return 0
+    return get_education_management_settings().enable_merit_list_process
 
 
 @frappe.whitelist()
 def is_merit_list_mandatory():
     """Check if merit list is mandatory for admission"""
-    try:
-        settings = frappe.get_single("Education Management Settings")
-        return cint(settings.merit_list_mandatory) and cint(settings.enable_merit_list_process)
-    except:
-        return 0
\ No newline at end of file
+    settings = get_education_management_settings()
+    return settings.merit_list_mandatory and settings.enable_merit_list_process
@@ -1,4 +1,29 @@
 frappe.ui.form.on('Merit List Generation Tool', {
+    setup: function(frm) {
+        // Regenerate the list once a queued ranking refresh completes
+        frappe.realtime.on('merit_rank_refresh', function(data) {
+            if (data.academic_year !== frm.doc.academic_year) {
+                return;
+            }
+
+            if (data.status === 'Completed') {
+                frappe.show_alert({message: __('Merit rankings refreshed'), indicator: 'green'});
+                frm.trigger('generate_list');
+            } else if (data.status === 'Failed') {
+                frappe.show_alert({message: __('Merit ranking refresh failed'), indicator: 'red'});
+            }
+        });
+
+        // Exports too long to run inline are delivered when the background job finishes
+        frappe.realtime.on('merit_list_export', function(data) {
+            if (data.status === 'Completed') {
+                frappe.msgprint(__('Merit list export is ready: <a href="{0}" target="_blank">{1}</a>', [data.file_url, data.file_name]));
+            } else if (data.status === 'Failed') {
+                frappe.show_alert({message: __('Merit list export failed'), indicator: 'red'});
+            }
+        });
+    },
+
     refresh: function(frm) {
         frm.page.set_title(__('Merit List Generation Tool'));
 
@@ -6,6 +31,18 @@ frappe.ui.form.on('Merit List Generation Tool', {
         if (!frm.doc.academic_year) {
             frm.set_value('academic_year', frappe.defaults.get_user_default('academic_year'));
         }
+
+        // Rows are not stored on the tool; fetch the first page for the saved filters
+        if (frm.doc.generation_summary) {
+            load_merit_list_page(frm);
+
+            frm.add_custom_button(__('Publish Snapshot'), function() {
+                frm.call({
+                    method: 'publish_snapshot',
+                    doc: frm.doc
+                });
+            });
+        }
     },
 
     generate_list: function(frm) {
@@ -19,7 +56,8 @@ frappe.ui.form.on('Merit List Generation Tool', {
             doc: frm.doc,
             callback: function(r) {
                 if (r.message) {
-                    frm.reload_doc();
+                    frm.refresh_field('generation_summary');
+                    render_merit_list_page(frm, r.message, false);
                 }
             }
         });
@@ -34,21 +72,32 @@ frappe.ui.form.on('Merit List Generation Tool', {
         frappe.confirm(
             __('This will recalculate merit rankings for all submissions. Continue?'),
             function() {
-                frm.call({
-                    method: 'refresh_ranking',
-                    doc: frm.doc,
-                    callback: function(r) {
-                        if (r.message) {
-                            frm.reload_doc();
-                        }
-                    }
-                });
+                frm.events.call_refresh_ranking(frm, 0);
             }
         );
     },
 
+    call_refresh_ranking: function(frm, force) {
+        frm.call({
+            method: 'refresh_ranking',
+            doc: frm.doc,
+            args: {force: force},
+            callback: function(r) {
+                // Queued refreshes regenerate the list from the realtime handler
+                if (r.message && r.message.status === 'Completed') {
+                    frm.trigger('generate_list');
+                    if (!force) {
+                        frappe.confirm(__('Merit rankings are already up to date. Recalculate them anyway?'), function() {
+                            frm.events.call_refresh_ranking(frm, 1);
+                        });
+                    }
+                }
+            }
+        });
+    },
+
     export_pdf: function(frm) {
-        if (!frm.doc.merit_list_results) {
+        if (!frm.doc.generation_summary) {
             frappe.msgprint(__('Please generate merit list first'));
             return;
         }
@@ -60,38 +109,127 @@ frappe.ui.form.on('Merit List Generation Tool', {
     },
 
     export_excel: function(frm) {
-        if (!frm.doc.merit_list_results) {
+        if (!frm.doc.generation_summary) {
             frappe.msgprint(__('Please generate merit list first'));
             return;
         }
 
-        frm.call({
-            method: 'export_excel',
-            doc: frm.doc
-        });
+        frappe.prompt(
+            {fieldname: 'file_format', fieldtype: 'Select', label: __('Format'), options: 'xlsx\ncsv', default: 'xlsx', reqd: 1},
+            function(values) {
+                frm.call({
+                    method: 'export_excel',
+                    doc: frm.doc,
+                    args: {file_format: values.file_format},
+                    callback: function(r) {
+                        if (r.message && r.message.file_url) {
+                            window.open(r.message.file_url);
+                        }
+                    }
+                });
+            },
+            __('Export Merit List')
+        );
     },
 
     program: function(frm) {
         // Clear results when filter changes
-        frm.set_value('merit_list_results', '');
-        frm.set_value('generation_summary', '');
+        clear_merit_list(frm);
     },
 
     student_category: function(frm) {
         // Clear results when filter changes
-        frm.set_value('merit_list_results', '');
-        frm.set_value('generation_summary', '');
+        clear_merit_list(frm);
     },
 
     minimum_score: function(frm) {
         // Clear results when filter changes
-        frm.set_value('merit_list_results', '');
-        frm.set_value('generation_summary', '');
+        clear_merit_list(frm);
     },
 
     include_pending: function(frm) {
         // Clear results when filter changes
-        frm.set_value('merit_list_results', '');
-        frm.set_value('generation_summary', '');
+        clear_merit_list(frm);
+    }
+});
+
+function load_merit_list_page(frm, after) {
+    frm.call({
+        method: 'get_merit_list_page',
+        doc: frm.doc,
+        args: {after: after},
+        callback: function(r) {
+            if (r.message) {
+                render_merit_list_page(frm, r.message, Boolean(after));
+            }
+        }
+    });
+}
+
+function render_merit_list_page(frm, page, append) {
+    let $wrapper = frm.fields_dict.merit_list_results.$wrapper;
+
+    if (!append) {
+        if (!page.rows.length) {
+            $wrapper.html(`<p>${__('No merit submissions found matching the criteria.')}</p>`);
+            return;
+        }
+
+        $wrapper.html(`
+            <table class="table table-striped table-bordered">
+                <thead>
+                    <tr>
+                        <th>${__('Merit Rank')}</th>
+                        <th>${__('Category Rank')}</th>
+                        <th>${__('Applicant Name')}</th>
+                        <th>${__('Student Applicant')}</th>
+                        <th>${__('Program')}</th>
+                        <th>${__('Category')}</th>
+                        <th>${__('Merit Score')}</th>
+                        <th>${__('Percentage')}</th>
+                        <th>${__('Grade')}</th>
+                        <th>${__('Status')}</th>
+                    </tr>
+                </thead>
+                <tbody></tbody>
+            </table>
+            <button class="btn btn-default btn-sm load-more-merit-list">${__('Load More')}</button>
+        `);
+    }
+
+    let escape = frappe.utils.escape_html;
+    let rows = page.rows.map(function(row) {
+        return `
+            <tr>
+                <td>${row.merit_rank || '-'}</td>
+                <td>${row.category_rank || '-'}</td>
+                <td>${escape(row.applicant_name || '')}</td>
+                <td><a href="/app/student-applicant/${encodeURIComponent(row.student_applicant)}">${escape(row.student_applicant)}</a></td>
+                <td>${escape(row.program || '')}</td>
+                <td>${escape(row.student_category || 'General')}</td>
+                <td>${row.total_merit_score}</td>
+                <td>${flt(row.percentage_score, 2).toFixed(2)}%</td>
+                <td>${escape(row.merit_grade || '')}</td>
+                <td>
+                    <span class="indicator ${row.validation_status === 'Validated' ? 'green' : 'orange'}">
+                        ${escape(row.submission_status)}
+                    </span>
+                </td>
+            </tr>
+        `;
+    });
+    $wrapper.find('tbody').append(rows.join(''));
+
+    let $load_more = $wrapper.find('.load-more-merit-list');
+    $load_more.off('click').toggle(Boolean(page.next));
+    if (page.next) {
+        $load_more.on('click', function() {
+            load_merit_list_page(frm, page.next);
+        });
     }
-});
\ No newline at end of file
+}
+
+function clear_merit_list(frm) {
+    frm.fields_dict.merit_list_results.$wrapper.empty();
+    frm.set_value('generation_summary', '');
+}
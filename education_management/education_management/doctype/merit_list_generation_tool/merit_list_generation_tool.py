@@ -1,32 +1,85 @@
 import frappe
 from frappe.model.document import Document
-from frappe.utils import flt, today, cstr
+from frappe.utils import cint, flt, today, cstr
 import json
 
+from education_management.education_management.doctype.merit_list_snapshot.merit_list_snapshot import (
+    create_snapshot,
+)
+from education_management.merit_list import MeritListQuery
+from education_management.merit_list_export import (
+    EXPORT_INLINE_LIMIT,
+    enqueue_merit_list_export,
+    export_merit_list,
+    get_export_row_count,
+)
+from education_management.ranking import (
+    enqueue_rank_refresh,
+    get_partition_ranks,
+    get_partitions,
+    get_rank_refresh_status,
+)
+from education_management.utils import get_education_management_settings
+
+MERIT_LIST_PAGE_LENGTH = 100
+MAX_MERIT_LIST_PAGE_LENGTH = 500
+
 
 class MeritListGenerationTool(Document):
     @frappe.whitelist()
     def generate_merit_list(self):
-        """Generate merit list based on filter criteria"""
-        # Build filters
-        filters = self.get_filters()
+        """Generate merit list summary and return the first page of results.
+
+        Only the filters and summary are saved on the tool; rows are served in
+        pages by `get_merit_list_page`.
+        """
+        query = self.get_list_query()
+        counts = query.summary_counts()
+        rows_matched = query.count()
 
-        # Get merit submissions
-        submissions = self.get_merit_submissions(filters)
+        self.generation_summary = self.generate_summary(counts, rows_matched)
+        self.save()
 
-        # Generate HTML table
-        html_content = self.generate_html_table(submissions)
+        total_entries = sum(row.count for row in counts)
+        frappe.msgprint(f"Merit list generated successfully with {total_entries} entries")
 
-        # Update the results field
-        self.merit_list_results = html_content
+        rank_refresh = get_rank_refresh_status(*self.get_ranking_scope())
+        if rank_refresh["status"] in ("Queued", "Running"):
+            frappe.msgprint("Merit rankings are being refreshed; ranks will update when the refresh completes.")
 
-        # Update summary
-        self.generation_summary = self.generate_summary(submissions)
+        return {"total_entries": total_entries, "rows_matched": rows_matched, **self.get_merit_list_page()}
 
-        self.save()
+    @frappe.whitelist()
+    def get_merit_list_page(self, after=None, page_length=MERIT_LIST_PAGE_LENGTH):
+        """Return one page of the merit list using keyset pagination.
 
-        frappe.msgprint(f"Merit list generated successfully with {len(submissions)} entries")
-        return submissions
+        Rows are ordered by (total_merit_score desc, percentage_score desc, name).
+        `after` is the `next` cursor of the previous page.
+        """
+        after = frappe.parse_json(after) if after else None
+        position = cint(after.get("position")) if after else 0
+        page_length = min(cint(page_length) or MERIT_LIST_PAGE_LENGTH, MAX_MERIT_LIST_PAGE_LENGTH)
+
+        # Read one extra row to learn whether another page follows
+        rows = self.get_list_query().fetch(limit=page_length + 1, after=after)
+        has_more = len(rows) > page_length
+        rows = rows[:page_length]
+        self.set_partition_ranks(rows)
+
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = {
+                "total_merit_score": last.total_merit_score,
+                "percentage_score": last.percentage_score,
+                "name": last.name,
+                "position": position + len(rows)
+            }
+
+        return {"rows": rows, "next": next_cursor}
+
+    def get_list_query(self):
+        return MeritListQuery(self.get_filters(), maximum_results=self.maximum_results)
 
     def get_filters(self):
         """Build filters based on form inputs"""
@@ -50,91 +103,37 @@ class MeritListGenerationTool(Document):
 
         return filters
 
-    def get_merit_submissions(self, filters):
-        """Get merit submissions based on filters"""
-        fields = [
-            "name", "student_applicant", "applicant_name", "total_merit_score",
-            "percentage_score", "merit_rank", "category_rank", "merit_grade",
-            "program", "student_category", "submission_status", "validation_status"
-        ]
-
-        submissions = frappe.get_all(
-            "Merit Score Submission",
-            filters=filters,
-            fields=fields,
-            order_by="total_merit_score desc, percentage_score desc"
-        )
+    def validate(self):
+        if self.rank_partition and self.rank_partition not in get_partitions():
+            frappe.throw(f"{self.rank_partition} ranking is not enabled in Education Management Settings")
 
-        # Apply maximum results limit
-        if self.maximum_results and self.maximum_results > 0:
-            submissions = submissions[:self.maximum_results]
-
-        return submissions
-
-    def generate_html_table(self, submissions):
-        """Generate HTML table for merit list"""
-        if not submissions:
-            return "<p>No merit submissions found matching the criteria.</p>"
-
-        html = """
-        <table class="table table-striped table-bordered">
-            <thead>
-                <tr>
-                    <th>Merit Rank</th>
-                    <th>Category Rank</th>
-                    <th>Applicant Name</th>
-                    <th>Student Applicant</th>
-                    <th>Program</th>
-                    <th>Category</th>
-                    <th>Merit Score</th>
-                    <th>Percentage</th>
-                    <th>Grade</th>
-                    <th>Status</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
+    def get_rank_partition(self):
+        """Partition whose stored ranks are shown; Overall unless the selected one is ranked"""
+        if self.rank_partition in get_partitions():
+            return self.rank_partition
+        return "Overall"
 
-        for submission in submissions:
-            html += f"""
-                <tr>
-                    <td>{submission.merit_rank or '-'}</td>
-                    <td>{submission.category_rank or '-'}</td>
-                    <td>{submission.applicant_name or ''}</td>
-                    <td><a href="/app/student-applicant/{submission.student_applicant}">{submission.student_applicant}</a></td>
-                    <td>{submission.program or ''}</td>
-                    <td>{submission.student_category or 'General'}</td>
-                    <td>{submission.total_merit_score}</td>
-                    <td>{submission.percentage_score:.2f}%</td>
-                    <td>{submission.merit_grade or ''}</td>
-                    <td>
-                        <span class="indicator {'green' if submission.validation_status == 'Validated' else 'orange'}">
-                            {submission.submission_status}
-                        </span>
-                    </td>
-                </tr>
-            """
-
-        html += """
-            </tbody>
-        </table>
-        """
+    def set_partition_ranks(self, submissions):
+        """Read stored partition ranks instead of re-ranking the cohort"""
+        names = [submission.name for submission in submissions]
+        merit_ranks = get_partition_ranks(self.get_rank_partition(), names)
+        category_ranks = get_partition_ranks("Category", names)
 
-        return html
+        for submission in submissions:
+            submission.merit_rank = merit_ranks.get(submission.name)
+            submission.category_rank = category_ranks.get(submission.name)
 
-    def generate_summary(self, submissions):
+    def generate_summary(self, counts, rows_matched=None):
         """Generate summary of merit list generation"""
-        total_submissions = len(submissions)
-        validated_count = len([s for s in submissions if s.validation_status == "Validated"])
+        total_submissions = sum(row.count for row in counts)
+        validated_count = sum(row.count for row in counts if row.validation_status == "Validated")
         pending_count = total_submissions - validated_count
 
         # Category wise breakdown
         category_breakdown = {}
-        for submission in submissions:
-            category = submission.student_category or "General"
-            if category not in category_breakdown:
-                category_breakdown[category] = 0
-            category_breakdown[category] += 1
+        for row in counts:
+            category = row.student_category or "General"
+            category_breakdown[category] = category_breakdown.get(category, 0) + row.count
 
         summary = f"""Generation Date: {today()}
 Total Entries: {total_submissions}
@@ -153,42 +152,70 @@ Category-wise Breakdown:
         if self.maximum_results:
             summary += f"\nResults Limited to: {self.maximum_results}"
 
+        if rows_matched is not None:
+            summary += f"\nRows Matched: {rows_matched} (Rows Listed: {total_submissions})"
+
         return summary
 
     @frappe.whitelist()
-    def refresh_ranking(self):
-        """Refresh merit rankings for all submissions"""
-        from education_management.education_management.doctype.merit_score_submission.merit_score_submission import get_merit_ranking
+    def refresh_ranking(self, force=False):
+        """Queue a background refresh of merit rankings for the selected scope"""
+        status = enqueue_rank_refresh(*self.get_ranking_scope(), force=cint(force))
 
-        filters = self.get_filters()
+        # An up-to-date refresh is reported by the form, which offers to force one
+        if status["status"] != "Completed":
+            frappe.msgprint("Merit ranking refresh has been queued. The list will update when it completes.")
 
-        # Remove some filters that are not needed for ranking
-        ranking_filters = {
-            "academic_year": filters.get("academic_year")
-        }
+        return status
 
-        if filters.get("program"):
-            ranking_filters["program"] = filters["program"]
+    def get_ranking_scope(self):
+        """(academic_year, program) key that rankings are refreshed for"""
+        # Overall ranks need the whole academic year, so only narrow the refresh
+        # to one program when ranks are partitioned by program
+        settings = get_education_management_settings()
+        if self.program and settings.get("enable_program_wise_ranking"):
+            return self.academic_year, self.program
 
-        # Generate rankings
-        get_merit_ranking(
-            program=ranking_filters.get("program"),
-            academic_year=ranking_filters.get("academic_year")
-        )
+        return self.academic_year, None
 
-        frappe.msgprint("Merit rankings refreshed successfully")
+    @frappe.whitelist()
+    def publish_snapshot(self):
+        """Freeze the current list as a new Merit List Snapshot version"""
+        rows = self.get_list_query().fetch()
+        self.set_partition_ranks(rows)
+
+        snapshot = create_snapshot(
+            rows,
+            self.get_filters(),
+            maximum_results=self.maximum_results,
+            rank_partition=self.get_rank_partition(),
+            academic_year=self.academic_year,
+            program=self.program,
+            student_category=self.student_category,
+            include_pending=self.include_pending
+        )
 
-        # Regenerate the list with updated rankings
-        return self.generate_merit_list()
+        frappe.msgprint(f"Merit list published as {snapshot.name} (version {snapshot.version}, {snapshot.row_count} entries)")
+        return {"name": snapshot.name, "version": snapshot.version, "previous_snapshot": snapshot.previous_snapshot}
 
     @frappe.whitelist()
     def export_pdf(self):
-        """Export merit list as PDF"""
-        # This would be implemented based on your PDF generation requirements
-        frappe.msgprint("PDF export functionality to be implemented")
+        """Export merit list as PDF; always rendered by a background job"""
+        enqueue_merit_list_export(self.get_filters(), "pdf", self.maximum_results, self.get_rank_partition())
+        frappe.msgprint("The PDF export has been queued. You will be notified when the file is ready.")
+        return {"queued": True}
 
     @frappe.whitelist()
-    def export_excel(self):
-        """Export merit list as Excel"""
-        # This would be implemented based on your Excel generation requirements
-        frappe.msgprint("Excel export functionality to be implemented")
\ No newline at end of file
+    def export_excel(self, file_format="xlsx"):
+        """Export merit list as Excel or CSV; long lists are exported in the background"""
+        filters = self.get_filters()
+
+        if get_export_row_count(filters, self.maximum_results) > EXPORT_INLINE_LIMIT:
+            enqueue_merit_list_export(filters, file_format, self.maximum_results, self.get_rank_partition())
+            frappe.msgprint("The export has been queued. You will be notified when the file is ready.")
+            return {"queued": True}
+
+        file_doc = export_merit_list(
+            filters, file_format, self.maximum_results, self.get_rank_partition(), attached_to_name=self.name
+        )
+        return {"file_url": file_doc.file_url}
@@ -0,0 +1,178 @@
+import base64
+import hashlib
+import json
+import zlib
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint
+
+from education_management.merit_list import MERIT_LIST_FIELDS
+
+SNAPSHOT_COLUMNS = (*MERIT_LIST_FIELDS, "merit_rank", "category_rank")
+SNAPSHOT_CACHE_TTL = 24 * 60 * 60
+SNAPSHOT_PAGE_LENGTH = 100
+
+
+class MeritListSnapshot(Document):
+    def validate(self):
+        if not self.is_new():
+            frappe.throw("Merit List Snapshots cannot be changed; publish a new version instead")
+
+    def on_trash(self):
+        frappe.cache.delete_value(get_snapshot_cache_key(self.name))
+
+
+def on_doctype_update():
+    frappe.db.add_index("Merit List Snapshot", ["filter_signature", "version"], "filter_signature_version_index")
+
+
+def get_filter_signature(filters, maximum_results=None, rank_partition=None):
+    """Stable hash of everything that decides which rows a list holds and how they are ranked"""
+    signature = json.dumps(
+        {"filters": filters, "maximum_results": cint(maximum_results), "rank_partition": rank_partition},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(signature.encode()).hexdigest()
+
+
+def encode_rows(rows):
+    """Compress rows to column arrays; returns `(snapshot_data, content_hash)`"""
+    payload = json.dumps(
+        {"columns": SNAPSHOT_COLUMNS, "rows": [[row.get(column) for column in SNAPSHOT_COLUMNS] for row in rows]},
+        separators=(",", ":"),
+        default=str
+    ).encode()
+    return base64.b64encode(zlib.compress(payload, 9)).decode(), hashlib.sha256(payload).hexdigest()
+
+
+def decode_rows(snapshot_data):
+    return json.loads(zlib.decompress(base64.b64decode(snapshot_data)))
+
+
+def create_snapshot(rows, filters, maximum_results=None, rank_partition=None, **details):
+    """Freeze `rows` as the next version for their filter signature.
+
+    When the rows match the latest version exactly, that version is returned
+    instead of storing a duplicate.
+    """
+    signature = get_filter_signature(filters, maximum_results, rank_partition)
+    snapshot_data, content_hash = encode_rows(rows)
+
+    latest = frappe.get_all(
+        "Merit List Snapshot",
+        filters={"filter_signature": signature},
+        fields=["name", "version", "content_hash"],
+        order_by="version desc",
+        limit=1
+    )
+    if latest and latest[0].content_hash == content_hash:
+        return frappe.get_doc("Merit List Snapshot", latest[0].name)
+
+    snapshot = frappe.get_doc({
+        "doctype": "Merit List Snapshot",
+        **details,
+        "rank_partition": rank_partition,
+        "version": latest[0].version + 1 if latest else 1,
+        "row_count": len(rows),
+        "previous_snapshot": latest[0].name if latest else None,
+        "filter_signature": signature,
+        "content_hash": content_hash,
+        "snapshot_data": snapshot_data
+    })
+    snapshot.insert(ignore_permissions=True)
+    return snapshot
+
+
+def get_snapshot_cache_key(snapshot):
+    return f"merit_list_snapshot::{snapshot}"
+
+
+def load_snapshot(snapshot):
+    """Decoded `{"columns", "rows"}` of a snapshot; cached, as snapshots never change"""
+    key = get_snapshot_cache_key(snapshot)
+    data = frappe.cache.get_value(key)
+
+    if data is None:
+        snapshot_data = frappe.db.get_value("Merit List Snapshot", snapshot, "snapshot_data")
+        if snapshot_data is None:
+            frappe.throw(f"Merit List Snapshot {snapshot} not found", frappe.DoesNotExistError)
+
+        data = decode_rows(snapshot_data)
+        frappe.cache.set_value(key, data, expires_in_sec=SNAPSHOT_CACHE_TTL)
+
+    return data
+
+
+@frappe.whitelist()
+def get_snapshot_page(snapshot, start=0, page_length=SNAPSHOT_PAGE_LENGTH):
+    """One page of a snapshot's rows, in list order"""
+    frappe.has_permission("Merit List Snapshot", "read", doc=snapshot, throw=True)
+
+    data = load_snapshot(snapshot)
+    start = cint(start)
+    end = start + (cint(page_length) or SNAPSHOT_PAGE_LENGTH)
+    rows = [
+        {"position": position, **dict(zip(data["columns"], row, strict=True))}
+        for position, row in enumerate(data["rows"][start:end], start=start + 1)
+    ]
+
+    return {"rows": rows, "total": len(data["rows"]), "next": end if end < len(data["rows"]) else None}
+
+
+@frappe.whitelist()
+def diff_snapshots(from_snapshot, to_snapshot):
+    """Who moved between two snapshot versions and by how many positions.
+
+    Works on the frozen rows only; the live submissions are not read.
+    """
+    for snapshot in (from_snapshot, to_snapshot):
+        frappe.has_permission("Merit List Snapshot", "read", doc=snapshot, throw=True)
+
+    before = get_positions(load_snapshot(from_snapshot))
+    after = get_positions(load_snapshot(to_snapshot))
+
+    moved = []
+    unchanged = 0
+    for name, (position, row) in after.items():
+        if name not in before:
+            continue
+
+        previous_position = before[name][0]
+        if previous_position == position:
+            unchanged += 1
+            continue
+
+        moved.append({
+            "name": name,
+            "applicant_name": row.get("applicant_name"),
+            "from_position": previous_position,
+            "to_position": position,
+            "change": previous_position - position,
+            "from_rank": before[name][1].get("merit_rank"),
+            "to_rank": row.get("merit_rank")
+        })
+
+    moved.sort(key=lambda entry: (-abs(entry["change"]), entry["to_position"]))
+    return {
+        "moved": moved,
+        "added": sorted(
+            ({"name": name, "to_position": after[name][0]} for name in after.keys() - before.keys()),
+            key=lambda entry: entry["to_position"]
+        ),
+        "removed": sorted(
+            ({"name": name, "from_position": before[name][0]} for name in before.keys() - after.keys()),
+            key=lambda entry: entry["from_position"]
+        ),
+        "unchanged": unchanged
+    }
+
+
+def get_positions(data):
+    """Map submission name to `(position, row)` for a decoded snapshot"""
+    name_index = data["columns"].index("name")
+    return {
+        row[name_index]: (position, dict(zip(data["columns"], row, strict=True)))
+        for position, row in enumerate(data["rows"], start=1)
+    }
@@ -0,0 +1,75 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from education_management.education_management.doctype.merit_list_snapshot.merit_list_snapshot import (
+	decode_rows,
+	diff_snapshots,
+	encode_rows,
+	get_snapshot_page,
+)
+
+MODULE = "education_management.education_management.doctype.merit_list_snapshot.merit_list_snapshot"
+
+
+def snapshot_rows(names):
+	return [
+		frappe._dict(name=name, applicant_name=f"Applicant {name}", merit_rank=rank)
+		for rank, name in enumerate(names, start=1)
+	]
+
+
+# Version 2 moves MS-3 up two places, drops MS-2 and adds MS-5
+SNAPSHOTS = {
+	"MLS-1": snapshot_rows(["MS-1", "MS-2", "MS-3", "MS-4"]),
+	"MLS-2": snapshot_rows(["MS-3", "MS-1", "MS-4", "MS-5"]),
+}
+
+
+def load_snapshot(snapshot):
+	return decode_rows(encode_rows(SNAPSHOTS[snapshot])[0])
+
+
+class TestMeritListSnapshot(FrappeTestCase):
+	def setUp(self):
+		patches = [
+			patch(f"{MODULE}.load_snapshot", side_effect=load_snapshot),
+			patch("frappe.has_permission", return_value=True),
+		]
+		for patcher in patches:
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+	def test_diff_snapshots(self):
+		diff = diff_snapshots("MLS-1", "MLS-2")
+
+		self.assertEqual(
+			[(entry["name"], entry["from_position"], entry["to_position"], entry["change"]) for entry in diff["moved"]],
+			[("MS-3", 3, 1, 2), ("MS-1", 1, 2, -1), ("MS-4", 4, 3, 1)]
+		)
+		self.assertEqual((diff["moved"][0]["from_rank"], diff["moved"][0]["to_rank"]), (3, 1))
+		self.assertEqual(diff["added"], [{"name": "MS-5", "to_position": 4}])
+		self.assertEqual(diff["removed"], [{"name": "MS-2", "from_position": 2}])
+		self.assertEqual(diff["unchanged"], 0)
+
+		self.assertEqual(diff_snapshots("MLS-1", "MLS-1"), {"moved": [], "added": [], "removed": [], "unchanged": 4})
+
+	def test_snapshot_pages(self):
+		first = get_snapshot_page("MLS-1", page_length=3)
+		self.assertEqual([(row["position"], row["name"]) for row in first["rows"]], [(1, "MS-1"), (2, "MS-2"), (3, "MS-3")])
+		self.assertEqual((first["total"], first["next"]), (4, 3))
+
+		last = get_snapshot_page("MLS-1", start=first["next"], page_length=3)
+		self.assertEqual([(row["position"], row["name"]) for row in last["rows"]], [(4, "MS-4")])
+		self.assertIsNone(last["next"])
+
+		self.assertEqual(get_snapshot_page("MLS-1", start=10)["rows"], [])
+
+	def test_snapshot_pages_check_permission(self):
+		with patch("frappe.has_permission", side_effect=frappe.PermissionError):
+			self.assertRaises(frappe.PermissionError, get_snapshot_page, "MLS-1")
+			self.assertRaises(frappe.PermissionError, diff_snapshots, "MLS-1", "MLS-2")
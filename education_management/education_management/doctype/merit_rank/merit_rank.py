@@ -0,0 +1,11 @@
+import frappe
+from frappe.model.document import Document
+
+
+class MeritRank(Document):
+    pass
+
+
+def on_doctype_update():
+    frappe.db.add_index("Merit Rank", ["partition_type", "partition_key", "sort_key"], "partition_sort_key_index")
+    frappe.db.add_index("Merit Rank", ["partition_type", "partition_key", "tie_key"], "partition_tie_key_index")
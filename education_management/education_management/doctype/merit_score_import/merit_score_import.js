@@ -0,0 +1,26 @@
+frappe.ui.form.on('Merit Score Import', {
+    setup: function(frm) {
+        frappe.realtime.on('merit_score_import', function(data) {
+            if (data.name === frm.doc.name) {
+                frm.reload_doc();
+            }
+        });
+    },
+
+    refresh: function(frm) {
+        if (frm.is_new() || frm.doc.status === 'Success') {
+            return;
+        }
+
+        let label = frm.doc.rows_processed ? __('Resume Import') : __('Start Import');
+        frm.add_custom_button(label, function() {
+            frm.call({
+                method: 'start_import',
+                doc: frm.doc,
+                callback: function() {
+                    frm.reload_doc();
+                }
+            });
+        }).addClass('btn-primary');
+    }
+});
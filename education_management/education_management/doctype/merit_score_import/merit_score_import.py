@@ -0,0 +1,23 @@
+import frappe
+from frappe.model.document import Document
+
+from education_management.merit_import import enqueue_merit_import
+
+
+class MeritScoreImport(Document):
+    def validate(self):
+        # A missing file is reported by the mandatory check
+        if self.import_file and not self.import_file.lower().endswith((".csv", ".xlsx")):
+            frappe.throw("Import File must be a CSV or XLSX file")
+
+        if self.status not in ("Pending", "Failed") and self.has_value_changed("import_file"):
+            frappe.throw("Import File cannot be changed once the import has started")
+
+    @frappe.whitelist()
+    def start_import(self):
+        """Queue the import, or resume it from the last committed row"""
+        frappe.has_permission("Merit Score Submission", "create", throw=True)
+        if self.submit_after_import:
+            frappe.has_permission("Merit Score Submission", "submit", throw=True)
+
+        return enqueue_merit_import(self.name)
@@ -2,6 +2,70 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import flt, nowdate, now
 
+from education_management.education_management.doctype.merit_score_validation.merit_score_validation import (
+    queue_draft_validation_cleanup,
+)
+from education_management.grading import get_grade, get_grade_scale, get_grades, get_percentage, get_percentages
+from education_management.notifications import dispatch_merit_notifications, send_merit_notification
+from education_management.ranking import get_rank_refresh_scopes, refresh_ranks, run_rank_refresh, update_submission_ranks
+from education_management.utils import (
+    add_to_job_queue,
+    clear_applicant_merit_status,
+    clear_merit_dashboard_cache,
+    drain_job_queue,
+    enqueue_job_queue,
+    get_education_management_settings,
+)
+
+BULK_VALIDATION_CHUNK_SIZE = 500
+
+# Validated batches up to this size are moved within the stored ranks one
+# submission at a time; larger ones re-rank their academic years in one pass
+INCREMENTAL_RANK_LIMIT = 50
+
+# Cache set of submissions waiting for the auto-approval job
+AUTO_APPROVAL_QUEUE_KEY = "merit_auto_approval_queue"
+AUTO_APPROVAL_JOB_ID = "merit_auto_approval"
+AUTO_APPROVAL_METHOD = (
+    "education_management.education_management.doctype.merit_score_submission.merit_score_submission.run_auto_approval"
+)
+AUTO_APPROVAL_VALIDATOR = "Administrator"
+
+# Status fields locked after submission, with the flag that lets the workflow through
+GUARDED_STATUS_FIELDS = {
+    "document_verification_status": (
+        "updating_verification",
+        "Document Verification Status cannot be changed after submission. Only authorized users can update verification status."
+    ),
+    "validation_status": (
+        "updating_validation",
+        "Validation Status cannot be changed after submission. Only authorized users can update validation status."
+    ),
+    "submission_status": (
+        "updating_validation",
+        "Submission Status cannot be changed after submission. Only authorized users can update submission status through proper workflow."
+    ),
+    "validated_by": (
+        "updating_validation",
+        "Validated By cannot be changed after submission. Only authorized users can update validation fields."
+    ),
+    "validation_date": (
+        "updating_validation",
+        "Validation Date cannot be changed after submission. Only authorized users can update validation fields."
+    ),
+}
+
+EDITABLE_AFTER_VALIDATION = (
+    "admin_remarks", "teacher_comments", "validation_status", "validated_by",
+    "validation_date", "document_verification_status", "submission_status"
+)
+
+# Ranks mirrored from Merit Rank by the ranking module, never written by a save
+RANK_FIELDS = ("merit_rank", "category_rank")
+
+# Entered subject score values; percentage and grade are derived from these
+SUBJECT_SCORE_FIELDS = ("subject", "score", "maximum_score")
+
 
 class MeritScoreSubmission(Document):
     # begin: auto-generated types
@@ -38,101 +102,107 @@ class MeritScoreSubmission(Document):
         validation_status: DF.Literal["Pending", "Validated", "Rejected"]
     # end: auto-generated types
     def validate(self):
+        self.flags.changed_fields = None
+        self.keep_stored_ranks()
         self.check_validation_update_permission()
         self.calculate_percentage()
         self.validate_scores()
         self.calculate_grade()
+        self.calculate_subject_grades()
 
-    def check_validation_update_permission(self):
-        """Allow all status field updates for users with proper permissions"""
-        if not self.is_new():
-            # Get the original document to compare changes
-            original_doc = frappe.get_doc("Merit Score Submission", self.name)
-
-            # Allow status changes for users with write permissions and proper roles
-            user_roles = frappe.get_roles()
-            has_proper_role = any(role in ["Academics User", "System Manager", "Administrator"] for role in user_roles)
-            has_write_permission = frappe.has_permission("Merit Score Submission", "write")
-
-            # Only enforce restrictions if user doesn't have proper permissions
-            if not (has_write_permission and has_proper_role) and frappe.session.user != "Administrator":
-
-                # Prevent Document Verification Status changes after submission
-                if (self.docstatus == 1 and
-                    self.document_verification_status != original_doc.document_verification_status and
-                    not getattr(self.flags, 'updating_verification', False)):
-                    frappe.throw(
-                        "Document Verification Status cannot be changed after submission. Only authorized users can update verification status.",
-                        frappe.ValidationError
-                    )
+    def keep_stored_ranks(self):
+        """Keep the stored ranks, which rank updates change without bumping `modified`"""
+        if self.is_new():
+            return
 
-                # Prevent Validation Status changes after submission
-                if (self.docstatus == 1 and
-                    self.validation_status != original_doc.validation_status and
-                    not getattr(self.flags, 'updating_validation', False)):
-                    frappe.throw(
-                        "Validation Status cannot be changed after submission. Only authorized users can update validation status.",
-                        frappe.ValidationError
-                    )
-
-                # Prevent Submission Status changes after submission
-                if (self.docstatus == 1 and
-                    self.submission_status != original_doc.submission_status and
-                    not getattr(self.flags, 'updating_validation', False)):
-                    frappe.throw(
-                        "Submission Status cannot be changed after submission. Only authorized users can update submission status through proper workflow.",
-                        frappe.ValidationError
-                    )
-
-                # Prevent Validated By changes after submission
-                if (self.docstatus == 1 and
-                    self.validated_by != original_doc.validated_by and
-                    not getattr(self.flags, 'updating_validation', False)):
-                    frappe.throw(
-                        "Validated By cannot be changed after submission. Only authorized users can update validation fields.",
-                        frappe.ValidationError
-                    )
+        stored = (
+            self.get_doc_before_save()
+            or frappe.db.get_value(self.doctype, self.name, RANK_FIELDS, as_dict=True)
+            or {}
+        )
+        for fieldname in RANK_FIELDS:
+            self.set(fieldname, stored.get(fieldname))
 
-                # Prevent Validation Date changes after submission
-                if (self.docstatus == 1 and
-                    self.validation_date != original_doc.validation_date and
-                    not getattr(self.flags, 'updating_validation', False)):
+    def check_validation_update_permission(self):
+        """Allow all status field updates for users with proper permissions"""
+        if self.is_new() or self.can_update_validation_fields():
+            return
+
+        changed_fields = self.get_changed_fields()
+
+        # Status fields change after submission only through the validation workflow
+        if self.docstatus == 1:
+            for fieldname, (flag, message) in GUARDED_STATUS_FIELDS.items():
+                if fieldname in changed_fields and not self.flags.get(flag):
+                    frappe.throw(message, frappe.ValidationError)
+
+        # Prevent updates after validation unless allowed in settings
+        if (self.validation_status == "Validated" and
+            not get_education_management_settings().allow_score_modification_after_validation):
+            for fieldname in changed_fields:
+                if fieldname not in EDITABLE_AFTER_VALIDATION:
                     frappe.throw(
-                        "Validation Date cannot be changed after submission. Only authorized users can update validation fields.",
+                        f"Cannot modify '{self.meta.get_label(fieldname)}' after validation. "
+                        "Enable 'Allow Score Modification After Validation' in Education Management Settings to allow changes.",
                         frappe.ValidationError
                     )
 
-            # Prevent updates after validation unless allowed in settings (only for non-authorized users)
-            if (self.validation_status == "Validated" and
-                not (has_write_permission and has_proper_role) and
-                frappe.session.user != "Administrator"):
-
-                from education_management.utils import get_education_management_settings
-                settings = get_education_management_settings()
-
-                if not settings.get("allow_score_modification_after_validation"):
-                    # Allow only certain fields to be updated
-                    allowed_fields = ['admin_remarks', 'teacher_comments', 'validation_status', 'validated_by', 'validation_date', 'document_verification_status', 'submission_status']
-
-                    for field in self.meta.get_fieldnames():
-                        if field not in allowed_fields and self.get(field) != original_doc.get(field):
-                            frappe.throw(
-                                f"Cannot modify '{self.meta.get_field(field).label}' after validation. "
-                                "Enable 'Allow Score Modification After Validation' in Education Management Settings to allow changes.",
-                                frappe.ValidationError
-                            )
+    def can_update_validation_fields(self):
+        """Users with write permission and an academics role may change any field"""
+        if frappe.session.user == "Administrator":
+            return True
+
+        has_proper_role = any(role in ["Academics User", "System Manager", "Administrator"] for role in frappe.get_roles())
+        return has_proper_role and frappe.has_permission("Merit Score Submission", "write")
+
+    def get_changed_fields(self):
+        """Set of fieldnames changed since the stored version, computed once per save.
+
+        Compares against the copy Frappe loaded for `get_doc_before_save` and falls
+        back to a single-row read of the compared columns and subject rows.
+        """
+        if self.flags.changed_fields is not None:
+            return self.flags.changed_fields
+
+        fieldnames = [fieldname for fieldname in self.meta.get_fieldnames_with_value() if fieldname not in RANK_FIELDS]
+        before = self.get_doc_before_save()
+        if before:
+            subject_scores = before.subject_scores
+        else:
+            before = frappe.db.get_value(self.doctype, self.name, fieldnames, as_dict=True) or {}
+            subject_scores = frappe.get_all(
+                "Merit Subject Score",
+                filters={"parent": self.name, "parenttype": self.doctype, "parentfield": "subject_scores"},
+                fields=list(SUBJECT_SCORE_FIELDS),
+                order_by="idx"
+            )
+
+        changed_fields = {fieldname for fieldname in fieldnames if self.get(fieldname) != before.get(fieldname)}
+        if get_subject_score_values(self.subject_scores) != get_subject_score_values(subject_scores):
+            changed_fields.add("subject_scores")
+
+        self.flags.changed_fields = changed_fields
+        return changed_fields
 
     def on_submit(self):
         self.submission_status = "Submitted"
         self.save()
 
+    def on_update_after_submit(self):
+        # Keep stored ranks current as submissions are approved, rejected or rescored
+        update_submission_ranks(self)
+
     def on_cancel(self):
+        update_submission_ranks(self)
         self.submission_status = "Draft"
         self.save()
 
+    def on_trash(self):
+        frappe.db.delete("Merit Rank", {"merit_submission": self.name})
+
     def calculate_percentage(self):
         if self.total_merit_score and self.maximum_possible_score:
-            self.percentage_score = flt(self.total_merit_score / self.maximum_possible_score * 100, 2)
+            self.percentage_score = get_percentage(self.total_merit_score, self.maximum_possible_score)
 
     def validate_scores(self):
         if self.total_merit_score and self.maximum_possible_score:
@@ -150,23 +220,20 @@ class MeritScoreSubmission(Document):
 
     def calculate_grade(self):
         if self.percentage_score:
-            percentage = flt(self.percentage_score)
-            if percentage >= 95:
-                self.merit_grade = "A+"
-            elif percentage >= 90:
-                self.merit_grade = "A"
-            elif percentage >= 85:
-                self.merit_grade = "B+"
-            elif percentage >= 80:
-                self.merit_grade = "B"
-            elif percentage >= 75:
-                self.merit_grade = "C+"
-            elif percentage >= 70:
-                self.merit_grade = "C"
-            elif percentage >= 60:
-                self.merit_grade = "D"
-            else:
-                self.merit_grade = "F"
+            self.merit_grade = get_grade(self.percentage_score)
+
+    def calculate_subject_grades(self):
+        """Percentages and grades for all subject rows in one batch"""
+        if not self.subject_scores:
+            return
+
+        scale = get_grade_scale()
+        maximum_scores = [flt(row.maximum_score) for row in self.subject_scores]
+        percentages = get_percentages([flt(row.score) for row in self.subject_scores], maximum_scores)
+        grades = get_grades(percentages, scale, maximum_scores)
+        for row, percentage, grade in zip(self.subject_scores, percentages, grades, strict=True):
+            row.percentage = percentage
+            row.grade = grade
 
     def validate_documents(self):
         """Method to validate supporting documents"""
@@ -198,6 +265,7 @@ class MeritScoreSubmission(Document):
         self.flags.updating_verification = True
         self.document_verification_status = "Verified"
         self.save()
+        queue_auto_approval(self.name)
         return "Documents verified successfully"
 
     @frappe.whitelist()
@@ -214,6 +282,41 @@ class MeritScoreSubmission(Document):
         return "Documents rejected"
 
 
+def on_doctype_update():
+    # Ranking, merit lists and the dashboard filter on status, academic year and
+    # program and order by score; the trailing category makes the index covering
+    # for rank refreshes. Category lists get their own index.
+    frappe.db.add_index(
+        "Merit Score Submission",
+        [
+            "docstatus", "validation_status", "submission_status", "academic_year",
+            "program", "total_merit_score", "percentage_score", "student_category"
+        ],
+        "merit_list_index"
+    )
+    frappe.db.add_index(
+        "Merit Score Submission",
+        [
+            "academic_year", "program", "student_category", "validation_status",
+            "total_merit_score", "percentage_score"
+        ],
+        "merit_category_index"
+    )
+    # Declared here rather than with `search_index` so the name is the same on
+    # new and migrated sites
+    frappe.db.add_index("Merit Score Submission", ["student_applicant"], "student_applicant_index")
+    # Validation backlog: pending items by age, and the validation report's
+    # grouped query, which this index covers
+    frappe.db.add_index(
+        "Merit Score Submission",
+        [
+            "docstatus", "validation_status", "submission_date", "academic_year",
+            "program", "validation_date", "validated_by"
+        ],
+        "validation_queue_index"
+    )
+
+
 @frappe.whitelist()
 def get_merit_ranking(program=None, academic_year=None, student_category=None):
     """Generate merit ranking based on filters"""
@@ -230,35 +333,11 @@ def get_merit_ranking(program=None, academic_year=None, student_category=None):
     if student_category:
         filters["student_category"] = student_category
 
-    submissions = frappe.get_all(
-        "Merit Score Submission",
-        filters=filters,
-        fields=[
-            "name", "student_applicant", "applicant_name", "total_merit_score",
-            "percentage_score", "program", "student_category"
-        ],
-        order_by="total_merit_score desc, percentage_score desc"
-    )
-
-    # Calculate ranks
-    overall_rank = 1
-    category_ranks = {}
-
-    for submission in submissions:
-        # Overall merit rank
-        frappe.db.set_value("Merit Score Submission", submission.name, "merit_rank", overall_rank)
-        overall_rank += 1
-
-        # Category-wise rank
-        category = submission.student_category or "General"
-        if category not in category_ranks:
-            category_ranks[category] = 1
-
-        frappe.db.set_value("Merit Score Submission", submission.name, "category_rank", category_ranks[category])
-        category_ranks[category] += 1
+    # Rank every partition covered by the filters in one sorted pass
+    ranks = refresh_ranks(filters)
 
     frappe.db.commit()
-    return submissions
+    return {partition_type: len(partition_ranks) for partition_type, partition_ranks in ranks.items()}
 
 
 @frappe.whitelist()
@@ -276,6 +355,220 @@ def validate_merit_submission(submission_name, action, comments=None):
     return doc
 
 
+@frappe.whitelist()
+def bulk_validate_merit_submissions(action, submissions=None, filters=None, comments=None):
+    """Approve or reject many submissions at once.
+
+    Submissions are given as a list of names or selected by `filters`. Each
+    chunk is moved with one UPDATE and committed on its own, and every
+    submission gets a result entry. Rank refresh and notifications for the
+    whole batch run in one follow-up job.
+    """
+    if action not in ("approve", "reject"):
+        frappe.throw("Action must be 'approve' or 'reject'")
+
+    frappe.has_permission("Merit Score Submission", "write", throw=True)
+
+    if submissions:
+        names = list(dict.fromkeys(frappe.parse_json(submissions)))
+    elif filters:
+        names = frappe.get_list("Merit Score Submission", filters=frappe.parse_json(filters), pluck="name", limit_page_length=0)
+    else:
+        frappe.throw("Select submissions to validate")
+
+    values = get_validation_values(action, comments)
+    results = []
+    updated = []
+
+    for start in range(0, len(names), BULK_VALIDATION_CHUNK_SIZE):
+        chunk = names[start:start + BULK_VALIDATION_CHUNK_SIZE]
+        eligible, chunk_results = check_validation_chunk(chunk, values["validation_status"])
+        results.extend(chunk_results)
+
+        if not eligible:
+            continue
+
+        try:
+            set_validation_values(eligible, values)
+            frappe.db.commit()
+        except Exception:
+            frappe.db.rollback()
+            frappe.log_error("Bulk merit validation failed")
+            results.extend({"name": name, "status": "Failed", "message": "Could not update submission"} for name in eligible)
+            continue
+
+        updated.extend(eligible)
+        results.extend({"name": name, "status": "Updated"} for name in eligible)
+
+    if updated:
+        clear_merit_dashboard_cache()
+        clear_applicant_merit_status()
+        frappe.enqueue(
+            "education_management.education_management.doctype.merit_score_submission.merit_score_submission.after_bulk_validation",
+            queue="long",
+            timeout=3600,
+            enqueue_after_commit=True,
+            submissions=updated
+        )
+
+    return {"updated": len(updated), "results": results}
+
+
+def get_validation_values(action, comments=None, validator=None):
+    """Column values `approve_validation`/`reject_validation` set, plus modification stamps"""
+    values = {"modified": now(), "modified_by": frappe.session.user}
+
+    if action == "approve":
+        values.update({
+            "validation_status": "Validated",
+            "validated_by": validator or frappe.session.user,
+            "validation_date": now(),
+            "document_verification_status": "Verified",
+            "submission_status": "Approved"
+        })
+    else:
+        values.update({"validation_status": "Rejected", "submission_status": "Rejected"})
+        if comments:
+            values["admin_remarks"] = comments
+
+    return values
+
+
+def set_validation_values(names, values, conditions=None):
+    """Write `values` to submitted submissions among `names` with one UPDATE.
+
+    `conditions` are further `{field: value}` the rows must still match.
+    """
+    table = frappe.qb.DocType("Merit Score Submission")
+    query = frappe.qb.update(table).where(table.name.isin(names)).where(table.docstatus == 1)
+    for fieldname, value in (conditions or {}).items():
+        query = query.where(table[fieldname] == value)
+    for fieldname, value in values.items():
+        query = query.set(table[fieldname], value)
+    query.run()
+
+
+def check_validation_chunk(names, validation_status):
+    """Split a chunk into submissions that can move to `validation_status` and results for the rest.
+
+    Rows are read with the user's permissions applied, so submissions the user
+    cannot access fail like missing ones.
+    """
+    rows = {
+        row.name: row
+        for row in frappe.get_list(
+            "Merit Score Submission",
+            filters={"name": ["in", names]},
+            fields=["name", "docstatus", "validation_status"],
+            limit_page_length=0
+        )
+    }
+
+    eligible = []
+    results = []
+    for name in names:
+        row = rows.get(name)
+        if not row:
+            results.append({"name": name, "status": "Failed", "message": "Submission not found or not permitted"})
+        elif row.docstatus != 1:
+            results.append({"name": name, "status": "Failed", "message": "Only submitted documents can be validated"})
+        elif row.validation_status == validation_status:
+            results.append({"name": name, "status": "Skipped", "message": f"Already {validation_status}"})
+        else:
+            eligible.append(name)
+
+    return eligible, results
+
+
+def after_bulk_validation(submissions):
+    """Background job: update ranks of validated submissions and notify applicants"""
+    if get_education_management_settings().auto_generate_rankings:
+        update_validated_ranks(submissions)
+
+    # Already in a background job; one digest per recipient for the whole batch
+    dispatch_merit_notifications(submissions, "validation")
+
+
+def update_validated_ranks(submissions):
+    """Bring stored ranks up to date after `submissions` were validated or rejected.
+
+    Small batches, such as auto-approvals arriving as documents are verified,
+    get the incremental update `on_update_after_submit` runs for one
+    submission. Shifting ranks once per submission costs more than re-ranking
+    for a large batch, so those refresh each affected academic year once.
+    """
+    if len(submissions) <= INCREMENTAL_RANK_LIMIT:
+        for submission in frappe.get_all(
+            "Merit Score Submission",
+            filters={"name": ["in", submissions]},
+            fields=["name", "docstatus", "validation_status", "submission_status"],
+            order_by="name asc"
+        ):
+            update_submission_ranks(submission)
+        return
+
+    scopes = frappe.get_all(
+        "Merit Score Submission",
+        filters={"name": ["in", submissions], "academic_year": ["is", "set"]},
+        fields=["academic_year", "program"],
+        distinct=True,
+        as_list=True
+    )
+    for academic_year, program in get_rank_refresh_scopes(scopes):
+        run_rank_refresh(academic_year, program)
+
+
+def queue_auto_approval(submission_name):
+    """Queue a submission whose documents were just verified for the auto-approval job"""
+    if get_education_management_settings().auto_approve_if_documents_verified:
+        add_to_job_queue(AUTO_APPROVAL_QUEUE_KEY, [submission_name], AUTO_APPROVAL_METHOD, AUTO_APPROVAL_JOB_ID)
+
+
+def enqueue_auto_approval():
+    """Hourly: start the auto-approval job for submissions left in its queue"""
+    enqueue_job_queue(AUTO_APPROVAL_QUEUE_KEY, AUTO_APPROVAL_METHOD, AUTO_APPROVAL_JOB_ID)
+
+
+def run_auto_approval():
+    """Background job: approve queued submissions whose documents are verified.
+
+    A queued submission is approved only if it is still submitted, pending
+    validation and verified when its chunk is written; anything else is
+    dropped from the queue. Ranks and notifications follow once for
+    everything approved in the run.
+    """
+    if not get_education_management_settings().auto_approve_if_documents_verified:
+        frappe.cache.delete_value(AUTO_APPROVAL_QUEUE_KEY)
+        return
+
+    conditions = {"validation_status": "Pending", "document_verification_status": "Verified"}
+    approved = []
+
+    for chunk in drain_job_queue(AUTO_APPROVAL_QUEUE_KEY, BULK_VALIDATION_CHUNK_SIZE):
+        eligible = frappe.get_all(
+            "Merit Score Submission",
+            filters={"name": ["in", chunk], "docstatus": 1, **conditions},
+            pluck="name"
+        )
+        if not eligible:
+            continue
+
+        try:
+            set_validation_values(
+                eligible, get_validation_values("approve", validator=AUTO_APPROVAL_VALIDATOR), conditions
+            )
+            frappe.db.commit()
+            approved.extend(eligible)
+        except Exception:
+            frappe.db.rollback()
+            frappe.log_error("Merit auto-approval failed")
+
+    if approved:
+        clear_merit_dashboard_cache()
+        clear_applicant_merit_status()
+        after_bulk_validation(approved)
+
+
 @frappe.whitelist()
 def update_document_verification(submission_name, status):
     """Update document verification status"""
@@ -289,6 +582,9 @@ def update_document_verification(submission_name, status):
         "modified": frappe.utils.now(),
         "modified_by": frappe.session.user
     })
+    clear_merit_dashboard_cache()
+    if status == "Verified":
+        queue_auto_approval(submission_name)
     frappe.db.commit()
 
     # Get updated document
@@ -315,19 +611,16 @@ def verify_document_submission(submission_name, action, comments=None):
 
 def on_submit_merit_score(doc, method):
     """Handle merit score submission events"""
-    from education_management.utils import send_merit_notification
-
-    # Send notification
+    # Queued; the email is sent by a background job after the submit commits
     send_merit_notification(doc, "submission")
 
 
 def on_cancel_merit_score(doc, method):
     """Handle merit score cancellation"""
-    # Reset any linked validation records
-    validations = frappe.get_all("Merit Score Validation", {
-        "merit_submission": doc.name,
-        "docstatus": 0
-    })
+    # Draft validations are deleted by a background job that batches every cancel
+    queue_draft_validation_cleanup([doc.name])
+
 
-    for validation in validations:
-        frappe.delete_doc("Merit Score Validation", validation.name)
\ No newline at end of file
+def get_subject_score_values(rows):
+    """Comparable entered values of subject score rows, in order"""
+    return [(row.get("subject") or "", flt(row.get("score")), flt(row.get("maximum_score"))) for row in rows]
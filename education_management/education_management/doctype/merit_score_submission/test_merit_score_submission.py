@@ -1,9 +1,112 @@
 # Copyright (c) 2026, SP and Contributors
 # See license.txt
 
-# import frappe
+from unittest.mock import patch
+
+import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from education_management.education_management.doctype.merit_score_submission.merit_score_submission import (
+	INCREMENTAL_RANK_LIMIT,
+	bulk_validate_merit_submissions,
+	update_validated_ranks,
+)
+
+MODULE = "education_management.education_management.doctype.merit_score_submission.merit_score_submission"
+
 
 class TestMeritScoreSubmission(FrappeTestCase):
-	pass
+	def test_save_keeps_stored_ranks(self):
+		doc = frappe.get_doc({
+			"doctype": "Merit Score Submission",
+			"name": "_T-MRT-STALE",
+			"docstatus": 1,
+			"merit_rank": 9,
+			"category_rank": 9,
+			"total_merit_score": 450,
+		})
+		stored = frappe.get_doc({**doc.as_dict(), "merit_rank": 3, "category_rank": 1})
+
+		with patch.object(doc, "get_doc_before_save", return_value=stored):
+			doc.keep_stored_ranks()
+			self.assertEqual((doc.merit_rank, doc.category_rank), (3, 1))
+
+			# A stale form's ranks are not a change the validation guard sees
+			doc.merit_rank = 5
+			self.assertNotIn("merit_rank", doc.get_changed_fields())
+
+	def test_bulk_validation_reports_every_submission(self):
+		# MS-4 is left out of get_list, as rows the user cannot access are
+		readable = [
+			frappe._dict(name="MS-1", docstatus=1, validation_status="Pending"),
+			frappe._dict(name="MS-2", docstatus=1, validation_status="Validated"),
+			frappe._dict(name="MS-3", docstatus=0, validation_status="Pending"),
+		]
+
+		with (
+			patch("frappe.get_list", return_value=readable) as get_list,
+			patch(f"{MODULE}.set_validation_values") as set_values,
+			patch("frappe.enqueue") as enqueue,
+			patch.object(frappe.db, "commit"),
+		):
+			result = bulk_validate_merit_submissions("approve", submissions='["MS-1", "MS-2", "MS-3", "MS-4", "MS-1"]')
+
+		self.assertEqual(get_list.call_args.args, ("Merit Score Submission",))
+		self.assertEqual(result["updated"], 1)
+		self.assertEqual(
+			[(row["name"], row["status"]) for row in result["results"]],
+			[("MS-2", "Skipped"), ("MS-3", "Failed"), ("MS-4", "Failed"), ("MS-1", "Updated")]
+		)
+		self.assertEqual(result["results"][2]["message"], "Submission not found or not permitted")
+		self.assertEqual(set_values.call_args.args[0], ["MS-1"])
+		self.assertEqual(enqueue.call_args.kwargs["submissions"], ["MS-1"])
+
+	def test_bulk_validation_reports_failed_chunks(self):
+		readable = [frappe._dict(name="MS-1", docstatus=1, validation_status="Pending")]
+
+		with (
+			patch("frappe.get_list", return_value=readable),
+			patch(f"{MODULE}.set_validation_values", side_effect=frappe.ValidationError),
+			patch("frappe.enqueue") as enqueue,
+			patch("frappe.log_error"),
+			patch.object(frappe.db, "rollback"),
+		):
+			result = bulk_validate_merit_submissions("reject", submissions=["MS-1"], comments="Incomplete")
+
+		self.assertEqual(result["updated"], 0)
+		self.assertEqual(result["results"], [{"name": "MS-1", "status": "Failed", "message": "Could not update submission"}])
+		enqueue.assert_not_called()
+
+	def test_bulk_validation_needs_write_permission(self):
+		with patch("frappe.has_permission", side_effect=frappe.PermissionError) as has_permission:
+			self.assertRaises(frappe.PermissionError, bulk_validate_merit_submissions, "approve", submissions=["MS-1"])
+
+		self.assertEqual(has_permission.call_args.args, ("Merit Score Submission", "write"))
+
+	def test_small_validated_batches_update_ranks_incrementally(self):
+		names = [f"MS-{idx}" for idx in range(INCREMENTAL_RANK_LIMIT)]
+		rows = [frappe._dict(name=name, docstatus=1, validation_status="Validated") for name in names]
+
+		with (
+			patch("frappe.get_all", return_value=rows),
+			patch(f"{MODULE}.update_submission_ranks") as update_ranks,
+			patch(f"{MODULE}.run_rank_refresh") as refresh,
+		):
+			update_validated_ranks(names)
+
+		self.assertEqual([call.args[0].name for call in update_ranks.call_args_list], names)
+		refresh.assert_not_called()
+
+	def test_large_validated_batches_refresh_each_year_once(self):
+		names = [f"MS-{idx}" for idx in range(INCREMENTAL_RANK_LIMIT + 1)]
+		scopes = [("2026-27", "BSc"), ("2026-27", "BA"), ("2025-26", "BSc")]
+
+		with (
+			patch("frappe.get_all", return_value=scopes),
+			patch(f"{MODULE}.update_submission_ranks") as update_ranks,
+			patch(f"{MODULE}.run_rank_refresh") as refresh,
+		):
+			update_validated_ranks(names)
+
+		update_ranks.assert_not_called()
+		self.assertEqual(sorted(call.args for call in refresh.call_args_list), [("2025-26", None), ("2026-27", None)])
@@ -2,6 +2,18 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import flt, now
 
+from education_management.utils import add_to_job_queue, drain_job_queue, enqueue_job_queue
+
+VALIDATION_CLEANUP_CHUNK_SIZE = 1000
+
+# Cache set of cancelled submissions whose draft validations are waiting to be deleted
+VALIDATION_CLEANUP_QUEUE_KEY = "merit_validation_cleanup_queue"
+VALIDATION_CLEANUP_JOB_ID = "merit_validation_cleanup"
+VALIDATION_CLEANUP_METHOD = (
+    "education_management.education_management.doctype.merit_score_validation.merit_score_validation"
+    ".run_draft_validation_cleanup"
+)
+
 
 class MeritScoreValidation(Document):
     def validate(self):
@@ -70,6 +82,112 @@ class MeritScoreValidation(Document):
         return "Merit validation rejected"
 
 
+def on_doctype_update():
+    frappe.db.add_index("Merit Score Validation", ["merit_submission", "docstatus"], "merit_submission_docstatus_index")
+    # Assignees of draft validations, read without touching the table rows
+    frappe.db.add_index("Merit Score Validation", ["docstatus", "merit_submission", "validator"], "draft_validator_index")
+
+
+def delete_draft_validations(submissions):
+    """Delete draft validations of cancelled submissions with one DELETE per chunk.
+
+    Drafts are not linked from other documents, so the link checks and hooks of
+    `delete_doc` are skipped and their comments, assignments and versions are
+    deleted in bulk; only drafts with attachments go through `delete_doc`,
+    which also removes the files. Each affected submission gets one Info comment
+    naming the removed validations. Deleting only drafts makes this idempotent,
+    so it is safe to retry from a background job. Returns the number deleted.
+    """
+    deleted = 0
+
+    for start in range(0, len(submissions), VALIDATION_CLEANUP_CHUNK_SIZE):
+        chunk = submissions[start:start + VALIDATION_CLEANUP_CHUNK_SIZE]
+        validations = frappe.get_all(
+            "Merit Score Validation",
+            filters={"merit_submission": ["in", chunk], "docstatus": 0},
+            fields=["name", "merit_submission"]
+        )
+        if not validations:
+            continue
+
+        names = [validation.name for validation in validations]
+
+        # Attached files also live on disk, so those drafts go through delete_doc
+        for name in set(frappe.get_all(
+            "File",
+            filters={"attached_to_doctype": "Merit Score Validation", "attached_to_name": ["in", names]},
+            pluck="attached_to_name"
+        )):
+            frappe.delete_doc("Merit Score Validation", name, ignore_permissions=True, force=True)
+
+        frappe.db.delete("Merit Score Validation", {"name": ["in", names]})
+        frappe.db.delete("Comment", {"reference_doctype": "Merit Score Validation", "reference_name": ["in", names]})
+        frappe.db.delete("ToDo", {"reference_type": "Merit Score Validation", "reference_name": ["in", names]})
+        frappe.db.delete("Version", {"ref_doctype": "Merit Score Validation", "docname": ["in", names]})
+        add_cleanup_comments(validations)
+        deleted += len(names)
+
+    return deleted
+
+
+def queue_draft_validation_cleanup(submissions):
+    """Queue cancelled submissions for the draft validation cleanup job"""
+    add_to_job_queue(VALIDATION_CLEANUP_QUEUE_KEY, submissions, VALIDATION_CLEANUP_METHOD, VALIDATION_CLEANUP_JOB_ID)
+
+
+def enqueue_draft_validation_cleanup():
+    """Hourly: start the cleanup job for cancelled submissions left in its queue"""
+    enqueue_job_queue(VALIDATION_CLEANUP_QUEUE_KEY, VALIDATION_CLEANUP_METHOD, VALIDATION_CLEANUP_JOB_ID)
+
+
+def run_draft_validation_cleanup():
+    """Background job: delete draft validations of queued cancelled submissions, a chunk at a time.
+
+    Only submissions still cancelled when their chunk is read are cleaned up,
+    so a cancel that was rolled back keeps its drafts.
+    """
+    deleted = 0
+
+    for chunk in drain_job_queue(VALIDATION_CLEANUP_QUEUE_KEY, VALIDATION_CLEANUP_CHUNK_SIZE):
+        cancelled = frappe.get_all(
+            "Merit Score Submission",
+            filters={"name": ["in", chunk], "docstatus": 2},
+            pluck="name"
+        )
+
+        try:
+            deleted += delete_draft_validations(cancelled)
+            frappe.db.commit()
+        except Exception:
+            frappe.db.rollback()
+            frappe.log_error("Merit validation cleanup failed")
+
+    return deleted
+
+
+def add_cleanup_comments(validations):
+    """Record deleted validations on their submissions' timelines with one bulk insert"""
+    by_submission = {}
+    for validation in validations:
+        by_submission.setdefault(validation.merit_submission, []).append(validation.name)
+
+    timestamp = now()
+    user = frappe.session.user
+    frappe.db.bulk_insert(
+        "Comment",
+        ["name", "creation", "modified", "owner", "modified_by", "comment_type", "comment_email",
+         "reference_doctype", "reference_name", "content"],
+        [
+            (
+                frappe.generate_hash(length=32), timestamp, timestamp, user, user, "Info", user,
+                "Merit Score Submission", submission,
+                f"Draft Merit Score Validation deleted on cancel: {', '.join(names)}"
+            )
+            for submission, names in by_submission.items()
+        ]
+    )
+
+
 @frappe.whitelist()
 def create_validation_record(merit_submission):
     """Create a new merit score validation record"""
@@ -0,0 +1,67 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from education_management.education_management.doctype.merit_score_validation.merit_score_validation import (
+	VALIDATION_CLEANUP_QUEUE_KEY,
+	queue_draft_validation_cleanup,
+	run_draft_validation_cleanup,
+)
+
+MODULE = "education_management.education_management.doctype.merit_score_validation.merit_score_validation"
+
+# Draft validations by submission; MS-2's cancel was rolled back
+DRAFT_VALIDATIONS = {"MS-1": ["MSV-1", "MSV-2"], "MS-2": ["MSV-3"]}
+CANCELLED_SUBMISSIONS = ["MS-1"]
+ATTACHED_VALIDATIONS = ["MSV-2"]
+
+
+def get_all(doctype, filters=None, fields=None, pluck=None):
+	names = filters.get("name", filters.get("merit_submission", filters.get("attached_to_name")))[1]
+	if doctype == "Merit Score Submission":
+		return [name for name in names if name in CANCELLED_SUBMISSIONS]
+	if doctype == "File":
+		return [name for name in names if name in ATTACHED_VALIDATIONS]
+
+	return [
+		frappe._dict(name=validation, merit_submission=submission)
+		for submission in names
+		for validation in DRAFT_VALIDATIONS.get(submission, [])
+	]
+
+
+class TestMeritScoreValidation(FrappeTestCase):
+	def setUp(self):
+		frappe.cache.delete_value(VALIDATION_CLEANUP_QUEUE_KEY)
+
+	def test_cleanup_deletes_drafts_of_cancelled_submissions(self):
+		with patch("frappe.enqueue") as enqueue:
+			queue_draft_validation_cleanup(["MS-1", "MS-2"])
+			queue_draft_validation_cleanup(["MS-1"])
+
+		self.assertEqual(enqueue.call_args.kwargs["job_id"], "merit_validation_cleanup")
+		self.assertTrue(enqueue.call_args.kwargs["deduplicate"])
+
+		with (
+			patch("frappe.get_all", side_effect=get_all),
+			patch("frappe.delete_doc") as delete_doc,
+			patch.object(frappe.db, "delete") as delete,
+			patch.object(frappe.db, "commit"),
+			patch(f"{MODULE}.add_cleanup_comments") as add_comments,
+		):
+			self.assertEqual(run_draft_validation_cleanup(), 2)
+
+		deleted = {call.args[0]: call.args[1] for call in delete.call_args_list}
+		self.assertEqual(deleted["Merit Score Validation"], {"name": ["in", ["MSV-1", "MSV-2"]]})
+		for doctype in ("Comment", "ToDo", "Version"):
+			self.assertIn(["in", ["MSV-1", "MSV-2"]], deleted[doctype].values())
+
+		# Drafts with attachments are deleted with their files
+		delete_doc.assert_called_once_with("Merit Score Validation", "MSV-2", ignore_permissions=True, force=True)
+		self.assertEqual([row.name for row in add_comments.call_args.args[0]], ["MSV-1", "MSV-2"])
+		self.assertFalse(frappe.cache.smembers(VALIDATION_CLEANUP_QUEUE_KEY))
+
@@ -2,6 +2,8 @@ import frappe
 from frappe.model.document import Document
 from frappe.utils import flt
 
+from education_management.grading import get_grade, get_percentage
+
 
 class MeritSubjectScore(Document):
     def validate(self):
@@ -11,7 +13,7 @@ class MeritSubjectScore(Document):
 
     def calculate_percentage(self):
         if self.score and self.maximum_score:
-            self.percentage = flt(self.score / self.maximum_score * 100, 2)
+            self.percentage = get_percentage(self.score, self.maximum_score)
 
     def validate_score(self):
         if self.score and self.maximum_score:
@@ -23,20 +25,4 @@ class MeritSubjectScore(Document):
 
     def calculate_grade(self):
         if self.percentage:
-            percentage = flt(self.percentage)
-            if percentage >= 95:
-                self.grade = "A+"
-            elif percentage >= 90:
-                self.grade = "A"
-            elif percentage >= 85:
-                self.grade = "B+"
-            elif percentage >= 80:
-                self.grade = "B"
-            elif percentage >= 75:
-                self.grade = "C+"
-            elif percentage >= 70:
-                self.grade = "C"
-            elif percentage >= 60:
-                self.grade = "D"
-            else:
-                self.grade = "F"
\ No newline at end of file
+            self.grade = get_grade(self.percentage)
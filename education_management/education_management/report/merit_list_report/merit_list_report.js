@@ -0,0 +1,48 @@
+frappe.query_reports['Merit List Report'] = {
+    filters: [
+        {
+            fieldname: 'academic_year',
+            label: __('Academic Year'),
+            fieldtype: 'Link',
+            options: 'Academic Year',
+            reqd: 1,
+            default: frappe.defaults.get_user_default('academic_year')
+        },
+        {
+            fieldname: 'program',
+            label: __('Program'),
+            fieldtype: 'Link',
+            options: 'Program'
+        },
+        {
+            fieldname: 'student_category',
+            label: __('Student Category'),
+            fieldtype: 'Link',
+            options: 'Student Category'
+        },
+        {
+            fieldname: 'minimum_score',
+            label: __('Minimum Score'),
+            fieldtype: 'Float'
+        },
+        {
+            fieldname: 'include_pending',
+            label: __('Include Pending'),
+            fieldtype: 'Check',
+            default: 0
+        },
+        {
+            fieldname: 'page',
+            label: __('Page'),
+            fieldtype: 'Int',
+            default: 1
+        },
+        {
+            fieldname: 'page_length',
+            label: __('Rows per Page'),
+            fieldtype: 'Select',
+            options: '100\n500\n1000\n5000',
+            default: '500'
+        }
+    ]
+};
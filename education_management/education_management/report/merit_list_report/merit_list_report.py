@@ -0,0 +1,156 @@
+"""Merit List Report.
+
+Ranks are computed by window functions in the report query itself, so the
+report is always consistent with the current scores and needs no rank
+refresh beforehand. Ranks order by total score then percentage; the
+configured tie breaking chain only applies to the stored Merit Rank rows.
+
+Category and minimum score filters are applied outside the window, so they
+narrow the rows shown without changing anybody's rank. Only one page of rows
+is read; totals come from a separate aggregate query.
+"""
+
+import frappe
+from frappe.query_builder import Case
+from frappe.query_builder.functions import Avg, Count, IfNull, Max, Min, Sum
+from frappe.utils import cint, flt
+from pypika import Order
+from pypika.analytics import DenseRank, Rank
+
+from education_management.merit_list import MeritListQuery
+from education_management.ranking import DEFAULT_STUDENT_CATEGORY
+
+DEFAULT_PAGE_LENGTH = 500
+MAX_PAGE_LENGTH = 5000
+
+
+def execute(filters=None):
+    filters = frappe._dict(filters or {})
+    if not filters.academic_year:
+        frappe.throw("Academic Year is required")
+
+    page_length = min(cint(filters.page_length) or DEFAULT_PAGE_LENGTH, MAX_PAGE_LENGTH)
+    page = max(cint(filters.page), 1)
+
+    totals = get_totals(filters)
+    data = get_data(filters, page_length, (page - 1) * page_length)
+    pages = max((totals.entries + page_length - 1) // page_length, 1)
+
+    message = f"Page {page} of {pages} ({totals.entries} entries)"
+    return get_columns(), data, message, None, get_report_summary(totals)
+
+
+def get_columns():
+    return [
+        {"label": "Position", "fieldname": "position", "fieldtype": "Int", "width": 80},
+        {"label": "Category Rank", "fieldname": "category_rank", "fieldtype": "Int", "width": 110},
+        {"label": "Category Dense Rank", "fieldname": "category_dense_rank", "fieldtype": "Int", "width": 140},
+        {"label": "Program Rank", "fieldname": "program_rank", "fieldtype": "Int", "width": 110},
+        {"label": "Submission", "fieldname": "name", "fieldtype": "Link", "options": "Merit Score Submission", "width": 170},
+        {"label": "Student Applicant", "fieldname": "student_applicant", "fieldtype": "Link", "options": "Student Applicant", "width": 150},
+        {"label": "Applicant Name", "fieldname": "applicant_name", "fieldtype": "Data", "width": 180},
+        {"label": "Program", "fieldname": "program", "fieldtype": "Link", "options": "Program", "width": 150},
+        {"label": "Category", "fieldname": "student_category", "fieldtype": "Link", "options": "Student Category", "width": 120},
+        {"label": "Merit Score", "fieldname": "total_merit_score", "fieldtype": "Float", "precision": 2, "width": 110},
+        {"label": "Percentage", "fieldname": "percentage_score", "fieldtype": "Percent", "width": 100},
+        {"label": "Grade", "fieldname": "merit_grade", "fieldtype": "Data", "width": 70},
+        {"label": "Validation Status", "fieldname": "validation_status", "fieldtype": "Data", "width": 130},
+    ]
+
+
+def get_cohort_filters(filters):
+    """Filters deciding who is ranked at all"""
+    cohort = {"academic_year": filters.academic_year, "docstatus": 1}
+    if not cint(filters.include_pending):
+        cohort["validation_status"] = "Validated"
+        cohort["submission_status"] = "Approved"
+    if filters.program:
+        cohort["program"] = filters.program
+
+    return cohort
+
+
+def get_ranked_query(filters):
+    """Every ranked row of the cohort as a derived table"""
+    list_query = MeritListQuery(get_cohort_filters(filters))
+    table = list_query.table
+
+    def ranked(window, *partition):
+        return (
+            window.over(*partition)
+            .orderby(table.total_merit_score, order=Order.desc)
+            .orderby(table.percentage_score, order=Order.desc)
+        )
+
+    # Submissions without a category are ranked with the General category
+    category = IfNull(table.student_category, DEFAULT_STUDENT_CATEGORY)
+    query = frappe.qb.from_(table).select(
+        table.name, table.student_applicant, table.applicant_name, table.program, category.as_("student_category"),
+        table.total_merit_score, table.percentage_score, table.merit_grade, table.validation_status,
+        ranked(Rank(), table.program, category).as_("category_rank"),
+        ranked(DenseRank(), table.program, category).as_("category_dense_rank"),
+        ranked(Rank(), table.program).as_("program_rank")
+    )
+    for condition in list_query.get_conditions():
+        query = query.where(condition)
+
+    return query.as_("ranked")
+
+
+def apply_view_filters(query, table, filters):
+    """Filters narrowing the rows shown, applied after ranking"""
+    if filters.student_category:
+        query = query.where(IfNull(table.student_category, DEFAULT_STUDENT_CATEGORY) == filters.student_category)
+    if flt(filters.minimum_score):
+        query = query.where(table.total_merit_score >= flt(filters.minimum_score))
+
+    return query
+
+
+def get_data(filters, limit, offset):
+    ranked = get_ranked_query(filters)
+    query = (
+        apply_view_filters(frappe.qb.from_(ranked).select(ranked.star), ranked, filters)
+        .orderby(ranked.total_merit_score, ranked.percentage_score, order=Order.desc)
+        .orderby(ranked.name)
+        .limit(limit)
+        .offset(offset)
+    )
+
+    rows = query.run(as_dict=True)
+    for position, row in enumerate(rows, start=offset + 1):
+        row.position = position
+
+    return rows
+
+
+def get_totals(filters):
+    """Aggregates over every row the report would show, across all pages"""
+    list_query = MeritListQuery(get_cohort_filters(filters))
+    table = list_query.table
+
+    query = frappe.qb.from_(table).select(
+        Count("*").as_("entries"),
+        Sum(Case().when(table.validation_status == "Validated", 1).else_(0)).as_("validated"),
+        Count(table.program).distinct().as_("programs"),
+        Avg(table.total_merit_score).as_("average_score"),
+        Max(table.total_merit_score).as_("highest_score"),
+        Min(table.total_merit_score).as_("lowest_score")
+    )
+    for condition in list_query.get_conditions():
+        query = query.where(condition)
+
+    totals = apply_view_filters(query, table, filters).run(as_dict=True)[0]
+    totals.entries = cint(totals.entries)
+    return totals
+
+
+def get_report_summary(totals):
+    return [
+        {"label": "Entries", "value": totals.entries, "datatype": "Int", "indicator": "Blue"},
+        {"label": "Validated", "value": cint(totals.validated), "datatype": "Int", "indicator": "Green"},
+        {"label": "Programs", "value": cint(totals.programs), "datatype": "Int"},
+        {"label": "Average Score", "value": flt(totals.average_score, 2), "datatype": "Float"},
+        {"label": "Highest Score", "value": flt(totals.highest_score, 2), "datatype": "Float"},
+        {"label": "Lowest Score", "value": flt(totals.lowest_score, 2), "datatype": "Float"},
+    ]
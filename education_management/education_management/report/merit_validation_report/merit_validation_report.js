@@ -0,0 +1,31 @@
+frappe.query_reports['Merit Validation Report'] = {
+    filters: [
+        {
+            fieldname: 'academic_year',
+            label: __('Academic Year'),
+            fieldtype: 'Link',
+            options: 'Academic Year',
+            default: frappe.defaults.get_user_default('academic_year')
+        },
+        {
+            fieldname: 'program',
+            label: __('Program'),
+            fieldtype: 'Link',
+            options: 'Program'
+        },
+        {
+            fieldname: 'period_days',
+            label: __('Throughput Period (Days)'),
+            fieldtype: 'Int',
+            default: 30
+        }
+    ],
+
+    formatter: function(value, row, column, data, default_formatter) {
+        value = default_formatter(value, row, column, data);
+        if (column.fieldname === 'overdue' && data && data.overdue) {
+            value = `<span style="color: var(--red-500); font-weight: bold;">${value}</span>`;
+        }
+        return value;
+    }
+};
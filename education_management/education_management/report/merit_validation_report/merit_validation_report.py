@@ -0,0 +1,184 @@
+"""Merit Validation Report: validation backlog and validator throughput from one grouped query."""
+
+import hashlib
+import json
+
+import frappe
+from frappe.query_builder import Case
+from frappe.query_builder.functions import Coalesce, Count, CurDate, Max, Sum
+from frappe.utils import add_days, cint, flt, nowdate
+from pypika import CustomFunction
+
+from education_management.utils import get_education_management_settings
+
+VALIDATION_ROLLUP_CACHE_KEY = "merit_validation_rollup"
+VALIDATION_ROLLUP_TTL = 5 * 60
+DEFAULT_PERIOD_DAYS = 30
+UNASSIGNED = "Unassigned"
+
+DateDiff = CustomFunction("DATEDIFF", ["end_date", "start_date"])
+
+
+def execute(filters=None):
+    filters = frappe._dict(filters or {})
+    period_days = cint(filters.period_days) or DEFAULT_PERIOD_DAYS
+    reminder_days = get_education_management_settings().validation_reminder_days
+
+    rollup = get_validation_rollup(filters, period_days)
+    validators = {}
+    for row in rollup:
+        validators.setdefault(row["validator"], []).append(row)
+
+    data = [
+        {"validator": validator, **get_validator_metrics(rows, reminder_days, period_days)}
+        for validator, rows in sorted(validators.items())
+    ]
+    data.sort(key=lambda row: (-row["overdue"], -row["pending"], row["validator"]))
+
+    totals = get_validator_metrics(rollup, reminder_days, period_days)
+    message = (
+        f"Items pending for more than {reminder_days} days are overdue."
+        if reminder_days else "Set Validation Reminder Days in Education Management Settings to flag overdue items."
+    )
+    return get_columns(), data, message, None, get_report_summary(totals, reminder_days)
+
+
+def get_columns():
+    return [
+        {"label": "Validator", "fieldname": "validator", "fieldtype": "Data", "width": 200},
+        {"label": "Pending", "fieldname": "pending", "fieldtype": "Int", "width": 90},
+        {"label": "Overdue", "fieldname": "overdue", "fieldtype": "Int", "width": 90},
+        {"label": "Oldest Pending (Days)", "fieldname": "oldest_pending", "fieldtype": "Int", "width": 150},
+        {"label": "Pending Age P50", "fieldname": "pending_age_p50", "fieldtype": "Int", "width": 120},
+        {"label": "Pending Age P90", "fieldname": "pending_age_p90", "fieldtype": "Int", "width": 120},
+        {"label": "Validated", "fieldname": "validated", "fieldtype": "Int", "width": 90},
+        {"label": "Rejected", "fieldname": "rejected", "fieldtype": "Int", "width": 90},
+        {"label": "Decisions in Period", "fieldname": "recent_decisions", "fieldtype": "Int", "width": 140},
+        {"label": "Throughput / Day", "fieldname": "throughput", "fieldtype": "Float", "precision": 2, "width": 120},
+        {"label": "Time to Validation P50", "fieldname": "time_to_validation_p50", "fieldtype": "Int", "width": 160},
+        {"label": "Time to Validation P90", "fieldname": "time_to_validation_p90", "fieldtype": "Int", "width": 160},
+    ]
+
+
+def get_validation_rollup(filters, period_days):
+    """Grouped counts per validator, status and age in days; cached briefly"""
+    signature = json.dumps(
+        {"academic_year": filters.academic_year, "program": filters.program, "period_days": period_days, "date": nowdate()},
+        sort_keys=True
+    )
+    key = f"{VALIDATION_ROLLUP_CACHE_KEY}::{hashlib.sha256(signature.encode()).hexdigest()}"
+
+    rollup = frappe.cache.get_value(key)
+    if rollup is None:
+        rollup = build_validation_rollup(filters, period_days)
+        frappe.cache.set_value(key, rollup, expires_in_sec=VALIDATION_ROLLUP_TTL)
+
+    return rollup
+
+
+def build_validation_rollup(filters, period_days):
+    Submission = frappe.qb.DocType("Merit Score Submission")
+    Validation = frappe.qb.DocType("Merit Score Validation")
+
+    # Assignee of each pending item, from its draft validation
+    assignments = (
+        frappe.qb.from_(Validation)
+        .select(Validation.merit_submission, Max(Validation.validator).as_("validator"))
+        .where((Validation.docstatus == 0) & Validation.validator.notnull())
+        .groupby(Validation.merit_submission)
+    ).as_("assignment")
+
+    validator = Coalesce(Submission.validated_by, assignments.validator)
+    age = DateDiff(Coalesce(Submission.validation_date, CurDate()), Submission.submission_date)
+    recent = Case().when(Submission.validation_date >= add_days(nowdate(), -period_days), 1).else_(0)
+
+    query = (
+        frappe.qb.from_(Submission)
+        .left_join(assignments)
+        .on(assignments.merit_submission == Submission.name)
+        .select(
+            validator.as_("validator"),
+            Submission.validation_status,
+            age.as_("age"),
+            Count("*").as_("count"),
+            Sum(recent).as_("recent")
+        )
+        .where(Submission.docstatus == 1)
+        .groupby(validator, Submission.validation_status, age)
+    )
+    if filters.academic_year:
+        query = query.where(Submission.academic_year == filters.academic_year)
+    if filters.program:
+        query = query.where(Submission.program == filters.program)
+
+    return [
+        {
+            "validator": row.validator or UNASSIGNED,
+            "validation_status": row.validation_status,
+            "age": max(cint(row.age), 0),
+            "count": cint(row.count),
+            "recent": cint(row.recent)
+        }
+        for row in query.run(as_dict=True)
+    ]
+
+
+def get_validator_metrics(rows, reminder_days, period_days):
+    """Queue, throughput and time to validation of a set of rollup rows"""
+    pending = {}
+    decided = {}
+    metrics = {"pending": 0, "overdue": 0, "validated": 0, "rejected": 0, "recent_decisions": 0}
+
+    for row in rows:
+        if row["validation_status"] == "Pending":
+            pending[row["age"]] = pending.get(row["age"], 0) + row["count"]
+            metrics["pending"] += row["count"]
+            if reminder_days and row["age"] > reminder_days:
+                metrics["overdue"] += row["count"]
+            continue
+
+        decided[row["age"]] = decided.get(row["age"], 0) + row["count"]
+        metrics["validated" if row["validation_status"] == "Validated" else "rejected"] += row["count"]
+        metrics["recent_decisions"] += row["recent"]
+
+    metrics.update({
+        "oldest_pending": max(pending, default=0),
+        "pending_age_p50": get_percentile(pending, 50),
+        "pending_age_p90": get_percentile(pending, 90),
+        "pending_age_p95": get_percentile(pending, 95),
+        "throughput": flt(metrics["recent_decisions"] / period_days, 2),
+        "time_to_validation_p50": get_percentile(decided, 50),
+        "time_to_validation_p90": get_percentile(decided, 90)
+    })
+    return metrics
+
+
+def get_percentile(histogram, percentile):
+    """Nearest-rank percentile of a `{value: count}` histogram"""
+    total = sum(histogram.values())
+    if not total:
+        return None
+
+    threshold = total * percentile / 100
+    seen = 0
+    for value in sorted(histogram):
+        seen += histogram[value]
+        if seen >= threshold:
+            return value
+
+
+def get_report_summary(totals, reminder_days):
+    return [
+        {"label": "Queue Depth", "value": totals["pending"], "datatype": "Int", "indicator": "Orange"},
+        {
+            "label": f"Overdue (> {reminder_days} Days)" if reminder_days else "Overdue",
+            "value": totals["overdue"],
+            "datatype": "Int",
+            "indicator": "Red" if totals["overdue"] else "Green"
+        },
+        {"label": "Pending Age P50 (Days)", "value": totals["pending_age_p50"], "datatype": "Int"},
+        {"label": "Pending Age P90 (Days)", "value": totals["pending_age_p90"], "datatype": "Int"},
+        {"label": "Pending Age P95 (Days)", "value": totals["pending_age_p95"], "datatype": "Int"},
+        {"label": "Decisions / Day", "value": totals["throughput"], "datatype": "Float"},
+        {"label": "Median Time to Validation (Days)", "value": totals["time_to_validation_p50"], "datatype": "Int"},
+    ]
@@ -0,0 +1,47 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+from frappe.tests.utils import FrappeTestCase
+
+from education_management.education_management.report.merit_validation_report.merit_validation_report import (
+	get_percentile,
+	get_validator_metrics,
+)
+
+
+class TestMeritValidationReport(FrappeTestCase):
+	def test_percentile_of_empty_histogram(self):
+		self.assertIsNone(get_percentile({}, 50))
+		self.assertIsNone(get_percentile({3: 0}, 50))
+
+	def test_percentile_of_single_value(self):
+		for percentile in (0, 50, 95, 100):
+			self.assertEqual(get_percentile({4: 7}, percentile), 4)
+
+	def test_percentile_uses_nearest_rank(self):
+		# Ages 1, 2, 2, 5, 9, 9, 9, 9, 9, 30
+		histogram = {9: 5, 1: 1, 30: 1, 2: 2, 5: 1}
+
+		self.assertEqual(get_percentile(histogram, 0), 1)
+		self.assertEqual(get_percentile(histogram, 10), 1)
+		self.assertEqual(get_percentile(histogram, 11), 2)
+		self.assertEqual(get_percentile(histogram, 30), 2)
+		self.assertEqual(get_percentile(histogram, 50), 9)
+		self.assertEqual(get_percentile(histogram, 90), 9)
+		self.assertEqual(get_percentile(histogram, 95), 30)
+		self.assertEqual(get_percentile(histogram, 100), 30)
+
+	def test_validator_metrics_split_pending_and_decided(self):
+		rows = [
+			{"validator": "v@example.com", "validation_status": "Pending", "age": 2, "count": 3, "recent": 0},
+			{"validator": "v@example.com", "validation_status": "Pending", "age": 6, "count": 1, "recent": 0},
+			{"validator": "v@example.com", "validation_status": "Validated", "age": 1, "count": 4, "recent": 4},
+			{"validator": "v@example.com", "validation_status": "Rejected", "age": 3, "count": 2, "recent": 1},
+		]
+
+		metrics = get_validator_metrics(rows, reminder_days=3, period_days=5)
+
+		self.assertEqual((metrics["pending"], metrics["overdue"], metrics["oldest_pending"]), (4, 1, 6))
+		self.assertEqual((metrics["pending_age_p50"], metrics["pending_age_p95"]), (2, 6))
+		self.assertEqual((metrics["validated"], metrics["rejected"], metrics["throughput"]), (4, 2, 1))
+		self.assertEqual((metrics["time_to_validation_p50"], metrics["time_to_validation_p90"]), (1, 3))
@@ -0,0 +1,129 @@
+"""Percentage and grade computation shared by submissions and subject scores.
+
+Grades come from a scale of minimum percentages, configured in Education
+Management Settings as `Grade Boundaries`, one `<grade>: <minimum %>` per line.
+Single values are graded with a bisect over the scale. Batches use NumPy when
+it is installed, so a whole cohort is graded with one `searchsorted` call, and
+fall back to the scalar path otherwise.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+
+import frappe
+from frappe.utils import flt
+
+from education_management.utils import get_education_management_settings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GRADES = ("A+", "A", "B+", "B", "C+", "C", "D", "F")
+
+DEFAULT_GRADE_BOUNDARIES = "A+: 95\nA: 90\nB+: 85\nB: 80\nC+: 75\nC: 70\nD: 60\nF: 0"
+
+
+class GradeScale:
+    """Grades with their minimum percentages, in ascending order of minimum"""
+
+    __slots__ = ("grades", "minimums")
+
+    def __init__(self, boundaries):
+        boundaries = sorted(boundaries, key=lambda boundary: boundary[1])
+        self.grades = tuple(grade for grade, _ in boundaries)
+        self.minimums = tuple(minimum for _, minimum in boundaries)
+
+    def grade(self, percentage):
+        """Grade for one percentage; below the lowest minimum gets the lowest grade"""
+        return self.grades[max(bisect_right(self.minimums, flt(percentage)) - 1, 0)]
+
+    def grade_many(self, percentages):
+        """Grades for a sequence of percentages, in order"""
+        if np is None:
+            return [self.grade(percentage) for percentage in percentages]
+
+        values = np.asarray(percentages, dtype=float)
+        positions = np.maximum(np.searchsorted(self.minimums, values, side="right") - 1, 0)
+        return np.asarray(self.grades, dtype=object)[positions].tolist()
+
+
+@lru_cache(maxsize=8)
+def parse_grade_boundaries(value):
+    """Parse grade boundaries, one `<grade>: <minimum %>` per line"""
+    boundaries = []
+
+    for line in (value or "").splitlines():
+        grade, _, minimum = (part.strip() for part in line.partition(":"))
+        if not grade:
+            continue
+
+        if grade not in GRADES:
+            frappe.throw(f"Unknown grade '{grade}' in Grade Boundaries")
+        if grade in (boundary[0] for boundary in boundaries):
+            frappe.throw(f"Grade '{grade}' appears more than once in Grade Boundaries")
+
+        try:
+            minimum = float(minimum)
+        except ValueError:
+            frappe.throw(f"Minimum percentage for grade '{grade}' must be a number")
+
+        if not 0 <= minimum <= 100:
+            frappe.throw(f"Minimum percentage for grade '{grade}' must be between 0 and 100")
+        if minimum in (boundary[1] for boundary in boundaries):
+            frappe.throw(f"Two grades share the minimum percentage {minimum}")
+
+        boundaries.append((grade, minimum))
+
+    if not boundaries:
+        return parse_grade_boundaries(DEFAULT_GRADE_BOUNDARIES)
+    if min(minimum for _, minimum in boundaries) != 0:
+        frappe.throw("The lowest grade in Grade Boundaries must have a minimum percentage of 0")
+
+    return GradeScale(boundaries)
+
+
+def get_grade_scale():
+    """Grade scale from Education Management Settings"""
+    settings = get_education_management_settings()
+    if settings.get("grade_calculation_method") == "Custom":
+        return parse_grade_boundaries(settings.get("grade_boundaries"))
+
+    return parse_grade_boundaries(DEFAULT_GRADE_BOUNDARIES)
+
+
+def get_percentage(score, maximum_score):
+    if score and maximum_score:
+        return flt(flt(score) / flt(maximum_score) * 100, 2)
+    return 0
+
+
+def get_percentages(scores, maximum_scores):
+    """Percentages for paired sequences of scores and maximums, in order"""
+    if np is None:
+        return [get_percentage(score, maximum) for score, maximum in zip(scores, maximum_scores, strict=True)]
+
+    scores = np.asarray(scores, dtype=float)
+    maximum_scores = np.asarray(maximum_scores, dtype=float)
+    percentages = np.divide(scores * 100, maximum_scores, out=np.zeros_like(scores), where=maximum_scores != 0)
+    return np.round(percentages, 2).tolist()
+
+
+def get_grade(percentage, scale=None):
+    """Grade for a percentage, or None when there is no percentage to grade"""
+    if not flt(percentage):
+        return None
+    return (scale or get_grade_scale()).grade(percentage)
+
+
+def get_grades(percentages, scale=None, maximum_scores=None):
+    """Grades for a sequence of percentages; zero percentages are left ungraded.
+
+    With `maximum_scores`, a zero percentage out of a set maximum is a score of
+    zero and is graded like any other.
+    """
+    percentages = list(percentages)
+    graded = percentages if maximum_scores is None else maximum_scores
+    grades = (scale or get_grade_scale()).grade_many(percentages)
+    return [grade if flt(value) else None for grade, value in zip(grades, graded, strict=True)]
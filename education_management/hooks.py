@@ -142,7 +142,15 @@ doctype_js = {
 doc_events = {
 	"Merit Score Submission": {
 		"on_submit": "education_management.education_management.doctype.merit_score_submission.merit_score_submission.on_submit_merit_score",
-		"on_cancel": "education_management.education_management.doctype.merit_score_submission.merit_score_submission.on_cancel_merit_score"
+		"on_cancel": "education_management.education_management.doctype.merit_score_submission.merit_score_submission.on_cancel_merit_score",
+		"on_change": [
+			"education_management.utils.clear_merit_dashboard_cache",
+			"education_management.utils.clear_applicant_merit_status"
+		],
+		"on_trash": [
+			"education_management.utils.clear_merit_dashboard_cache",
+			"education_management.utils.clear_applicant_merit_status"
+		]
 	},
 	"Student Applicant": {
 		"on_update": "education_management.utils.check_merit_list_requirement"
@@ -152,23 +160,13 @@ doc_events = {
 # Scheduled Tasks
 # ---------------
 
-# scheduler_events = {
-# 	"all": [
-# 		"education_management.tasks.all"
-# 	],
-# 	"daily": [
-# 		"education_management.tasks.daily"
-# 	],
-# 	"hourly": [
-# 		"education_management.tasks.hourly"
-# 	],
-# 	"weekly": [
-# 		"education_management.tasks.weekly"
-# 	],
-# 	"monthly": [
-# 		"education_management.tasks.monthly"
-# 	],
-# }
+scheduler_events = {
+	"hourly": [
+		"education_management.notifications.send_validation_reminders",
+		"education_management.education_management.doctype.merit_score_submission.merit_score_submission.enqueue_auto_approval",
+		"education_management.education_management.doctype.merit_score_validation.merit_score_validation.enqueue_draft_validation_cleanup"
+	]
+}
 
 # Testing
 # -------
@@ -196,7 +194,7 @@ doc_events = {
 # Ignore links to specified DocTypes when deleting documents
 # -----------------------------------------------------------
 
-# ignore_links_on_delete = ["Communication", "ToDo"]
+ignore_links_on_delete = ["Merit Rank"]
 
 # Request Events
 # ----------------
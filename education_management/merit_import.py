@@ -0,0 +1,385 @@
+"""Bulk import of merit score submissions from CSV/XLSX files, one row per subject."""
+
+import csv
+import itertools
+import json
+
+import frappe
+from frappe.model.naming import parse_naming_series
+from frappe.utils import getdate, now, nowdate
+from frappe.utils.background_jobs import is_job_enqueued
+
+from education_management.grading import get_grade_scale, get_grades, get_percentages
+from education_management.utils import batched, clear_applicant_merit_status, clear_merit_dashboard_cache
+
+IMPORT_BATCH_SIZE = 500
+SUBMISSION_NAMING_SERIES = "EDU-MRT-.YYYY.-"
+SERIES_DIGITS = 5
+
+SUBMISSION_FIELDS = [
+    "name", "creation", "modified", "owner", "modified_by", "docstatus", "naming_series",
+    "student_applicant", "applicant_name", "academic_year", "program", "student_category",
+    "submission_date", "total_merit_score", "maximum_possible_score", "percentage_score",
+    "merit_grade", "teacher_comments", "submission_status", "validation_status",
+    "document_verification_status"
+]
+
+SUBJECT_SCORE_FIELDS = [
+    "name", "creation", "modified", "owner", "modified_by", "docstatus", "parent",
+    "parenttype", "parentfield", "idx", "subject", "score", "maximum_score", "percentage", "grade"
+]
+
+
+class MeritImportRowError(frappe.ValidationError):
+    pass
+
+
+def get_import_job_id(import_name):
+    return f"merit_score_import::{import_name}"
+
+
+def enqueue_merit_import(import_name):
+    """Queue one import job per Merit Score Import on the long queue"""
+    job_id = get_import_job_id(import_name)
+    status = frappe.db.get_value("Merit Score Import", import_name, "status")
+
+    if status == "Success":
+        frappe.throw("This import has already completed")
+
+    # A job that died mid-run leaves the import In Progress; it is resumed
+    if status in ("Queued", "In Progress") and is_job_enqueued(job_id):
+        return status
+
+    frappe.db.set_value("Merit Score Import", import_name, "status", "Queued")
+    frappe.enqueue(
+        "education_management.merit_import.run_merit_import",
+        queue="long",
+        timeout=6 * 3600,
+        job_id=job_id,
+        deduplicate=True,
+        enqueue_after_commit=True,
+        import_name=import_name
+    )
+    return "Queued"
+
+
+def run_merit_import(import_name):
+    """Background job: import the file from the last committed row onwards"""
+    data_import = frappe.get_doc("Merit Score Import", import_name)
+    file_path = frappe.get_doc("File", {"file_url": data_import.import_file}).get_full_path()
+    submitted = bool(data_import.submit_after_import)
+
+    rows_processed = data_import.rows_processed or 0
+    imported = data_import.submissions_imported or 0
+    failed = data_import.rows_failed or 0
+    errors = json.loads(data_import.import_log or "[]")
+
+    set_import_state(import_name, status="In Progress")
+    frappe.db.commit()
+
+    try:
+        total_rows = count_rows(file_path)
+        for batch in batched(group_submissions(read_pending_rows(file_path, rows_processed)), IMPORT_BATCH_SIZE):
+            submissions, batch_errors = prepare_submissions(batch)
+            insert_submissions(submissions, submitted)
+
+            rows_processed = batch[-1]["last_row"]
+            imported += len(submissions)
+            failed += len(batch_errors)
+            errors.extend(batch_errors)
+
+            # The checkpoint commits with the batch, so a resumed run never re-inserts it
+            set_import_state(
+                import_name,
+                rows_processed=rows_processed,
+                submissions_imported=imported,
+                rows_failed=failed,
+                import_log=json.dumps(errors, indent=1)
+            )
+            frappe.db.commit()
+
+            frappe.publish_progress(
+                rows_processed * 100 / (total_rows or 1),
+                title="Importing merit scores",
+                doctype="Merit Score Import",
+                docname=import_name,
+                description=f"{rows_processed} of {total_rows} rows"
+            )
+    except Exception:
+        frappe.db.rollback()
+        set_import_state(import_name, status="Failed")
+        frappe.db.commit()
+        publish_import_status(import_name)
+        raise
+
+    clear_merit_dashboard_cache()
+    clear_applicant_merit_status()
+    set_import_state(import_name, status="Partial Success" if failed else "Success")
+    frappe.db.commit()
+    publish_import_status(import_name)
+
+
+def set_import_state(import_name, **values):
+    frappe.db.set_value("Merit Score Import", import_name, values, update_modified=False)
+
+
+def publish_import_status(import_name):
+    frappe.publish_realtime(
+        "merit_score_import",
+        {"name": import_name},
+        doctype="Merit Score Import",
+        docname=import_name
+    )
+
+
+def read_rows(file_path):
+    """Lazily yield `(row_no, row)` data rows keyed by fieldname; row 1 is the header"""
+    if file_path.lower().endswith(".xlsx"):
+        rows = read_xlsx(file_path)
+    else:
+        rows = read_csv(file_path)
+
+    header = [frappe.scrub(str(column or "")) for column in next(rows, [])]
+    for row_no, values in enumerate(rows, start=2):
+        row = dict(zip(header, values, strict=False))
+        if any(value not in (None, "") for value in row.values()):
+            yield row_no, row
+
+
+def read_pending_rows(file_path, rows_processed=0):
+    """Data rows after the checkpoint `rows_processed`, where a resumed import carries on"""
+    return ((row_no, row) for row_no, row in read_rows(file_path) if row_no > rows_processed)
+
+
+def read_csv(file_path):
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        yield from csv.reader(f)
+
+
+def read_xlsx(file_path):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def count_rows(file_path):
+    """Data rows in the file, for progress reporting"""
+    if file_path.lower().endswith(".xlsx"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True)
+        total = (workbook.active.max_row or 1) - 1
+        workbook.close()
+        return total
+
+    return sum(1 for _ in read_csv(file_path)) - 1
+
+
+def group_submissions(rows):
+    """Group consecutive `(row_no, row)` pairs for one applicant into a submission read from its first row"""
+    for applicant, group in itertools.groupby(rows, key=lambda item: str(item[1].get("student_applicant") or "").strip()):
+        group = list(group)
+        yield {
+            "student_applicant": applicant,
+            "first_row": group[0][0],
+            "last_row": group[-1][0],
+            "parent": group[0][1],
+            "subjects": [row for _, row in group if row.get("subject") not in (None, "")]
+        }
+
+
+def prepare_submissions(batch):
+    """Validate and grade a batch of grouped rows.
+
+    Returns the submissions ready to insert and a list of per-row errors.
+    Percentages and grades for the whole batch are computed together once
+    rows are checked.
+    Applicant details and existing submissions are read with one query each.
+    """
+    applicant_names = list({entry["student_applicant"] for entry in batch if entry["student_applicant"]})
+    applicants = {
+        applicant.name: applicant
+        for applicant in frappe.get_all(
+            "Student Applicant",
+            filters={"name": ["in", applicant_names]},
+            fields=["name", "title", "academic_year", "program", "student_category"]
+        )
+    } if applicant_names else {}
+
+    existing = dict(
+        frappe.get_all(
+            "Merit Score Submission",
+            filters={"student_applicant": ["in", applicant_names], "docstatus": ["<", 2]},
+            fields=["student_applicant", "name"],
+            as_list=True
+        )
+    ) if applicant_names else {}
+
+    submissions = []
+    errors = []
+    seen = set()
+
+    for entry in batch:
+        applicant = entry["student_applicant"]
+        try:
+            if not applicant:
+                raise MeritImportRowError("Student Applicant is required")
+            if applicant not in applicants:
+                raise MeritImportRowError(f"Student Applicant {applicant} not found")
+            if applicant in existing:
+                raise MeritImportRowError(f"Student Applicant {applicant} already has Merit Score Submission {existing[applicant]}")
+            if applicant in seen:
+                raise MeritImportRowError(f"Student Applicant {applicant} appears more than once in this file")
+
+            submission = build_submission(entry, applicants[applicant])
+        except frappe.ValidationError as e:
+            errors.append({"row": entry["first_row"], "student_applicant": applicant, "error": str(e)})
+            continue
+
+        seen.add(applicant)
+        submissions.append(submission)
+
+    apply_grades(submissions)
+    return submissions, errors
+
+
+def apply_grades(submissions):
+    """Set percentages and grades of every submission and subject row of a batch with batch calls"""
+    scale = get_grade_scale()
+    subjects = [subject for submission in submissions for subject in submission["subjects"]]
+
+    percentages = get_percentages(
+        [s["total_merit_score"] for s in submissions], [s["maximum_possible_score"] for s in submissions]
+    )
+    for submission, percentage, grade in zip(submissions, percentages, get_grades(percentages, scale), strict=True):
+        submission["percentage_score"] = percentage
+        submission["merit_grade"] = grade
+
+    maximum_scores = [s["maximum_score"] for s in subjects]
+    percentages = get_percentages([s["score"] for s in subjects], maximum_scores)
+    grades = get_grades(percentages, scale, maximum_scores)
+    for subject, percentage, grade in zip(subjects, percentages, grades, strict=True):
+        subject["percentage"] = percentage
+        subject["grade"] = grade
+
+
+def build_submission(entry, applicant):
+    """Submission and subject score values for one applicant, with the checks `validate` runs.
+
+    Percentages and grades are left to `apply_grades`, which sets them for a whole batch.
+    """
+    parent = entry["parent"]
+    subjects = []
+
+    for row in entry["subjects"]:
+        subject = str(row.get("subject")).strip()
+        score = parse_number(row.get("score"), f"Score for {subject}")
+        maximum_score = parse_number(row.get("maximum_score"), f"Maximum Score for {subject}")
+
+        if score and maximum_score and score > maximum_score:
+            raise MeritImportRowError(f"Score for {subject} cannot be greater than maximum score")
+        if score < 0:
+            raise MeritImportRowError(f"Score for {subject} cannot be negative")
+
+        subjects.append({"subject": subject, "score": score, "maximum_score": maximum_score})
+
+    subject_total = sum(subject["score"] for subject in subjects)
+    total = parse_number(parent.get("total_merit_score"), "Total Merit Score", default=None)
+    if total is None:
+        if not subjects:
+            raise MeritImportRowError("Total Merit Score is required")
+        total = subject_total
+
+    maximum = parse_number(parent.get("maximum_possible_score"), "Maximum Possible Score", default=None)
+    if maximum is None:
+        maximum = sum(subject["maximum_score"] for subject in subjects)
+    if not maximum:
+        raise MeritImportRowError("Maximum Possible Score is required")
+
+    if total > maximum:
+        raise MeritImportRowError("Total Merit Score cannot be greater than Maximum Possible Score")
+    if total < 0:
+        raise MeritImportRowError("Total Merit Score cannot be negative")
+    if subjects and abs(subject_total - total) > 0.01:
+        raise MeritImportRowError(f"Sum of subject scores ({subject_total}) does not match total merit score ({total})")
+
+    try:
+        submission_date = getdate(parent.get("submission_date") or nowdate())
+    except Exception:
+        raise MeritImportRowError(f"Submission Date '{parent.get('submission_date')}' is not a valid date")
+
+    return {
+        "student_applicant": applicant.name,
+        "applicant_name": applicant.title,
+        "academic_year": applicant.academic_year,
+        "program": applicant.program,
+        "student_category": applicant.student_category,
+        "submission_date": submission_date,
+        "total_merit_score": total,
+        "maximum_possible_score": maximum,
+        "teacher_comments": parent.get("teacher_comments"),
+        "subjects": subjects
+    }
+
+
+def parse_number(value, label, default=0.0):
+    if value in (None, ""):
+        return default
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise MeritImportRowError(f"{label} '{value}' is not a number")
+
+
+def insert_submissions(submissions, submitted=False):
+    """Bulk insert submissions and their subject scores in the caller's transaction"""
+    if not submissions:
+        return
+
+    timestamp = now()
+    user = frappe.session.user
+    docstatus = 1 if submitted else 0
+    submission_status = "Submitted" if submitted else "Draft"
+
+    parent_values = []
+    child_values = []
+    for name, submission in zip(reserve_submission_names(len(submissions)), submissions, strict=True):
+        parent_values.append((
+            name, timestamp, timestamp, user, user, docstatus, SUBMISSION_NAMING_SERIES,
+            submission["student_applicant"], submission["applicant_name"], submission["academic_year"],
+            submission["program"], submission["student_category"], submission["submission_date"],
+            submission["total_merit_score"], submission["maximum_possible_score"],
+            submission["percentage_score"], submission["merit_grade"], submission["teacher_comments"],
+            submission_status, "Pending", "Pending"
+        ))
+
+        for idx, subject in enumerate(submission["subjects"], start=1):
+            child_values.append((
+                f"{name}-{idx}", timestamp, timestamp, user, user, docstatus, name,
+                "Merit Score Submission", "subject_scores", idx, subject["subject"], subject["score"],
+                subject["maximum_score"], subject["percentage"], subject["grade"]
+            ))
+
+    frappe.db.bulk_insert("Merit Score Submission", SUBMISSION_FIELDS, parent_values)
+    if child_values:
+        frappe.db.bulk_insert("Merit Subject Score", SUBJECT_SCORE_FIELDS, child_values)
+
+
+def reserve_submission_names(count):
+    """Take `count` consecutive names from the submission naming series with one UPDATE"""
+    prefix = parse_naming_series(SUBMISSION_NAMING_SERIES)
+
+    current = frappe.db.sql("SELECT `current` FROM `tabSeries` WHERE `name` = %s FOR UPDATE", prefix)
+    if current:
+        current = current[0][0] or 0
+        frappe.db.sql("UPDATE `tabSeries` SET `current` = `current` + %s WHERE `name` = %s", (count, prefix))
+    else:
+        current = 0
+        frappe.db.sql("INSERT INTO `tabSeries` (`name`, `current`) VALUES (%s, %s)", (prefix, count))
+
+    return [f"{prefix}{str(current + idx).zfill(SERIES_DIGITS)}" for idx in range(1, count + 1)]
@@ -0,0 +1,108 @@
+import frappe
+from frappe.query_builder.functions import Count
+from frappe.utils import cint, flt
+
+MERIT_LIST_FIELDS = [
+    "name", "student_applicant", "applicant_name", "total_merit_score",
+    "percentage_score", "merit_grade", "program", "student_category",
+    "submission_status", "validation_status"
+]
+
+OPERATORS = {
+    "=": lambda field, value: field == value,
+    "!=": lambda field, value: field != value,
+    ">": lambda field, value: field > value,
+    ">=": lambda field, value: field >= value,
+    "<": lambda field, value: field < value,
+    "<=": lambda field, value: field <= value,
+    "in": lambda field, value: field.isin(value),
+    "is": lambda field, value: (field.isnull() | (field == "")) if value == "not set" else (field.notnull() & (field != "")),
+}
+
+
+class MeritListQuery:
+    """Query stage for a filtered merit list.
+
+    Filters, minimum score, merit ordering and the limit/offset window are all
+    applied in SQL, so a top-N list reads N rows rather than the whole cohort.
+    `maximum_results` caps the list as a whole across pages.
+    """
+
+    def __init__(self, filters, maximum_results=None):
+        self.filters = dict(filters)
+        self.maximum_results = cint(maximum_results)
+        self.table = frappe.qb.DocType("Merit Score Submission")
+
+    def build(self, fields, limit=None, offset=0, after=None):
+        """Build the list query for `fields`, optionally windowed.
+
+        `after` is a keyset cursor (`total_merit_score`, `percentage_score`,
+        `name`) of the last row already served, plus its `position` in the list.
+        """
+        table = self.table
+        query = frappe.qb.from_(table).select(*(table[field] for field in fields))
+
+        for condition in self.get_conditions():
+            query = query.where(condition)
+
+        if after:
+            score, percentage = flt(after.get("total_merit_score")), flt(after.get("percentage_score"))
+            query = query.where(
+                (table.total_merit_score < score)
+                | ((table.total_merit_score == score) & (table.percentage_score < percentage))
+                | (
+                    (table.total_merit_score == score)
+                    & (table.percentage_score == percentage)
+                    & (table.name > after.get("name"))
+                )
+            )
+
+        query = query.orderby(
+            table.total_merit_score, table.percentage_score, order=frappe.qb.desc
+        ).orderby(table.name)
+
+        limit = self.get_window(limit, cint(offset) + (cint(after.get("position")) if after else 0))
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
+
+        return query
+
+    def get_conditions(self):
+        conditions = []
+        for fieldname, value in self.filters.items():
+            operator, value = value if isinstance(value, list | tuple) else ("=", value)
+            conditions.append(OPERATORS[operator](self.table[fieldname], value))
+
+        return conditions
+
+    def get_window(self, limit=None, position=0):
+        """Rows to read after the first `position` rows, respecting `maximum_results`"""
+        if not self.maximum_results:
+            return limit
+
+        remaining = max(self.maximum_results - position, 0)
+        return remaining if limit is None else min(limit, remaining)
+
+    def fetch(self, fields=None, limit=None, offset=0, after=None):
+        """Run the list query"""
+        return self.build(fields or MERIT_LIST_FIELDS, limit, offset, after).run(as_dict=True)
+
+    def count(self):
+        """Rows matching the filters, before any window or maximum is applied"""
+        query = frappe.qb.from_(self.table).select(Count("*"))
+        for condition in self.get_conditions():
+            query = query.where(condition)
+
+        return query.run()[0][0]
+
+    def summary_counts(self):
+        """Entry counts per category and validation status from one aggregate query"""
+        entries = self.build(["student_category", "validation_status"]).as_("entries")
+        return (
+            frappe.qb.from_(entries)
+            .select(entries.student_category, entries.validation_status, Count("*").as_("count"))
+            .groupby(entries.student_category, entries.validation_status)
+            .run(as_dict=True)
+        )
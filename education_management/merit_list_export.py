@@ -0,0 +1,254 @@
+"""Merit list exports.
+
+CSV and XLSX rows are streamed from an unbuffered (server-side) cursor straight
+into the output file, with stored ranks joined into the same query, so an
+export holds one row in Python at a time whatever the length of the list. PDF
+rows are read in keyset pages instead, since rendering pauses between chunks
+for longer than the server would keep a streaming cursor open. Output goes to
+the site's private files and is registered as a private File attached to the
+Merit List Generation Tool. Lists longer than `EXPORT_INLINE_LIMIT` are
+exported by a background job that notifies the user when the file is ready;
+PDFs (see `merit_list_pdf`) are always exported in the background.
+"""
+
+import csv
+import hashlib
+import os
+
+import frappe
+from frappe.utils import cint, flt, now_datetime
+
+from education_management.merit_list import MeritListQuery
+from education_management.merit_list_pdf import write_merit_list_pdf
+
+EXPORT_INLINE_LIMIT = 5000
+EXPORT_PROGRESS_INTERVAL = 5000
+EXPORT_PAGE_LENGTH = 2000
+
+EXPORT_FORMATS = ("xlsx", "csv", "pdf")
+
+# (label, field) in export order
+EXPORT_COLUMNS = [
+    ("Merit Rank", "merit_rank"),
+    ("Category Rank", "category_rank"),
+    ("Submission", "name"),
+    ("Student Applicant", "student_applicant"),
+    ("Applicant Name", "applicant_name"),
+    ("Program", "program"),
+    ("Category", "student_category"),
+    ("Merit Score", "total_merit_score"),
+    ("Percentage", "percentage_score"),
+    ("Grade", "merit_grade"),
+    ("Submission Status", "submission_status"),
+    ("Validation Status", "validation_status"),
+]
+
+
+class CSVExportWriter:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+
+    def write_row(self, values):
+        self.writer.writerow(values)
+
+    def close(self):
+        self.file.close()
+
+
+class XLSXExportWriter:
+    """openpyxl write-only workbook; rows are flushed to disk as they are appended"""
+
+    def __init__(self, path):
+        from openpyxl import Workbook
+
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Merit List")
+
+    def write_row(self, values):
+        self.sheet.append(values)
+
+    def close(self):
+        self.workbook.save(self.path)
+
+
+EXPORT_WRITERS = {"xlsx": XLSXExportWriter, "csv": CSVExportWriter}
+
+
+def build_export_query(filters, maximum_results=None, rank_partition="Overall", fields=None, limit=None, after=None):
+    """Merit list query with stored partition ranks joined in, in merit order"""
+    list_query = MeritListQuery(filters, maximum_results=maximum_results)
+    table = list_query.table
+    merit_rank = frappe.qb.DocType("Merit Rank").as_("merit_rank_row")
+    category_rank = frappe.qb.DocType("Merit Rank").as_("category_rank_row")
+
+    fields = fields or [field for _, field in EXPORT_COLUMNS if field not in ("merit_rank", "category_rank")]
+    return (
+        list_query.build(fields, limit, after=after)
+        .left_join(merit_rank)
+        .on((merit_rank.merit_submission == table.name) & (merit_rank.partition_type == (rank_partition or "Overall")))
+        .left_join(category_rank)
+        .on((category_rank.merit_submission == table.name) & (category_rank.partition_type == "Category"))
+        .select(merit_rank.partition_rank.as_("merit_rank"), category_rank.partition_rank.as_("category_rank"))
+    )
+
+
+def iter_export_rows(filters, maximum_results=None, rank_partition="Overall"):
+    """Yield merit list rows one at a time from a server-side cursor.
+
+    No other query may run on the connection until the iterator is exhausted.
+    """
+    query = build_export_query(filters, maximum_results, rank_partition)
+    with frappe.db.unbuffered_cursor():
+        yield from query.run(as_dict=True, as_iterator=True)
+
+
+def iter_export_pages(filters, maximum_results=None, rank_partition="Overall", page_length=EXPORT_PAGE_LENGTH):
+    """Yield merit list rows read a page at a time with keyset queries.
+
+    The connection is idle between pages, so a slow consumer cannot time out
+    the read the way it can a server-side cursor.
+    """
+    after = None
+    while True:
+        rows = build_export_query(
+            filters, maximum_results, rank_partition, limit=page_length, after=after
+        ).run(as_dict=True)
+        yield from rows
+        if len(rows) < page_length:
+            return
+
+        last = rows[-1]
+        after = {
+            "total_merit_score": last.total_merit_score,
+            "percentage_score": last.percentage_score,
+            "name": last.name,
+            "position": (after["position"] if after else 0) + len(rows)
+        }
+
+
+def export_merit_list(
+    filters, file_format="xlsx", maximum_results=None, rank_partition="Overall", attached_to_name=None, progress=None
+):
+    """Write the merit list to a private file and return its File document"""
+    if file_format not in EXPORT_FORMATS:
+        frappe.throw(f"Export format must be one of {', '.join(EXPORT_FORMATS)}")
+
+    file_name = f"merit-list-{filters.get('academic_year')}-{now_datetime().strftime('%Y%m%d-%H%M%S')}-{frappe.generate_hash(length=6)}.{file_format}"
+    path = frappe.get_site_path("private", "files", file_name)
+
+    if file_format == "pdf":
+        # Rendering blocks between chunks, so rows are paged rather than streamed
+        rows = iter_export_pages(filters, maximum_results, rank_partition)
+        write_merit_list_pdf(rows, path, get_pdf_context(filters, rank_partition), progress=progress)
+    else:
+        rows = iter_export_rows(filters, maximum_results, rank_partition)
+        write_export_rows(rows, path, file_format, progress=progress)
+
+    # File.insert() would read the whole file back to hash it; hash it in blocks instead
+    file_doc = frappe.get_doc({
+        "doctype": "File",
+        "file_name": file_name,
+        "file_url": f"/private/files/{file_name}",
+        "is_private": 1,
+        "file_size": os.path.getsize(path),
+        "content_hash": get_file_hash(path),
+        "attached_to_doctype": "Merit List Generation Tool",
+        "attached_to_name": attached_to_name or "Merit List Generation Tool"
+    })
+    file_doc.insert(ignore_permissions=True)
+    return file_doc
+
+
+def get_file_hash(path, block_size=1024 * 1024):
+    """MD5 of a file on disk, as `File.content_hash`, read a block at a time"""
+    file_hash = hashlib.md5()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def write_export_rows(rows, path, file_format, progress=None):
+    writer = EXPORT_WRITERS[file_format](path)
+    try:
+        writer.write_row([label for label, _ in EXPORT_COLUMNS])
+        for count, row in enumerate(rows, start=1):
+            writer.write_row([format_export_value(row, field) for _, field in EXPORT_COLUMNS])
+            if progress and count % EXPORT_PROGRESS_INTERVAL == 0:
+                progress(count)
+    finally:
+        writer.close()
+
+
+def get_pdf_context(filters, rank_partition="Overall"):
+    """Page header values shared by every chunk of a PDF export"""
+    description = [filters.get("program") or "All Programs", filters.get("student_category") or "All Categories"]
+    if filters.get("validation_status") != "Validated":
+        description.append("including pending submissions")
+
+    return {
+        "title": f"Merit List - {filters.get('academic_year')}",
+        "filters_description": f"{', '.join(description)} (ranked by {rank_partition or 'Overall'})"
+    }
+
+
+def get_export_row_count(filters, maximum_results=None):
+    rows = MeritListQuery(filters, maximum_results=maximum_results).count()
+    return min(rows, cint(maximum_results)) if cint(maximum_results) else rows
+
+
+def format_export_value(row, field):
+    value = row.get(field)
+    if field in ("total_merit_score", "percentage_score"):
+        return flt(value, 2)
+    if field in ("merit_rank", "category_rank"):
+        return cint(value) or None
+    if field == "student_category":
+        return value or "General"
+    return value
+
+
+def enqueue_merit_list_export(filters, file_format="xlsx", maximum_results=None, rank_partition="Overall"):
+    """Queue an export on the long queue; the user is notified when the file is ready"""
+    frappe.enqueue(
+        "education_management.merit_list_export.run_merit_list_export",
+        queue="long",
+        timeout=4 * 3600 if file_format == "pdf" else 3600,
+        enqueue_after_commit=True,
+        filters=filters,
+        file_format=file_format,
+        maximum_results=maximum_results,
+        rank_partition=rank_partition,
+        user=frappe.session.user
+    )
+
+
+def run_merit_list_export(filters, file_format, maximum_results, rank_partition, user):
+    """Background job: export and tell `user` where the file is"""
+    rows_total = get_export_row_count(filters, maximum_results)
+
+    def progress(count):
+        frappe.publish_progress(
+            count * 100 / (rows_total or 1),
+            title=f"Exporting merit list ({file_format.upper()})",
+            doctype="Merit List Generation Tool",
+            docname="Merit List Generation Tool",
+            description=f"{count} of {rows_total} rows"
+        )
+
+    try:
+        file_doc = export_merit_list(filters, file_format, maximum_results, rank_partition, progress=progress)
+        frappe.db.commit()
+    except Exception:
+        frappe.db.rollback()
+        frappe.log_error("Merit list export failed")
+        frappe.publish_realtime("merit_list_export", {"status": "Failed"}, user=user)
+        raise
+
+    frappe.publish_realtime(
+        "merit_list_export",
+        {"status": "Completed", "file_url": file_doc.file_url, "file_name": file_doc.file_name},
+        user=user
+    )
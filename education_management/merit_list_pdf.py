@@ -0,0 +1,114 @@
+"""Merit list PDF rendering in chunks by a pool of worker processes."""
+
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import frappe
+
+from education_management.utils import batched
+
+PDF_ROWS_PER_CHUNK = 500
+PDF_TEMPLATE = "education_management/templates/print/merit_list_pdf.html"
+PDF_WORKERS = min(os.cpu_count() or 1, 4)
+# Chunks handed to the pool ahead of the one being collected
+PDF_MAX_PENDING = PDF_WORKERS * 2
+
+# Compiled chunk template of a worker process, set by `init_pdf_worker`
+_template = None
+
+
+def init_pdf_worker(site, sites_path):
+    """Process pool initializer: connect to the site and compile the chunk template once"""
+    global _template
+
+    frappe.init(site=site, sites_path=sites_path)
+    frappe.connect()
+    _template = frappe.get_template(PDF_TEMPLATE)
+
+
+def render_pdf_chunk(part_path, context):
+    """Render one chunk of rows to a PDF part on disk; returns the number of rows rendered"""
+    from frappe.utils.pdf import get_pdf
+
+    with open(part_path, "wb") as part:
+        part.write(get_pdf(_template.render(context), {"orientation": "Landscape"}))
+    return len(context["rows"])
+
+
+def write_merit_list_pdf(rows, path, context, progress=None):
+    """Render `rows`, any iterable of merit list rows in list order, to a PDF at `path`.
+
+    `context` is passed to every chunk along with its rows and the position of
+    its first row. Returns the number of rows written.
+    """
+    count = 0
+    pending = deque()
+
+    with tempfile.TemporaryDirectory(prefix="merit-list-pdf-") as parts_dir:
+        parts = []
+        with ProcessPoolExecutor(
+            max_workers=PDF_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_pdf_worker,
+            initargs=(frappe.local.site, frappe.local.sites_path)
+        ) as executor:
+
+            def collect():
+                nonlocal count
+                count += pending.popleft().result()
+                if progress:
+                    progress(count)
+
+            def submit(index, chunk):
+                part_path = os.path.join(parts_dir, f"{index:06d}.pdf")
+                parts.append(part_path)
+                pending.append(executor.submit(
+                    render_pdf_chunk,
+                    part_path,
+                    {**context, "rows": [dict(row) for row in chunk], "start": index * PDF_ROWS_PER_CHUNK + 1}
+                ))
+
+            for index, chunk in enumerate(batched(rows, PDF_ROWS_PER_CHUNK)):
+                submit(index, chunk)
+                if len(pending) >= PDF_MAX_PENDING:
+                    collect()
+
+            if not parts:
+                # An empty list still gets a header-only document
+                submit(0, [])
+
+            while pending:
+                collect()
+
+        concatenate_pdfs(parts, path)
+
+    return count
+
+
+def concatenate_pdfs(parts, path):
+    """Join PDF parts into `path`, in order.
+
+    qpdf streams the parts and is used when installed; pypdf, which holds
+    the merged document in memory until it is written, is the fallback.
+    """
+    if len(parts) == 1:
+        shutil.copyfile(parts[0], path)
+        return
+
+    if qpdf := shutil.which("qpdf"):
+        subprocess.run([qpdf, "--empty", "--pages", *parts, "--", path], check=True)
+        return
+
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(part)
+    with open(path, "wb") as output:
+        writer.write(output)
+    writer.close()
@@ -0,0 +1,231 @@
+"""Merit score email notifications, sent as per-recipient digests by background jobs."""
+
+from collections import defaultdict
+
+import frappe
+from frappe.utils import add_days, add_to_date, date_diff, now_datetime, nowdate
+
+from education_management.utils import get_education_management_settings
+
+NOTIFICATION_CHUNK_SIZE = 500
+
+# Overdue submissions handled per reminder run; the rest wait for the next run
+REMINDER_BATCH_SIZE = 5000
+REMINDER_INTERVAL_HOURS = 24
+# Recipients of reminders for submissions no validator has picked up yet
+REMINDER_ROLE = "Academics User"
+
+NOTIFICATION_TEMPLATES = {
+    "submission": "education_management/templates/emails/merit_submission.html",
+    "validation": "education_management/templates/emails/merit_validation.html",
+    "reminder": "education_management/templates/emails/merit_validation_reminder.html",
+}
+
+NOTIFICATION_SUBJECTS = {
+    "submission": ("Merit Score Submitted - {0}", "{0} Merit Score Submissions Received"),
+    "validation": ("Merit Score Validation Update - {0}", "{0} Merit Score Validation Updates"),
+    "reminder": ("Merit Score Validation Overdue - {0}", "{0} Merit Score Submissions Awaiting Validation"),
+}
+
+NOTIFICATION_FIELDS = [
+    "name", "student_applicant", "applicant_name", "program", "total_merit_score",
+    "percentage_score", "submission_date", "validation_status", "validated_by", "validation_date"
+]
+
+
+def send_merit_notification(submission_doc, notification_type):
+    """Queue a notification for one submission"""
+    queue_merit_notifications([submission_doc.name], notification_type)
+
+
+def queue_merit_notifications(submissions, notification_type):
+    """Queue one dispatch job for `submissions`, sent once the current transaction commits"""
+    if not submissions or not is_notification_enabled(notification_type):
+        return
+
+    frappe.enqueue(
+        "education_management.notifications.dispatch_merit_notifications",
+        queue="short",
+        enqueue_after_commit=True,
+        submissions=list(submissions),
+        notification_type=notification_type
+    )
+
+
+def is_notification_enabled(notification_type):
+    settings = get_education_management_settings()
+    return bool(settings.get(f"notify_on_{notification_type}")) and settings.get("notification_settings") in ("Email", "Both")
+
+
+def dispatch_merit_notifications(submissions, notification_type):
+    """Background job: email every recipient once for all of `submissions`"""
+    if not is_notification_enabled(notification_type):
+        return
+
+    digests = defaultdict(list)
+    for start in range(0, len(submissions), NOTIFICATION_CHUNK_SIZE):
+        chunk = submissions[start:start + NOTIFICATION_CHUNK_SIZE]
+        for recipient, entry in get_recipient_entries(chunk, notification_type):
+            digests[recipient].append(entry)
+
+    for recipient, entries in digests.items():
+        send_digest(recipient, entries, notification_type)
+
+
+def get_recipient_entries(submissions, notification_type):
+    """`(email, submission)` pairs for a chunk: the applicant, and the validator for validation updates"""
+    rows = frappe.get_all(
+        "Merit Score Submission",
+        filters={"name": ["in", submissions]},
+        fields=NOTIFICATION_FIELDS
+    )
+
+    applicants = list({row.student_applicant for row in rows if row.student_applicant})
+    emails = dict(
+        frappe.get_all(
+            "Student Applicant",
+            filters={"name": ["in", applicants]},
+            fields=["name", "student_email_id"],
+            as_list=True
+        )
+    ) if applicants else {}
+
+    validators = list({row.validated_by for row in rows if row.validated_by}) if notification_type == "validation" else []
+    validator_emails = dict(
+        frappe.get_all("User", filters={"name": ["in", validators]}, fields=["name", "email"], as_list=True)
+    ) if validators else {}
+
+    for row in rows:
+        recipients = {emails.get(row.student_applicant), validator_emails.get(row.validated_by)}
+        for email in recipients - {None, ""}:
+            yield email, row
+
+
+def send_digest(recipient, entries, notification_type):
+    """Send one queued email covering `entries`"""
+    single_subject, digest_subject = NOTIFICATION_SUBJECTS[notification_type]
+    reference = {}
+
+    if len(entries) == 1:
+        subject = single_subject.format(entries[0].applicant_name)
+        reference = {"reference_doctype": "Merit Score Submission", "reference_name": entries[0].name}
+    else:
+        subject = digest_subject.format(len(entries))
+
+    try:
+        frappe.sendmail(
+            recipients=[recipient],
+            subject=subject,
+            message=frappe.get_template(NOTIFICATION_TEMPLATES[notification_type]).render({"entries": entries}),
+            **reference
+        )
+    except Exception as e:
+        frappe.log_error(f"Merit notification failed: {e!s}", "Merit Notification Error")
+
+
+def send_validation_reminders():
+    """Scheduled hourly: one reminder digest per validator for overdue pending submissions.
+
+    Items assigned through a draft Merit Score Validation go to its validator,
+    unassigned ones to every user with `REMINDER_ROLE`.
+    """
+    settings = get_education_management_settings()
+    reminder_days = settings.validation_reminder_days
+    if not reminder_days or settings.get("notification_settings") not in ("Email", "Both"):
+        return
+
+    overdue = get_overdue_submissions(reminder_days)
+    if not overdue:
+        return
+
+    validators = list({row.validator for row in overdue if row.validator})
+    validator_emails = dict(
+        frappe.get_all("User", filters={"name": ["in", validators], "enabled": 1}, fields=["name", "email"], as_list=True)
+    ) if validators else {}
+    role_emails = None
+
+    digests = defaultdict(list)
+    for row in overdue:
+        row.days_pending = date_diff(nowdate(), row.submission_date)
+        if email := validator_emails.get(row.validator):
+            digests[email].append(row)
+            continue
+
+        if role_emails is None:
+            role_emails = get_role_emails(REMINDER_ROLE)
+        for email in role_emails:
+            digests[email].append(row)
+
+    for recipient, entries in digests.items():
+        send_digest(recipient, entries, "reminder")
+
+    # Emails are queued in this transaction, so they and the timestamps commit together
+    Submission = frappe.qb.DocType("Merit Score Submission")
+    reminded_at = now_datetime()
+    names = [row.name for row in overdue]
+    for start in range(0, len(names), NOTIFICATION_CHUNK_SIZE):
+        (
+            frappe.qb.update(Submission)
+            .set(Submission.last_validation_reminder, reminded_at)
+            .where(Submission.name.isin(names[start:start + NOTIFICATION_CHUNK_SIZE]))
+        ).run()
+
+    frappe.db.commit()
+
+
+def get_overdue_submissions(reminder_days):
+    """Pending submissions older than `reminder_days` not reminded about recently.
+
+    A range scan on `validation_queue_index` (docstatus, validation_status,
+    submission_date), oldest first. Each row's `validator` is the one on its
+    draft validation, if any.
+    """
+    Submission = frappe.qb.DocType("Merit Score Submission")
+    remind_before = add_to_date(now_datetime(), hours=-REMINDER_INTERVAL_HOURS)
+
+    rows = (
+        frappe.qb.from_(Submission)
+        .select(
+            Submission.name, Submission.applicant_name, Submission.program,
+            Submission.total_merit_score, Submission.submission_date
+        )
+        .where(
+            (Submission.docstatus == 1)
+            & (Submission.validation_status == "Pending")
+            & (Submission.submission_date < add_days(nowdate(), -reminder_days))
+            & (Submission.last_validation_reminder.isnull() | (Submission.last_validation_reminder < remind_before))
+        )
+        .orderby(Submission.submission_date)
+        .limit(REMINDER_BATCH_SIZE)
+    ).run(as_dict=True)
+
+    assignments = {}
+    names = [row.name for row in rows]
+    for start in range(0, len(names), NOTIFICATION_CHUNK_SIZE):
+        assignments.update(frappe.get_all(
+            "Merit Score Validation",
+            filters={
+                "merit_submission": ["in", names[start:start + NOTIFICATION_CHUNK_SIZE]],
+                "docstatus": 0,
+                "validator": ["is", "set"]
+            },
+            fields=["merit_submission", "validator"],
+            as_list=True
+        ))
+
+    for row in rows:
+        row.validator = assignments.get(row.name)
+
+    return rows
+
+
+def get_role_emails(role):
+    users = frappe.get_all("Has Role", filters={"role": role, "parenttype": "User"}, pluck="parent", distinct=True)
+    if not users:
+        return []
+
+    return frappe.get_all(
+        "User",
+        filters={"name": ["in", users], "enabled": 1, "user_type": "System User", "email": ["is", "set"]},
+        pluck="email"
+    )
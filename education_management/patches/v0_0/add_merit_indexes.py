@@ -0,0 +1,14 @@
+from education_management.education_management.doctype.merit_rank import merit_rank
+from education_management.education_management.doctype.merit_score_submission import (
+    merit_score_submission,
+)
+from education_management.education_management.doctype.merit_score_validation import (
+    merit_score_validation,
+)
+
+
+def execute():
+    # Indexes are also added on doctype sync, but sites that are already on the
+    # current schema would not pick them up until the next schema change
+    for module in (merit_score_submission, merit_score_validation, merit_rank):
+        module.on_doctype_update()
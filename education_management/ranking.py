@@ -0,0 +1,684 @@
+import hashlib
+import json
+
+import frappe
+from frappe.query_builder.functions import IfNull
+from frappe.utils import flt, get_datetime, now
+from frappe.utils.background_jobs import is_job_enqueued
+
+from education_management.utils import batched, bulk_set_values, get_education_management_settings
+
+RANKING_METHODS = ("Standard Competition", "Dense", "Ordinal")
+
+# Fields a rank partition can be keyed on, in the order rows carry them
+PARTITION_FIELDS = ("academic_year", "program", "student_category")
+
+# Category that submissions without one are listed and ranked under
+DEFAULT_STUDENT_CATEGORY = "General"
+
+# Rows are ranked on (total_merit_score, percentage_score). Ties on both are
+# broken by this chain, configured in settings one per line. Subject scores
+# rank higher values first, dates rank earlier values first.
+TIE_BREAKING_CRITERIA = ("Submission Date", "Date of Birth", "Subject Score")
+
+# Cache hash holding the last known state of each rank refresh job
+RANK_REFRESH_STATUS_KEY = "merit_rank_refresh_status"
+
+# Stored rank keys encode numbers relative to this offset so that ascending
+# string order matches merit order
+RANK_KEY_OFFSET = 10**9
+
+RANK_DELETE_CHUNK_SIZE = 1000
+
+# Chains implied by the single-choice `tie_breaking_criteria` setting
+DEFAULT_TIE_BREAKERS = {
+    "Total Score": [],
+    "Percentage": [],
+    "Submission Date": ["Submission Date"],
+    "Manual Review": [],
+}
+
+
+class RankCounter:
+    """Running rank state of one partition while scanning rows in merit order"""
+
+    __slots__ = ("last_key", "method", "position", "rank")
+
+    def __init__(self, method="Standard Competition"):
+        self.method = method
+        self.position = 0
+        self.rank = 0
+        self.last_key = None
+
+    def next(self, tie_key):
+        self.position += 1
+
+        if self.method == "Ordinal" or self.position == 1 or tie_key != self.last_key:
+            self.rank = self.rank + 1 if self.method == "Dense" else self.position
+
+        self.last_key = tie_key
+        return self.rank
+
+
+def parse_tie_breakers(value):
+    """Parse a tie breaking chain, one criterion per line.
+
+    Subject criteria are written as `Subject Score: <subject>`.
+    """
+    tie_breakers = []
+
+    for line in (value or "").splitlines():
+        criterion, _, subject = (part.strip() for part in line.partition(":"))
+        if not criterion:
+            continue
+
+        if criterion not in TIE_BREAKING_CRITERIA:
+            frappe.throw(f"Unknown tie breaking criterion '{criterion}'")
+
+        if criterion == "Subject Score":
+            if not subject:
+                frappe.throw("Subject Score tie breaker needs a subject, e.g. 'Subject Score: Mathematics'")
+            tie_breakers.append(f"Subject Score: {subject}")
+        else:
+            tie_breakers.append(criterion)
+
+    return tie_breakers
+
+
+def get_ranking_options():
+    """Ranking method and tie breaking chain from Education Management Settings"""
+    settings = get_education_management_settings()
+
+    method = settings.get("ranking_method") or "Standard Competition"
+    tie_breakers = parse_tie_breakers(settings.get("tie_breaking_order"))
+    if not tie_breakers:
+        tie_breakers = DEFAULT_TIE_BREAKERS.get(settings.get("tie_breaking_criteria"), [])
+
+    return method, tie_breakers
+
+
+def get_ranking_fingerprint():
+    """Hash of the settings that decide stored ranks: method, tie breaking chain and partitions"""
+    method, tie_breakers = get_ranking_options()
+    fingerprint = json.dumps([method, tie_breakers, get_partitions()], sort_keys=True)
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def get_partitions(settings=None):
+    """Rank partitions enabled in settings, mapped to the fields that key them"""
+    settings = settings or get_education_management_settings()
+    program_fields = ("academic_year", "program") if settings.get("enable_program_wise_ranking") else ("academic_year",)
+
+    partitions = {"Overall": ("academic_year",)}
+    if settings.get("enable_program_wise_ranking"):
+        partitions["Program"] = program_fields
+    if settings.get("enable_category_wise_ranking"):
+        partitions["Category"] = (*program_fields, "student_category")
+
+    return partitions
+
+
+def get_scope_partitions(scope, partitions=None):
+    """Partitions that can be fully ranked from rows restricted to `scope`.
+
+    A refresh for one program cannot produce overall ranks for the academic
+    year, so only partitions keyed on every scoped field are returned.
+    """
+    if partitions is None:
+        partitions = get_partitions()
+    return {
+        partition_type: fields
+        for partition_type, fields in partitions.items()
+        if set(scope).issubset(fields)
+    }
+
+
+def fetch_ranking_rows(filters, tie_breakers=()):
+    """Fetch compact `(tie_key, tiebreak_key, name, partition_values)` tuples for ranking.
+
+    Everything needed to order the cohort is selected in one query, joining the
+    applicant and subject score tables only when the tie breaking chain asks
+    for them. Keys are built so that ascending order is merit order.
+    """
+    Submission = frappe.qb.DocType("Merit Score Submission")
+    query = frappe.qb.from_(Submission).select(
+        Submission.name,
+        Submission.academic_year,
+        Submission.program,
+        Submission.student_category,
+        Submission.total_merit_score,
+        Submission.percentage_score,
+    )
+
+    for fieldname, value in filters.items():
+        query = query.where(Submission[fieldname] == value)
+
+    descending = []
+    for idx, criterion in enumerate(tie_breakers):
+        if criterion == "Submission Date":
+            query = query.select(Submission.submission_date)
+            descending.append(False)
+        elif criterion == "Date of Birth":
+            Applicant = frappe.qb.DocType("Student Applicant").as_(f"applicant_{idx}")
+            query = query.left_join(Applicant).on(Applicant.name == Submission.student_applicant)
+            query = query.select(Applicant.date_of_birth)
+            descending.append(False)
+        else:
+            subject = criterion.split(":", 1)[1].strip()
+            SubjectScore = frappe.qb.DocType("Merit Subject Score").as_(f"subject_{idx}")
+            query = query.left_join(SubjectScore).on(
+                (SubjectScore.parent == Submission.name)
+                & (SubjectScore.parenttype == "Merit Score Submission")
+                & (SubjectScore.subject == subject)
+            )
+            query = query.select(SubjectScore.score)
+            descending.append(True)
+
+    rows = {}
+    for name, academic_year, program, category, total, percentage, *tiebreak_values in query.run():
+        if name in rows:
+            # A subject listed twice on one submission; keep the first row
+            continue
+
+        tiebreak_key = tuple(
+            tiebreak_value(value, desc) for value, desc in zip(tiebreak_values, descending, strict=True)
+        )
+        rows[name] = (
+            (-flt(total), -flt(percentage)),
+            tiebreak_key,
+            name,
+            (academic_year, program, category or DEFAULT_STUDENT_CATEGORY),
+        )
+
+    return list(rows.values())
+
+
+def tiebreak_value(value, descending=False):
+    """Key that sorts missing values last and optionally reverses numbers"""
+    if value is None:
+        return (True, 0)
+    return (False, -flt(value) if descending else value)
+
+
+def encode_keys(tie_key, tiebreak_key, name):
+    """Encode a row's ranking keys as strings for the Merit Rank table.
+
+    Returns `(tie_key, sort_key)`; both sort ascending in merit order, so a
+    submission's neighbours can be found with an indexed range lookup.
+    """
+    encoded_tie_key = "|".join(encode_key_value(value) for value in tie_key)
+    sort_key = [encoded_tie_key]
+
+    for is_missing, value in tiebreak_key:
+        sort_key.append("1" if is_missing else f"0{encode_key_value(value)}")
+
+    sort_key.append(name)
+    return encoded_tie_key, "|".join(sort_key)
+
+
+def encode_key_value(value):
+    if isinstance(value, int | float):
+        return f"{RANK_KEY_OFFSET + value:016.4f}"
+    return str(value)
+
+
+def refresh_ranks(filters, progress=None):
+    """Recompute and store ranks for every partition covered by `filters`.
+
+    `progress`, if given, is called with `(percent, description)` between stages.
+    """
+    progress = progress or (lambda percent, description: None)
+    scope = {field: filters[field] for field in PARTITION_FIELDS if filters.get(field)}
+    partitions = get_scope_partitions(scope)
+
+    if not partitions:
+        # No enabled partition is keyed on every scoped field, e.g. one program
+        # while program-wise ranking is off; rank the whole academic year instead
+        filters = {field: value for field, value in filters.items() if field not in ("program", "student_category")}
+        scope = {"academic_year": filters["academic_year"]} if filters.get("academic_year") else {}
+        partitions = get_scope_partitions(scope)
+    method, tie_breakers = get_ranking_options()
+
+    progress(5, "Fetching submissions")
+    rows = fetch_ranking_rows(filters, tie_breakers)
+    keys = {row[2]: encode_keys(*row[:3]) for row in rows}
+
+    progress(35, f"Ranking {len(rows)} submissions")
+    ranks = compute_ranks(rows, method, partitions)
+
+    progress(60, "Saving ranks")
+    save_ranks(ranks, scope, keys, partitions)
+    return ranks
+
+
+def get_rank_refresh_job_id(academic_year, program=None):
+    return f"merit_rank_refresh::{academic_year}::{program or 'all'}"
+
+
+def get_rank_refresh_scopes(scopes):
+    """(academic_year, program) refresh keys covering changes in the given (academic_year, program) scopes.
+
+    Overall ranks are always kept and need the whole academic year, and a
+    refresh of the year also ranks every program and category partition in
+    it, so changes anywhere in a year are covered by one refresh of that year.
+    """
+    return sorted({(academic_year, None) for academic_year, _program in scopes if academic_year})
+
+
+def get_rank_refresh_status(academic_year, program=None):
+    """Last known state of the rank refresh job for an (academic year, program) key"""
+    job_id = get_rank_refresh_job_id(academic_year, program)
+    status = frappe.cache.hget(RANK_REFRESH_STATUS_KEY, job_id) or {"job_id": job_id, "status": None}
+
+    # A job that died without reporting back is no longer in progress
+    if status["status"] in ("Queued", "Running") and not is_job_enqueued(job_id):
+        status["status"] = "Failed"
+
+    return status
+
+
+def enqueue_rank_refresh(academic_year, program=None, force=False):
+    """Queue one deduplicated rank refresh per (academic year, program) on the long queue.
+
+    A completed refresh is reused when the ranking settings are unchanged and
+    no submission in scope has been modified since it finished. Writes that
+    leave `modified` alone, such as regrading, must pass `force`.
+    """
+    status = get_rank_refresh_status(academic_year, program)
+    if status["status"] in ("Queued", "Running"):
+        return status
+
+    if (
+        not force
+        and status["status"] == "Completed"
+        and status.get("fingerprint") == get_ranking_fingerprint()
+    ):
+        filters = {"academic_year": academic_year, "docstatus": 1}
+        if program:
+            filters["program"] = program
+
+        last_change = frappe.db.get_value("Merit Score Submission", filters, "max(modified)")
+        if not last_change or get_datetime(last_change) <= get_datetime(status["finished_at"]):
+            return status
+
+    status = {"job_id": status["job_id"], "status": "Queued", "queued_at": now()}
+    set_rank_refresh_status(status)
+
+    frappe.enqueue(
+        "education_management.ranking.run_rank_refresh",
+        queue="long",
+        timeout=3600,
+        job_id=status["job_id"],
+        deduplicate=True,
+        enqueue_after_commit=True,
+        academic_year=academic_year,
+        program=program
+    )
+    return status
+
+
+def run_rank_refresh(academic_year, program=None):
+    """Background job: refresh ranks and report progress to the Merit List Generation Tool"""
+    job_id = get_rank_refresh_job_id(academic_year, program)
+    title = f"Refreshing merit ranks for {program or academic_year}"
+    status = {"job_id": job_id, "status": "Running", "started_at": now(), "fingerprint": get_ranking_fingerprint()}
+    set_rank_refresh_status(status)
+
+    def progress(percent, description):
+        frappe.publish_progress(
+            percent,
+            title=title,
+            doctype="Merit List Generation Tool",
+            docname="Merit List Generation Tool",
+            description=description
+        )
+
+    filters = {
+        "docstatus": 1,
+        "validation_status": "Validated",
+        "submission_status": "Approved",
+        "academic_year": academic_year
+    }
+    if program:
+        filters["program"] = program
+
+    try:
+        ranks = refresh_ranks(filters, progress)
+        frappe.db.commit()
+    except Exception:
+        frappe.db.rollback()
+        set_rank_refresh_status({**status, "status": "Failed", "finished_at": now()})
+        publish_rank_refresh_status(academic_year, program)
+        raise
+
+    progress(100, "Ranks refreshed")
+    set_rank_refresh_status({
+        **status,
+        "status": "Completed",
+        "finished_at": now(),
+        "ranked": {partition_type: len(partition_ranks) for partition_type, partition_ranks in ranks.items()}
+    })
+    publish_rank_refresh_status(academic_year, program)
+
+
+def set_rank_refresh_status(status):
+    frappe.cache.hset(RANK_REFRESH_STATUS_KEY, status["job_id"], status)
+
+
+def publish_rank_refresh_status(academic_year, program=None):
+    frappe.publish_realtime(
+        "merit_rank_refresh",
+        {
+            "academic_year": academic_year,
+            "program": program,
+            **get_rank_refresh_status(academic_year, program)
+        },
+        doctype="Merit List Generation Tool",
+        docname="Merit List Generation Tool"
+    )
+
+
+def compute_ranks(rows, method="Standard Competition", partitions=None):
+    """Compute ranks for every partition in one sorted pass.
+
+    `rows` are tuples from `fetch_ranking_rows`. Rows tied on the merit key
+    share a rank under Standard Competition (1, 2, 2, 4) and Dense (1, 2, 2, 3)
+    ranking; Ordinal ranking separates them by the tie breaking chain and
+    finally by name, so the result never depends on database row order.
+
+    Returns `{partition_type: [(name, partition_values, rank), ...]}` with each
+    list in merit order.
+    """
+    if method not in RANKING_METHODS:
+        frappe.throw(f"Unknown ranking method '{method}'")
+
+    if partitions is None:
+        partitions = get_partitions()
+    indexes = {
+        partition_type: tuple(PARTITION_FIELDS.index(field) for field in fields)
+        for partition_type, fields in partitions.items()
+    }
+    counters = {}
+    ranks = {partition_type: [] for partition_type in partitions}
+
+    for tie_key, _tiebreak_key, name, values in sorted(rows):
+        for partition_type, index in indexes.items():
+            partition_values = tuple(values[i] for i in index)
+            counter = counters.get((partition_type, partition_values))
+            if not counter:
+                counter = counters[(partition_type, partition_values)] = RankCounter(method)
+
+            ranks[partition_type].append((name, partition_values, counter.next(tie_key)))
+
+    return ranks
+
+
+def save_ranks(ranks, scope, keys, partitions=None):
+    """Replace the stored ranks of `scope` with freshly computed `ranks`.
+
+    `keys` maps each submission to its encoded `(tie_key, sort_key)`, which
+    incremental updates use to find the rows a change affects.
+
+    Ranks go to the Merit Rank table, one row per submission and partition,
+    and are mirrored to `merit_rank` (program rank, or overall rank when
+    program-wise ranking is off) and `category_rank` on the submission.
+    """
+    if partitions is None:
+        partitions = get_partitions()
+    now = frappe.utils.now()
+    user = frappe.session.user
+    values = []
+
+    for partition_type, partition_ranks in ranks.items():
+        frappe.db.delete("Merit Rank", {"partition_type": partition_type, **scope})
+
+        # Rows named for these submissions may remain outside the scope, e.g.
+        # after a submission moved to another program
+        for chunk in batched((name for name, _values, _rank in partition_ranks), RANK_DELETE_CHUNK_SIZE):
+            frappe.db.delete("Merit Rank", {"partition_type": partition_type, "merit_submission": ["in", chunk]})
+
+        fields = partitions[partition_type]
+        for name, partition_values, rank in partition_ranks:
+            row = dict.fromkeys(PARTITION_FIELDS)
+            row.update(zip(fields, partition_values, strict=True))
+
+            values.append((
+                get_rank_name(name, partition_type), now, now, user, user,
+                name, partition_type, get_partition_key(partition_values), rank, *keys[name],
+                row["academic_year"], row["program"], row["student_category"]
+            ))
+
+    frappe.db.bulk_insert(
+        "Merit Rank",
+        [
+            "name", "creation", "modified", "owner", "modified_by",
+            "merit_submission", "partition_type", "partition_key", "partition_rank",
+            "tie_key", "sort_key", "academic_year", "program", "student_category"
+        ],
+        values
+    )
+
+    write_submission_ranks(ranks)
+
+
+def get_rank_name(merit_submission, partition_type):
+    """Merit Rank name; a submission has at most one rank per partition type"""
+    return f"{merit_submission}-{partition_type}"
+
+
+def get_partition_key(partition_values):
+    return "|".join(value or "" for value in partition_values)
+
+
+def write_submission_ranks(ranks):
+    """Mirror partition ranks to `merit_rank` and `category_rank` in chunked bulk updates"""
+    for partition_type, partition_ranks in ranks.items():
+        fieldname = get_rank_column(partition_type, ranks)
+        if fieldname:
+            bulk_set_values(
+                "Merit Score Submission",
+                (fieldname,),
+                ((name, rank) for name, _values, rank in partition_ranks)
+            )
+
+
+def get_rank_column(partition_type, partitions):
+    """Submission column mirroring a partition's ranks, if any"""
+    if partition_type == "Category":
+        return "category_rank"
+    if partition_type == ("Program" if "Program" in partitions else "Overall"):
+        return "merit_rank"
+
+
+def get_partition_ranks(partition_type, submissions):
+    """Stored ranks of `submissions` in one partition type, keyed by submission"""
+    if not submissions:
+        return {}
+
+    return dict(frappe.get_all(
+        "Merit Rank",
+        filters={"partition_type": partition_type, "merit_submission": ["in", list(submissions)]},
+        fields=["merit_submission", "partition_rank"],
+        as_list=True
+    ))
+
+
+def is_ranked(submission):
+    """Whether a submission belongs in the ranked (approved) set"""
+    return (
+        submission.docstatus == 1
+        and submission.validation_status == "Validated"
+        and submission.submission_status == "Approved"
+    )
+
+
+def update_submission_ranks(submission):
+    """Incrementally move one submission within the stored ranks of its partitions.
+
+    Called when a submission enters or leaves the approved set or its score
+    changes. Instead of re-ranking the cohort, the submission's neighbour is
+    found with an indexed lookup and only the rows ranked behind it are
+    shifted with a bounded range UPDATE per partition.
+
+    `submission` is a document or a row with `name`, `docstatus`,
+    `validation_status` and `submission_status`.
+    """
+    settings = get_education_management_settings()
+    if not settings.get("auto_generate_rankings"):
+        return
+
+    method, tie_breakers = get_ranking_options()
+    partitions = get_partitions(settings)
+
+    stored = {
+        row.partition_type: row
+        for row in frappe.get_all(
+            "Merit Rank",
+            filters={"merit_submission": submission.name},
+            fields=["name", "partition_type", "partition_key", "partition_rank", "tie_key", "sort_key"]
+        )
+    }
+
+    desired = {}
+    rows = fetch_ranking_rows({"name": submission.name}, tie_breakers) if is_ranked(submission) else []
+    for tie_key, tiebreak_key, name, values in rows:
+        encoded_keys = encode_keys(tie_key, tiebreak_key, name)
+        for partition_type, fields in partitions.items():
+            partition_values = tuple(values[PARTITION_FIELDS.index(field)] for field in fields)
+            desired[partition_type] = (partition_values, *encoded_keys)
+
+    for partition_type in set(stored) | set(desired):
+        old, new = stored.get(partition_type), desired.get(partition_type)
+        if old and new and old.partition_key == get_partition_key(new[0]) and old.sort_key == new[2]:
+            continue
+
+        column = get_rank_column(partition_type, partitions)
+        rank = 0
+
+        if old:
+            remove_rank(old, method, column)
+        if new:
+            rank = insert_rank(submission.name, partition_type, partitions[partition_type], *new, method, column)
+
+        if column:
+            frappe.db.set_value("Merit Score Submission", submission.name, column, rank, update_modified=False)
+            submission.update({column: rank})
+
+
+def remove_rank(row, method, column=None):
+    """Drop a stored rank and close the gap behind it"""
+    partition = {"partition_type": row.partition_type, "partition_key": row.partition_key}
+    lock_partition(partition)
+    frappe.db.delete("Merit Rank", {"name": row.name})
+
+    if method == "Ordinal":
+        shift_ranks(partition, "sort_key", row.sort_key, -1, column)
+    elif method == "Standard Competition" or not frappe.db.exists(
+        "Merit Rank", {**partition, "tie_key": row.tie_key}
+    ):
+        shift_ranks(partition, "tie_key", row.tie_key, -1, column)
+
+
+def insert_rank(name, partition_type, fields, partition_values, tie_key, sort_key, method, column=None):
+    """Store a submission's rank in one partition, shifting the rows behind it.
+
+    Returns the new rank, or 0 when the partition has never been ranked and a
+    full refresh is needed to place the submission correctly.
+    """
+    partition_key = get_partition_key(partition_values)
+    partition = {"partition_type": partition_type, "partition_key": partition_key}
+    lock_partition(partition)
+
+    if not frappe.db.exists("Merit Rank", partition) and has_unranked_submissions(name, fields, partition_values):
+        return 0
+
+    tied = frappe.db.get_value("Merit Rank", {**partition, "tie_key": tie_key}, "partition_rank")
+    following = frappe.db.get_value(
+        "Merit Rank", {**partition, "sort_key": [">", sort_key]}, "partition_rank", order_by="sort_key asc"
+    )
+    preceding = frappe.db.get_value(
+        "Merit Rank", {**partition, "sort_key": ["<", sort_key]}, "partition_rank", order_by="sort_key desc"
+    )
+
+    if method == "Ordinal":
+        rank = (preceding or 0) + 1
+        shift_ranks(partition, "sort_key", sort_key, 1, column)
+    elif method == "Standard Competition":
+        if tied:
+            rank = tied
+        elif following:
+            rank = following
+        else:
+            rank = frappe.db.count("Merit Rank", partition) + 1
+        shift_ranks(partition, "tie_key", tie_key, 1, column)
+    else:
+        if tied:
+            rank = tied
+        else:
+            rank = following or (preceding or 0) + 1
+            shift_ranks(partition, "tie_key", tie_key, 1, column)
+
+    row = dict.fromkeys(PARTITION_FIELDS)
+    row.update(zip(fields, partition_values, strict=True))
+    frappe.get_doc({
+        "doctype": "Merit Rank",
+        "name": get_rank_name(name, partition_type),
+        "merit_submission": name,
+        "partition_type": partition_type,
+        "partition_key": partition_key,
+        "partition_rank": rank,
+        "tie_key": tie_key,
+        "sort_key": sort_key,
+        **row
+    }).db_insert()
+
+    return rank
+
+
+def shift_ranks(partition, key_field, key_value, delta, column=None):
+    """Shift ranks of the rows whose key sorts after `key_value` by `delta`"""
+    values = {**partition, "key_value": key_value, "delta": delta}
+    conditions = f"""partition_type = %(partition_type)s
+        AND partition_key = %(partition_key)s
+        AND `{key_field}` > %(key_value)s"""
+
+    frappe.db.sql(
+        f"""UPDATE `tabMerit Rank`
+        SET partition_rank = partition_rank + %(delta)s
+        WHERE {conditions}""",
+        values
+    )
+
+    if column:
+        frappe.db.sql(
+            f"""UPDATE `tabMerit Score Submission`
+            SET `{column}` = `{column}` + %(delta)s
+            WHERE name IN (SELECT merit_submission FROM `tabMerit Rank` WHERE {conditions})""",
+            values
+        )
+
+
+def lock_partition(partition):
+    """Serialise incremental updates of one partition on its leading row"""
+    frappe.db.get_value("Merit Rank", partition, "name", order_by="sort_key asc", for_update=True)
+
+
+def has_unranked_submissions(name, fields, partition_values):
+    """Whether approved submissions other than `name` exist in a partition"""
+    Submission = frappe.qb.DocType("Merit Score Submission")
+    query = (
+        frappe.qb.from_(Submission)
+        .select(Submission.name)
+        .where(Submission.docstatus == 1)
+        .where(Submission.validation_status == "Validated")
+        .where(Submission.submission_status == "Approved")
+        .where(Submission.name != name)
+        .limit(1)
+    )
+    for field, value in zip(fields, partition_values, strict=True):
+        column = Submission[field]
+        if field == "student_category":
+            column = IfNull(column, DEFAULT_STUDENT_CATEGORY)
+        query = query.where(column == value)
+
+    return bool(query.run())
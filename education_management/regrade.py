@@ -0,0 +1,203 @@
+"""Recompute derived percentage and grade fields after a grading change.
+
+Percentages and grades are stored on every Merit Score Submission and Merit
+Subject Score row. When grade boundaries or maximum scores change, they are
+refreshed here without loading or saving documents: submissions are read in
+name-ordered chunks, graded with the batch grading engine, and only rows whose
+values differ are written with one CASE UPDATE per field and chunk.
+
+Run from bench, with one worker process per program:
+
+    bench --site <site> regrade-merit-scores --academic-year 2026-27 --workers 4 --dry-run
+"""
+
+import frappe
+from frappe.query_builder import Order
+from frappe.utils import cint, flt
+
+from education_management.grading import get_grade_scale, get_grades, get_percentages
+from education_management.merit_list import MeritListQuery
+from education_management.ranking import enqueue_rank_refresh, get_rank_refresh_scopes
+from education_management.utils import bulk_set_values, clear_merit_dashboard_cache
+
+REGRADE_CHUNK_SIZE = 2000
+
+
+def get_regrade_filters(academic_year=None, program=None):
+    filters = {"docstatus": ["<", 2]}
+    if academic_year:
+        filters["academic_year"] = academic_year
+    if program:
+        filters["program"] = program
+
+    return filters
+
+
+def get_program_filters(filters):
+    """Split `filters` into one filter set per program with matching submissions"""
+    query = MeritListQuery(filters)
+    table = query.table
+    programs = frappe.qb.from_(table).select(table.program).distinct()
+    for condition in query.get_conditions():
+        programs = programs.where(condition)
+
+    return [
+        {**filters, "program": program or ["is", "not set"]}
+        for program in {program or None for (program,) in programs.run()}
+    ]
+
+
+def regrade_submissions(filters, dry_run=False, chunk_size=REGRADE_CHUNK_SIZE):
+    """Recompute percentages and grades of submissions matching `filters`.
+
+    Each chunk is committed on its own. Returns rows scanned and changed for
+    submissions and subject rows; with `dry_run` nothing is written.
+    """
+    scale = get_grade_scale()
+    query = MeritListQuery(filters)
+    table = query.table
+    conditions = query.get_conditions()
+
+    result = {"submissions": 0, "submissions_changed": 0, "subject_rows": 0, "subject_rows_changed": 0}
+    rerank = set()
+    last_name = ""
+
+    while True:
+        chunk = frappe.qb.from_(table).select(
+            table.name, table.docstatus, table.academic_year, table.program, table.total_merit_score,
+            table.maximum_possible_score, table.percentage_score, table.merit_grade
+        ).where(table.name > last_name)
+        for condition in conditions:
+            chunk = chunk.where(condition)
+
+        chunk = chunk.orderby(table.name, order=Order.asc).limit(chunk_size).run(as_dict=True)
+        if not chunk:
+            break
+
+        last_name = chunk[-1].name
+        submissions = get_changed_grades(
+            chunk, "total_merit_score", "maximum_possible_score", "percentage_score", "merit_grade", scale
+        )
+        subject_rows = get_subject_rows([row.name for row in chunk])
+        subjects = get_changed_grades(
+            subject_rows, "score", "maximum_score", "percentage", "grade", scale, grade_zero_scores=True
+        )
+
+        result["submissions"] += len(chunk)
+        result["submissions_changed"] += len(submissions)
+        result["subject_rows"] += len(subject_rows)
+        result["subject_rows_changed"] += len(subjects)
+
+        if dry_run:
+            continue
+
+        bulk_set_values("Merit Score Submission", ["percentage_score", "merit_grade"], submissions)
+        bulk_set_values("Merit Subject Score", ["percentage", "grade"], subjects)
+        frappe.db.commit()
+
+        # Percentage is part of the merit order, so submitted rows need re-ranking
+        changed = {name for name, *_ in submissions}
+        rerank.update((row.academic_year, row.program) for row in chunk if row.name in changed and row.docstatus == 1)
+
+    if not dry_run and result["submissions_changed"] + result["subject_rows_changed"]:
+        clear_merit_dashboard_cache()
+        # Regrading leaves `modified` alone, so a completed refresh must not be reused
+        for academic_year, program in get_rank_refresh_scopes(rerank):
+            enqueue_rank_refresh(academic_year, program, force=True)
+        frappe.db.commit()
+
+    return result
+
+
+def get_subject_rows(parents):
+    subject = frappe.qb.DocType("Merit Subject Score")
+    return (
+        frappe.qb.from_(subject)
+        .select(subject.name, subject.score, subject.maximum_score, subject.percentage, subject.grade)
+        .where(subject.parenttype == "Merit Score Submission")
+        .where(subject.parent.isin(parents))
+        .run(as_dict=True)
+    )
+
+
+def get_changed_grades(rows, score_field, maximum_field, percentage_field, grade_field, scale, grade_zero_scores=False):
+    """`(name, percentage, grade)` for rows whose stored values differ from the recomputed ones"""
+    maximum_scores = [flt(row[maximum_field]) for row in rows]
+    percentages = get_percentages([flt(row[score_field]) for row in rows], maximum_scores)
+    grades = get_grades(percentages, scale, maximum_scores if grade_zero_scores else None)
+
+    return [
+        (row.name, percentage, grade)
+        for row, percentage, grade in zip(rows, percentages, grades, strict=True)
+        if flt(row[percentage_field], 2) != flt(percentage, 2) or (row[grade_field] or None) != grade
+    ]
+
+
+@frappe.whitelist()
+def regrade_merit_scores(academic_year=None, program=None, dry_run=False):
+    """Regrade submissions for an academic year and/or program.
+
+    A dry run is queued as one job that sends its counts to the user in a
+    `merit_regrade` realtime event. Otherwise one deduplicated job per program
+    is queued on the long queue, so programs are regraded in parallel by the
+    available workers.
+    """
+    frappe.only_for(("System Manager", "Academics User"))
+    filters = get_regrade_filters(academic_year, program)
+
+    if cint(dry_run):
+        frappe.enqueue(
+            "education_management.regrade.run_regrade_dry_run",
+            queue="long",
+            timeout=3600,
+            job_id=f"merit_regrade_dry_run::{academic_year or 'all'}::{program or 'all'}",
+            deduplicate=True,
+            enqueue_after_commit=True,
+            filters=filters,
+            user=frappe.session.user
+        )
+        return {"queued": True, "dry_run": True}
+
+    queued = []
+    for program_filters in get_program_filters(filters):
+        program = get_filter_program(program_filters)
+        frappe.enqueue(
+            "education_management.regrade.regrade_submissions",
+            queue="long",
+            timeout=3600,
+            job_id=f"merit_regrade::{academic_year or 'all'}::{program}",
+            deduplicate=True,
+            enqueue_after_commit=True,
+            filters=program_filters
+        )
+        queued.append(program)
+
+    return {"queued": queued}
+
+
+def run_regrade_dry_run(filters, user):
+    """Background job: count what a regrade would change and tell `user`"""
+    try:
+        result = regrade_submissions(filters, dry_run=True)
+    except Exception:
+        frappe.log_error("Merit regrade dry run failed")
+        frappe.publish_realtime("merit_regrade", {"status": "Failed", "dry_run": True}, user=user)
+        raise
+
+    frappe.publish_realtime("merit_regrade", {"status": "Completed", "dry_run": True, **result}, user=user)
+    return result
+
+
+def regrade_program(site, filters, dry_run=False):
+    """Worker process entry point for the bench command: regrade one program on `site`"""
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        return get_filter_program(filters), regrade_submissions(filters, dry_run=dry_run)
+    finally:
+        frappe.destroy()
+
+
+def get_filter_program(filters):
+    program = filters.get("program")
+    return program if isinstance(program, str) else "(no program)"
@@ -0,0 +1,51 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from education_management import grading
+
+
+class TestGrading(FrappeTestCase):
+	def test_grade_scale_matches_on_both_paths(self):
+		scale = grading.parse_grade_boundaries(grading.DEFAULT_GRADE_BOUNDARIES)
+		percentages = [0, 59.99, 60, 74.9, 75, 89.99, 95, 100]
+		expected = ["F", "F", "D", "C", "C+", "B+", "A+", "A+"]
+
+		self.assertEqual([scale.grade(percentage) for percentage in percentages], expected)
+		self.assertEqual(scale.grade_many(percentages), expected)
+		self.assertEqual(grading.get_grades([0, 96], scale), [None, "A+"])
+
+	def test_parse_grade_boundaries(self):
+		scale = grading.parse_grade_boundaries("A: 80\nF: 0\nB: 50")
+		self.assertEqual(scale.grades, ("F", "B", "A"))
+
+		for value in ("Pass: 50", "A: 80\nA: 70", "A: 120", "A: 50\nB: 50", "A: 90\nB: 80"):
+			with self.assertRaises(frappe.ValidationError, msg=value):
+				grading.parse_grade_boundaries(value)
+
+	def test_zero_scores_out_of_a_maximum_are_graded(self):
+		scale = grading.parse_grade_boundaries(grading.DEFAULT_GRADE_BOUNDARIES)
+		self.assertEqual(grading.get_grades([0, 0, 80], scale, [100, 0, 100]), ["F", None, "B"])
+
+	def test_subject_rows_scoring_zero_get_the_lowest_grade(self):
+		doc = frappe.get_doc({
+			"doctype": "Merit Score Submission",
+			"subject_scores": [
+				{"subject": "Maths", "score": 0, "maximum_score": 100},
+				{"subject": "Physics", "score": 96, "maximum_score": 100},
+				{"subject": "Project", "score": 0},
+			],
+		})
+		scale = grading.parse_grade_boundaries(grading.DEFAULT_GRADE_BOUNDARIES)
+
+		with patch(
+			"education_management.education_management.doctype.merit_score_submission.merit_score_submission.get_grade_scale",
+			return_value=scale,
+		):
+			doc.calculate_subject_grades()
+
+		self.assertEqual([(row.percentage, row.grade) for row in doc.subject_scores], [(0, "F"), (96, "A+"), (0, None)])
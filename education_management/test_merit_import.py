@@ -0,0 +1,148 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+import csv
+import os
+import tempfile
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from education_management import grading, merit_import
+
+IMPORT_TEST_APPLICANTS = {
+	name: frappe._dict(
+		name=name, title=f"Applicant {name}", academic_year="2026-27", program="BSc", student_category="General"
+	)
+	for name in ("APP-1", "APP-2", "APP-3", "APP-4", "APP-5", "APP-6")
+}
+
+
+def import_test_entry(applicant, subjects, row_no=2, **parent):
+	"""A grouped import entry with `subjects` as (subject, score, maximum_score) rows"""
+	rows = [
+		{"student_applicant": applicant, "subject": subject, "score": score, "maximum_score": maximum}
+		for subject, score, maximum in subjects
+	]
+	rows[0].update(parent)
+	return {
+		"student_applicant": applicant,
+		"first_row": row_no,
+		"last_row": row_no + len(rows) - 1,
+		"parent": rows[0],
+		"subjects": rows,
+	}
+
+
+def get_import_test_records(doctype, filters=None, fields=None, as_list=False):
+	"""`frappe.get_all` for the import tests: every test applicant exists and APP-4 is already submitted"""
+	if doctype == "Student Applicant":
+		return [IMPORT_TEST_APPLICANTS[name] for name in filters["name"][1] if name in IMPORT_TEST_APPLICANTS]
+	return [("APP-4", "EDU-MRT-2026-00001")] if "APP-4" in filters["student_applicant"][1] else []
+
+
+class TestMeritImport(FrappeTestCase):
+	def test_import_groups_consecutive_rows(self):
+		rows = [
+			(2, {"student_applicant": "APP-1", "subject": "Maths", "total_merit_score": "150"}),
+			(3, {"student_applicant": "APP-1 ", "subject": "Physics"}),
+			(4, {"student_applicant": "APP-2", "subject": ""}),
+			(5, {"student_applicant": "APP-1", "subject": "Maths"}),
+		]
+		groups = list(merit_import.group_submissions(rows))
+
+		self.assertEqual(
+			[(group["student_applicant"], group["first_row"], group["last_row"]) for group in groups],
+			[("APP-1", 2, 3), ("APP-2", 4, 4), ("APP-1", 5, 5)],
+		)
+		self.assertEqual(groups[0]["parent"]["total_merit_score"], "150")
+		self.assertEqual([row["subject"] for row in groups[0]["subjects"]], ["Maths", "Physics"])
+		self.assertEqual(groups[1]["subjects"], [])
+
+	def test_import_resumes_after_checkpoint(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, "merit_scores.csv")
+			with open(path, "w", newline="") as f:
+				writer = csv.writer(f)
+				writer.writerow(["Student Applicant", "Subject", "Score", "Maximum Score"])
+				writer.writerows([
+					["APP-1", "Maths", 80, 100],
+					["APP-1", "Physics", 70, 100],
+					["", "", "", ""],
+					["APP-2", "Maths", 90, 100],
+					["APP-3", "Maths", 60, 100],
+				])
+
+			rows = list(merit_import.read_pending_rows(path))
+			self.assertEqual([row_no for row_no, _row in rows], [2, 3, 5, 6])
+			self.assertEqual(rows[0][1]["maximum_score"], "100")
+
+			# A checkpoint at the last row of APP-1 resumes with the next applicant
+			groups = list(merit_import.group_submissions(merit_import.read_pending_rows(path, 3)))
+			self.assertEqual([group["student_applicant"] for group in groups], ["APP-2", "APP-3"])
+			self.assertEqual(list(merit_import.read_pending_rows(path, 6)), [])
+
+	def test_import_collects_row_errors(self):
+		batch = [
+			import_test_entry("APP-1", [("Maths", "80", "100"), ("Physics", "70", "100")], 2),
+			import_test_entry("", [("Maths", "80", "100")], 4),
+			import_test_entry("APP-9", [("Maths", "80", "100")], 5),
+			import_test_entry("APP-4", [("Maths", "80", "100")], 6),
+			import_test_entry("APP-1", [("Maths", "80", "100")], 7),
+			import_test_entry("APP-2", [("Maths", "120", "100")], 8),
+			import_test_entry("APP-3", [("Maths", "eighty", "100")], 9),
+			import_test_entry("APP-5", [("Maths", "80", "100")], 10, total_merit_score="90"),
+			import_test_entry("APP-6", [("Maths", "45", "50")], 11, submission_date="2026-13-45"),
+		]
+
+		with patch("frappe.get_all", side_effect=get_import_test_records):
+			submissions, errors = merit_import.prepare_submissions(batch)
+
+		self.assertEqual([submission["student_applicant"] for submission in submissions], ["APP-1"])
+		self.assertEqual(
+			[(error["row"], error["error"]) for error in errors],
+			[
+				(4, "Student Applicant is required"),
+				(5, "Student Applicant APP-9 not found"),
+				(6, "Student Applicant APP-4 already has Merit Score Submission EDU-MRT-2026-00001"),
+				(7, "Student Applicant APP-1 appears more than once in this file"),
+				(8, "Score for Maths cannot be greater than maximum score"),
+				(9, "Score for Maths 'eighty' is not a number"),
+				(10, "Sum of subject scores (80.0) does not match total merit score (90.0)"),
+				(11, "Submission Date '2026-13-45' is not a valid date"),
+			],
+		)
+
+	def test_import_computes_percentages_and_grades_per_batch(self):
+		batch = [
+			import_test_entry("APP-1", [("Maths", "80", "100"), ("Physics", "70", "100")], 2),
+			import_test_entry("APP-2", [("Maths", "0", "100")], 4, maximum_possible_score="200"),
+		]
+
+		with patch("frappe.get_all", side_effect=get_import_test_records):
+			submissions, errors = merit_import.prepare_submissions(batch)
+
+		self.assertEqual(errors, [])
+		scale = grading.get_grade_scale()
+		self.assertEqual(
+			[(submission["total_merit_score"], submission["maximum_possible_score"], submission["percentage_score"])
+				for submission in submissions],
+			[(150.0, 200.0, 75.0), (0.0, 200.0, 0.0)],
+		)
+		self.assertEqual(submissions[0]["merit_grade"], grading.get_grade(75.0, scale))
+		self.assertIsNone(submissions[1]["merit_grade"])
+		self.assertEqual(
+			[(subject["percentage"], subject["grade"]) for subject in submissions[0]["subjects"]],
+			[(80.0, grading.get_grade(80.0, scale)), (70.0, grading.get_grade(70.0, scale))],
+		)
+
+	def test_import_reserves_consecutive_names(self):
+		first = merit_import.reserve_submission_names(3)
+		second = merit_import.reserve_submission_names(2)
+		names = first + second
+
+		self.assertEqual(len(set(names)), 5)
+		numbers = [int(name[-merit_import.SERIES_DIGITS:]) for name in names]
+		self.assertEqual(numbers, list(range(numbers[0], numbers[0] + 5)))
+		self.assertTrue(all(name.startswith(names[0][:-merit_import.SERIES_DIGITS]) for name in names))
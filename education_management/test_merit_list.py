@@ -0,0 +1,35 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+
+class TestMeritList(FrappeTestCase):
+	def test_merit_queries_can_use_indexes(self):
+		if frappe.db.db_type != "mariadb":
+			self.skipTest("EXPLAIN output is checked for MariaDB only")
+
+		queries = {
+			"merit_list_index": """select name, student_category from `tabMerit Score Submission`
+				where docstatus = 1 and validation_status = 'Validated' and submission_status = 'Approved'
+				and academic_year = '2026-27' and program = 'BSc'
+				order by total_merit_score desc, percentage_score desc""",
+			"merit_category_index": """select name from `tabMerit Score Submission`
+				where academic_year = '2026-27' and program = 'BSc' and student_category = 'OBC'
+				and validation_status = 'Validated'""",
+			"student_applicant_index": """select name from `tabMerit Score Submission`
+				where student_applicant = 'EDU-APP-0001'""",
+			"merit_submission_docstatus_index": """select name from `tabMerit Score Validation`
+				where merit_submission = 'EDU-MRT-0001' and docstatus = 0""",
+			"validation_queue_index": """select name from `tabMerit Score Submission`
+				where docstatus = 1 and validation_status = 'Pending' and submission_date < '2026-10-01'""",
+			"draft_validator_index": """select merit_submission, max(validator) from `tabMerit Score Validation`
+				where docstatus = 0 group by merit_submission""",
+		}
+
+		# Test tables are near empty, so which candidate the optimizer picks is not
+		# deterministic; check each index exists and is usable for its query
+		for index, query in queries.items():
+			plan = frappe.db.sql(f"explain {query}", as_dict=True)[0]
+			self.assertIn(index, (plan.possible_keys or "").split(","), msg=query)
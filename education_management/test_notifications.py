@@ -0,0 +1,103 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, add_to_date, now_datetime, nowdate
+
+from education_management.notifications import (
+	REMINDER_INTERVAL_HOURS,
+	dispatch_merit_notifications,
+	send_digest,
+	send_validation_reminders,
+)
+
+REMINDER_SETTINGS = frappe._dict(validation_reminder_days=3, notification_settings="Email")
+
+
+def notification_row(name, applicant_name=None):
+	return frappe._dict(name=name, applicant_name=applicant_name or f"Applicant {name}")
+
+
+class TestNotifications(FrappeTestCase):
+	def test_dispatch_sends_one_digest_per_recipient(self):
+		rows = {name: notification_row(name) for name in ("MS-1", "MS-2", "MS-3")}
+		recipients = {"MS-1": ["a@example.com", "v@example.com"], "MS-2": ["b@example.com"], "MS-3": ["a@example.com"]}
+
+		def get_recipient_entries(chunk, notification_type):
+			for name in chunk:
+				for email in recipients[name]:
+					yield email, rows[name]
+
+		with (
+			patch("education_management.notifications.NOTIFICATION_CHUNK_SIZE", 1),
+			patch("education_management.notifications.is_notification_enabled", return_value=True),
+			patch("education_management.notifications.get_recipient_entries", side_effect=get_recipient_entries) as get_entries,
+			patch("education_management.notifications.send_digest") as send,
+		):
+			dispatch_merit_notifications(["MS-1", "MS-2", "MS-3"], "validation")
+
+		# Chunks are read separately but still coalesce into one email per recipient
+		self.assertEqual(get_entries.call_count, 3)
+		digests = {call.args[0]: [row.name for row in call.args[1]] for call in send.call_args_list}
+		self.assertEqual(digests, {
+			"a@example.com": ["MS-1", "MS-3"],
+			"v@example.com": ["MS-1"],
+			"b@example.com": ["MS-2"],
+		})
+		self.assertEqual(send.call_count, 3)
+
+	def test_dispatch_skips_disabled_notifications(self):
+		with (
+			patch("education_management.notifications.is_notification_enabled", return_value=False),
+			patch("education_management.notifications.get_recipient_entries") as get_entries,
+			patch("education_management.notifications.send_digest") as send,
+		):
+			dispatch_merit_notifications(["MS-1"], "submission")
+
+		get_entries.assert_not_called()
+		send.assert_not_called()
+
+	def test_digest_subject_counts_entries(self):
+		with patch("frappe.sendmail") as sendmail, patch("frappe.get_template"):
+			send_digest("a@example.com", [notification_row("MS-1", "Asha")], "submission")
+			send_digest("a@example.com", [notification_row("MS-1"), notification_row("MS-2")], "submission")
+
+		single, digest = (call.kwargs for call in sendmail.call_args_list)
+		self.assertEqual(single["subject"], "Merit Score Submitted - Asha")
+		self.assertEqual(single["reference_name"], "MS-1")
+		self.assertEqual(digest["subject"], "2 Merit Score Submissions Received")
+		self.assertNotIn("reference_name", digest)
+
+	def test_overdue_submissions_are_reminded_once_per_interval(self):
+		frappe.get_doc({
+			"doctype": "Merit Score Submission",
+			"name": "_T-MRT-OVERDUE",
+			"docstatus": 1,
+			"validation_status": "Pending",
+			"applicant_name": "Overdue Applicant",
+			"submission_date": add_days(nowdate(), -10),
+		}).db_insert()
+
+		def remind():
+			with (
+				patch("education_management.notifications.get_education_management_settings", return_value=REMINDER_SETTINGS),
+				patch("education_management.notifications.get_role_emails", return_value=["validator@example.com"]),
+				patch("education_management.notifications.send_digest") as send,
+				patch.object(frappe.db, "commit"),
+			):
+				send_validation_reminders()
+
+			return any(row.name == "_T-MRT-OVERDUE" for call in send.call_args_list for row in call.args[1])
+
+		self.assertTrue(remind())
+		self.assertFalse(remind())
+
+		# Due again once the interval has passed
+		frappe.db.set_value(
+			"Merit Score Submission", "_T-MRT-OVERDUE", "last_validation_reminder",
+			add_to_date(now_datetime(), hours=-REMINDER_INTERVAL_HOURS - 1), update_modified=False
+		)
+		self.assertTrue(remind())
@@ -0,0 +1,217 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from education_management.ranking import (
+	RANKING_METHODS,
+	compute_ranks,
+	encode_keys,
+	fetch_ranking_rows,
+	get_partition_key,
+	get_rank_refresh_scopes,
+	get_scope_partitions,
+	insert_rank,
+	parse_tie_breakers,
+	remove_rank,
+	tiebreak_value,
+)
+
+PARTITIONS = {
+	"Overall": ("academic_year",),
+	"Program": ("academic_year", "program"),
+	"Category": ("academic_year", "program", "student_category"),
+}
+
+
+def ranking_row(name, total, percentage, program="BSc", category="General", tiebreak=()):
+	return ((-total, -percentage), tuple(tiebreak), name, ("2026-27", program, category))
+
+
+def partition_ranks(ranks, partition_type):
+	return [(name, rank) for name, _values, rank in ranks[partition_type]]
+
+
+RANK_TEST_PROGRAM = "_Test Rank Program"
+RANK_TEST_FIELDS = ("academic_year", "program")
+RANK_TEST_PARTITION = {
+	"partition_type": "Program",
+	"partition_key": get_partition_key(("2026-27", RANK_TEST_PROGRAM)),
+}
+
+# (name, total) of a seeded partition, with MS-B and MS-C tied
+RANK_TEST_SCORES = {"MS-A": 480, "MS-B": 450, "MS-C": 450, "MS-D": 410, "MS-E": 400}
+
+
+def rank_test_row(name, total):
+	return ranking_row(name, total, total / 5, RANK_TEST_PROGRAM)
+
+
+class TestRanking(FrappeTestCase):
+	def setUp(self):
+		self.rows = [
+			ranking_row("MS-4", 410, 82, "BA"),
+			ranking_row("MS-2", 450, 90, "BSc", "OBC", [tiebreak_value("2026-03-02")]),
+			ranking_row("MS-1", 480, 96, "BSc", "OBC"),
+			ranking_row("MS-3", 450, 90, "BA", tiebreak=[tiebreak_value("2026-03-01")]),
+			ranking_row("MS-5", 400, 80, "BSc", "OBC"),
+		]
+
+	def test_standard_competition_ranks(self):
+		ranks = compute_ranks(self.rows, "Standard Competition", PARTITIONS)
+
+		self.assertEqual(
+			partition_ranks(ranks, "Overall"),
+			[("MS-1", 1), ("MS-3", 2), ("MS-2", 2), ("MS-4", 4), ("MS-5", 5)],
+		)
+		self.assertEqual(
+			partition_ranks(ranks, "Program"),
+			[("MS-1", 1), ("MS-3", 1), ("MS-2", 2), ("MS-4", 2), ("MS-5", 3)],
+		)
+
+	def test_dense_ranks(self):
+		ranks = compute_ranks(self.rows, "Dense", PARTITIONS)
+		self.assertEqual([rank for _name, rank in partition_ranks(ranks, "Overall")], [1, 2, 2, 3, 4])
+
+	def test_ordinal_ranks_use_tie_breakers(self):
+		ranks = compute_ranks(self.rows, "Ordinal", PARTITIONS)
+		self.assertEqual(
+			partition_ranks(ranks, "Overall"),
+			[("MS-1", 1), ("MS-3", 2), ("MS-2", 3), ("MS-4", 4), ("MS-5", 5)],
+		)
+
+	def test_partition_ranks_in_one_pass(self):
+		ranks = compute_ranks(self.rows, "Standard Competition", PARTITIONS)
+		category_ranks = {name: (values, rank) for name, values, rank in ranks["Category"]}
+
+		self.assertEqual(category_ranks["MS-5"], (("2026-27", "BSc", "OBC"), 3))
+		self.assertEqual(category_ranks["MS-4"], (("2026-27", "BA", "General"), 2))
+
+	def test_scope_partitions(self):
+		self.assertEqual(list(get_scope_partitions({"academic_year": "2026-27"}, PARTITIONS)), list(PARTITIONS))
+		self.assertEqual(
+			list(get_scope_partitions({"academic_year": "2026-27", "program": "BSc"}, PARTITIONS)),
+			["Program", "Category"],
+		)
+
+		# Without program-wise ranking nothing can be ranked from one program's rows
+		year_partitions = {"Overall": ("academic_year",), "Category": ("academic_year", "student_category")}
+		self.assertEqual(get_scope_partitions({"academic_year": "2026-27", "program": "BSc"}, year_partitions), {})
+		self.assertEqual(compute_ranks(self.rows, "Standard Competition", {}), {})
+
+	def test_missing_category_ranks_as_general(self):
+		now = frappe.utils.now()
+		frappe.db.bulk_insert(
+			"Merit Score Submission",
+			[
+				"name", "creation", "modified", "owner", "modified_by", "docstatus", "student_applicant",
+				"academic_year", "program", "student_category", "total_merit_score", "percentage_score",
+			],
+			[
+				("_T-MRT-1", now, now, "Administrator", "Administrator", 1, "_T-APP-1", "_T-2026", "BSc", None, 450, 90),
+				("_T-MRT-2", now, now, "Administrator", "Administrator", 1, "_T-APP-2", "_T-2026", "BSc", "General", 400, 80),
+			],
+		)
+
+		rows = fetch_ranking_rows({"academic_year": "_T-2026"})
+		ranks = compute_ranks(rows, "Standard Competition", {"Category": PARTITIONS["Category"]})
+		self.assertEqual(
+			ranks["Category"],
+			[("_T-MRT-1", ("_T-2026", "BSc", "General"), 1), ("_T-MRT-2", ("_T-2026", "BSc", "General"), 2)],
+		)
+
+	def test_rank_refresh_scopes_cover_whole_years(self):
+		scopes = [("2026-27", "BSc"), ("2026-27", "BA"), ("2025-26", None), (None, "BSc")]
+		self.assertEqual(get_rank_refresh_scopes(scopes), [("2025-26", None), ("2026-27", None)])
+
+	def test_encoded_keys_follow_merit_order(self):
+		rows = sorted(self.rows)
+		sort_keys = [encode_keys(*row[:3])[1] for row in rows]
+		self.assertEqual(sorted(sort_keys), sort_keys)
+
+		tie_keys = [encode_keys(*row[:3])[0] for row in rows]
+		self.assertEqual(tie_keys[1], tie_keys[2])
+		self.assertLess(tie_keys[0], tie_keys[1])
+
+	def test_parse_tie_breakers(self):
+		self.assertEqual(
+			parse_tie_breakers("Subject Score : Mathematics\n\nDate of Birth"),
+			["Subject Score: Mathematics", "Date of Birth"],
+		)
+		self.assertRaises(Exception, parse_tie_breakers, "Height")
+
+	def seed_rank_partition(self, scores, method):
+		frappe.db.delete("Merit Rank", RANK_TEST_PARTITION)
+		rows = [rank_test_row(name, total) for name, total in scores.items()]
+		for name, _values, rank in compute_ranks(rows, method, {"Program": RANK_TEST_FIELDS})["Program"]:
+			row = next(row for row in rows if row[2] == name)
+			tie_key, sort_key = encode_keys(*row[:3])
+			frappe.get_doc({
+				"doctype": "Merit Rank",
+				"merit_submission": name,
+				**RANK_TEST_PARTITION,
+				"partition_rank": rank,
+				"tie_key": tie_key,
+				"sort_key": sort_key,
+				"academic_year": "2026-27",
+				"program": RANK_TEST_PROGRAM,
+			}).db_insert()
+
+	def insert_test_rank(self, name, total, method):
+		tie_key, sort_key = encode_keys(*rank_test_row(name, total)[:3])
+		return insert_rank(
+			name, "Program", RANK_TEST_FIELDS, ("2026-27", RANK_TEST_PROGRAM), tie_key, sort_key, method
+		)
+
+	def remove_test_rank(self, name, method):
+		row = frappe.get_all(
+			"Merit Rank",
+			filters={**RANK_TEST_PARTITION, "merit_submission": name},
+			fields=["name", "partition_type", "partition_key", "tie_key", "sort_key"],
+		)[0]
+		remove_rank(row, method)
+
+	def assert_ranks_match_full_refresh(self, scores, method):
+		stored = frappe.get_all(
+			"Merit Rank",
+			filters=RANK_TEST_PARTITION,
+			fields=["merit_submission", "partition_rank"],
+			order_by="sort_key asc",
+			as_list=True,
+		)
+		rows = [rank_test_row(name, total) for name, total in scores.items()]
+		expected = partition_ranks(compute_ranks(rows, method, {"Program": RANK_TEST_FIELDS}), "Program")
+		self.assertEqual([tuple(row) for row in stored], expected)
+
+	def test_incremental_rank_updates_match_full_refresh(self):
+		# Each change is (removed submission, (inserted submission, total)); a rescore is both
+		changes = {
+			"insert into tie group": (None, ("MS-F", 450)),
+			"insert between groups": (None, ("MS-F", 430)),
+			"insert at top": (None, ("MS-F", 500)),
+			"insert at bottom": (None, ("MS-F", 390)),
+			"remove from tie group": ("MS-B", None),
+			"remove singleton": ("MS-D", None),
+			"remove leader": ("MS-A", None),
+			"rescore out of tie group into another": ("MS-C", ("MS-C", 410)),
+			"rescore into tie group": ("MS-D", ("MS-D", 480)),
+			"rescore within its gap": ("MS-D", ("MS-D", 420)),
+		}
+
+		for method in RANKING_METHODS:
+			for change, (removed, inserted) in changes.items():
+				with self.subTest(method=method, change=change):
+					scores = dict(RANK_TEST_SCORES)
+					self.seed_rank_partition(scores, method)
+
+					if removed:
+						self.remove_test_rank(removed, method)
+						del scores[removed]
+					if inserted:
+						self.insert_test_rank(*inserted, method)
+						scores[inserted[0]] = inserted[1]
+
+					self.assert_ranks_match_full_refresh(scores, method)
+
+		frappe.db.delete("Merit Rank", RANK_TEST_PARTITION)
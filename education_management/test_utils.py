@@ -0,0 +1,87 @@
+# Copyright (c) 2026, SP and Contributors
+# See license.txt
+
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from education_management.utils import (
+	check_merit_list_requirement,
+	clear_applicant_merit_status,
+	clear_merit_dashboard_cache,
+	get_applicant_merit_status,
+	get_merit_dashboard_data,
+)
+
+MERIT_LIST_SETTINGS = frappe._dict(enable_merit_list_process=1, merit_list_mandatory=1, merit_validation_required=1)
+
+
+def student_applicant(application_status):
+	return frappe._dict(name="_T-APP-0001", title="Test Applicant", application_status=application_status)
+
+
+class TestUtils(FrappeTestCase):
+	def setUp(self):
+		clear_merit_dashboard_cache()
+		clear_applicant_merit_status()
+
+	def test_dashboard_cache_is_cleared_on_submission_changes(self):
+		doc_events = frappe.get_hooks("doc_events")["Merit Score Submission"]
+		submission = frappe._dict(student_applicant=None)
+
+		with patch("education_management.utils.get_merit_dashboard_counts", return_value={"total_submissions": 1}) as get_counts:
+			get_merit_dashboard_data()
+			get_merit_dashboard_data()
+			self.assertEqual(get_counts.call_count, 1)
+
+			for event in ("on_change", "on_trash"):
+				self.assertIn("education_management.utils.clear_merit_dashboard_cache", doc_events[event])
+				for method in doc_events[event]:
+					frappe.get_attr(method)(submission, event)
+
+				get_merit_dashboard_data()
+
+		self.assertEqual(get_counts.call_count, 3)
+
+	def test_dashboard_cache_is_kept_per_breakdown(self):
+		with patch("education_management.utils.get_merit_dashboard_counts", return_value={"total_submissions": 1}) as get_counts:
+			get_merit_dashboard_data()
+			get_merit_dashboard_data("program")
+			get_merit_dashboard_data("program")
+
+		self.assertEqual([call.args for call in get_counts.call_args_list], [(None,), ("program",)])
+		self.assertRaises(frappe.ValidationError, get_merit_dashboard_data, "docstatus")
+
+	def test_merit_check_skips_applicants_not_being_approved(self):
+		with (
+			patch("education_management.utils.get_education_management_settings") as get_settings,
+			patch("education_management.utils.get_applicant_merit_status") as get_status,
+		):
+			check_merit_list_requirement(student_applicant("Applied"), "on_update")
+
+		get_settings.assert_not_called()
+		get_status.assert_not_called()
+
+	def test_merit_check_needs_a_validated_submission(self):
+		with (
+			patch("education_management.utils.get_education_management_settings", return_value=MERIT_LIST_SETTINGS),
+			patch("education_management.utils.get_applicant_merit_status", return_value="Submitted") as get_status,
+		):
+			self.assertRaises(
+				frappe.ValidationError, check_merit_list_requirement, student_applicant("Approved"), "on_update"
+			)
+
+			get_status.return_value = "Validated"
+			check_merit_list_requirement(student_applicant("Admitted"), "on_update")
+
+	def test_applicant_merit_status_is_cached_until_submissions_change(self):
+		with patch("frappe.get_all", return_value=["Pending", "Validated"]) as get_all:
+			self.assertEqual(get_applicant_merit_status("_T-APP-0001"), "Validated")
+			self.assertEqual(get_applicant_merit_status("_T-APP-0001"), "Validated")
+			self.assertEqual(get_all.call_count, 1)
+
+			clear_applicant_merit_status(frappe._dict(student_applicant="_T-APP-0001"))
+			get_all.return_value = []
+			self.assertEqual(get_applicant_merit_status("_T-APP-0001"), "")
+			self.assertEqual(get_all.call_count, 2)
@@ -1,190 +1,304 @@
+import itertools
+
 import frappe
-from frappe.utils import cint
+from frappe.query_builder.functions import Count
+from frappe.utils import cint, cstr, flt
+
+BULK_UPDATE_CHUNK_SIZE = 1000
+
+SETTINGS_CACHE_KEY = "education_management_settings"
+
+# Education Management Settings fields with their type and default
+SETTINGS_FIELDS = {
+    "enable_merit_list_process": (cint, 1),
+    "merit_list_mandatory": (cint, 0),
+    "default_minimum_merit_score": (flt, 0),
+    "allow_score_modification_after_validation": (cint, 0),
+    "merit_validation_required": (cint, 1),
+    "auto_approve_if_documents_verified": (cint, 0),
+    "document_upload_mandatory": (cint, 1),
+    "max_file_size_mb": (cint, 10),
+    "grade_calculation_method": (cstr, "Percentage Based"),
+    "grade_boundaries": (cstr, ""),
+    "ranking_method": (cstr, "Standard Competition"),
+    "tie_breaking_criteria": (cstr, "Total Score"),
+    "tie_breaking_order": (cstr, ""),
+    "enable_category_wise_ranking": (cint, 1),
+    "enable_program_wise_ranking": (cint, 1),
+    "notification_settings": (cstr, "Email"),
+    "notify_on_submission": (cint, 1),
+    "notify_on_validation": (cint, 1),
+    "validation_reminder_days": (cint, 3),
+    "auto_generate_rankings": (cint, 1),
+}
+
+DASHBOARD_CACHE_KEY = "merit_dashboard_data"
+APPLICANT_MERIT_STATUS_KEY = "merit_applicant_status"
+DASHBOARD_BREAKDOWNS = ("program", "student_category", "academic_year")
 
 
 def check_merit_list_requirement(doc, method):
     """Check if merit list submission is required for student applicant"""
+    # Most applicant saves never reach approval; skip them before any lookup
+    if doc.application_status not in ("Approved", "Admitted"):
+        return
+
     settings = get_education_management_settings()
+    if not (settings.enable_merit_list_process and settings.merit_list_mandatory):
+        return
+
+    merit_status = get_applicant_merit_status(doc.name)
+
+    # Check merit submission requirements based on validation settings
+    if settings.merit_validation_required:
+        if merit_status != "Validated":
+            frappe.throw(
+                f"Merit score submission must be validated before approving/admitting {doc.title}",
+                frappe.ValidationError
+            )
+    elif not merit_status:
+        frappe.throw(
+            f"Merit score submission is required before approving/admitting {doc.title}",
+            frappe.ValidationError
+        )
 
-    if settings.get("enable_merit_list_process") and settings.get("merit_list_mandatory"):
-        # Check merit submission requirements based on validation settings
-        if settings.get("merit_validation_required"):
-            # Check if validated merit submission exists for this applicant
-            merit_submission = frappe.db.exists("Merit Score Submission", {
-                "student_applicant": doc.name,
-                "docstatus": 1,
-                "validation_status": "Validated"
-            })
 
-            if not merit_submission and doc.application_status in ["Approved", "Admitted"]:
-                frappe.throw(
-                    f"Merit score submission must be validated before approving/admitting {doc.title}",
-                    frappe.ValidationError
-                )
+def get_applicant_merit_status(student_applicant):
+    """Best status among an applicant's submitted merit scores: Validated, Submitted or "".
+
+    Read through a cache hash keyed by applicant, cleared when the
+    applicant's submissions change.
+    """
+    merit_status = frappe.cache.hget(APPLICANT_MERIT_STATUS_KEY, student_applicant)
+    if merit_status is None:
+        validation_statuses = frappe.get_all(
+            "Merit Score Submission",
+            filters={"student_applicant": student_applicant, "docstatus": 1},
+            pluck="validation_status"
+        )
+        if "Validated" in validation_statuses:
+            merit_status = "Validated"
         else:
-            # Just check if merit submission exists (no validation required)
-            merit_submission = frappe.db.exists("Merit Score Submission", {
-                "student_applicant": doc.name,
-                "docstatus": 1
-            })
+            merit_status = "Submitted" if validation_statuses else ""
+
+        frappe.cache.hset(APPLICANT_MERIT_STATUS_KEY, student_applicant, merit_status)
 
-            if not merit_submission and doc.application_status in ["Approved", "Admitted"]:
-                frappe.throw(
-                    f"Merit score submission is required before approving/admitting {doc.title}",
-                    frappe.ValidationError
-                )
+    return merit_status
+
+
+def clear_applicant_merit_status(doc=None, method=None):
+    """Drop cached merit status for a submission's applicant, or for every applicant.
+
+    Hooked to Merit Score Submission changes; bulk writers call it without a document.
+    """
+    if doc and doc.student_applicant:
+        frappe.cache.hdel(APPLICANT_MERIT_STATUS_KEY, doc.student_applicant)
+    else:
+        frappe.cache.delete_value(APPLICANT_MERIT_STATUS_KEY)
 
 
 @frappe.whitelist()
 def get_education_management_settings():
-    """Get education management settings with defaults"""
-    try:
-        settings = frappe.get_single("Education Management Settings")
-        return {
-            "enable_merit_list_process": cint(settings.enable_merit_list_process),
-            "merit_list_mandatory": cint(settings.merit_list_mandatory),
-            "merit_validation_required": cint(settings.merit_validation_required),
-            "document_upload_mandatory": cint(settings.document_upload_mandatory),
-            "auto_approve_if_documents_verified": cint(settings.auto_approve_if_documents_verified),
-            "default_minimum_merit_score": settings.default_minimum_merit_score or 0,
-            "max_file_size_mb": settings.max_file_size_mb or 10,
-            "enable_category_wise_ranking": cint(settings.enable_category_wise_ranking),
-            "enable_program_wise_ranking": cint(settings.enable_program_wise_ranking),
-            "auto_generate_rankings": cint(settings.auto_generate_rankings),
-            "notify_on_submission": cint(settings.notify_on_submission),
-            "notify_on_validation": cint(settings.notify_on_validation),
-            "validation_reminder_days": settings.validation_reminder_days or 3
-        }
-    except:
-        # Return defaults if settings don't exist
-        return {
-            "enable_merit_list_process": 1,
-            "merit_list_mandatory": 0,
-            "merit_validation_required": 1,
-            "document_upload_mandatory": 1,
-            "auto_approve_if_documents_verified": 0,
-            "default_minimum_merit_score": 0,
-            "max_file_size_mb": 10,
-            "enable_category_wise_ranking": 1,
-            "enable_program_wise_ranking": 1,
-            "auto_generate_rankings": 1,
-            "notify_on_submission": 1,
-            "notify_on_validation": 1,
-            "validation_reminder_days": 3
-        }
+    """Get education management settings with defaults.
+
+    Settings are memoized for the current request and cached in Redis until
+    Education Management Settings is saved.
+    """
+    settings = getattr(frappe.local, "education_management_settings", None)
+    if settings is None:
+        settings = frappe.cache.get_value(SETTINGS_CACHE_KEY, generator=load_education_management_settings)
+        frappe.local.education_management_settings = settings
+
+    return frappe._dict(settings)
+
+
+def load_education_management_settings():
+    """Read the single doctype's stored values in one query, typed and defaulted"""
+    stored = frappe.db.get_singles_dict("Education Management Settings")
+
+    settings = {}
+    for fieldname, (cast, default) in SETTINGS_FIELDS.items():
+        value = stored.get(fieldname)
+        settings[fieldname] = default if value in (None, "") else cast(value)
+
+    return settings
+
+
+def clear_education_management_settings_cache():
+    frappe.cache.delete_value(SETTINGS_CACHE_KEY)
+    frappe.local.education_management_settings = None
 
 
 @frappe.whitelist()
-def get_merit_dashboard_data():
-    """Get dashboard data for merit list overview"""
+def get_merit_dashboard_data(group_by=None):
+    """Get dashboard data for merit list overview.
+
+    Status counts come from one GROUP BY query, optionally broken down by
+    program, student category or academic year, and are cached until a
+    submission changes.
+    """
+    if group_by and group_by not in DASHBOARD_BREAKDOWNS:
+        frappe.throw(f"Dashboard breakdown must be one of {', '.join(DASHBOARD_BREAKDOWNS)}")
+
+    data = frappe.cache.hget(DASHBOARD_CACHE_KEY, group_by or "all")
+    if data is None:
+        data = get_merit_dashboard_counts(group_by)
+        frappe.cache.hset(DASHBOARD_CACHE_KEY, group_by or "all", data)
+
+    # Recent submissions respect the user's permissions, so they are cached per user
+    recent_key = f"recent::{frappe.session.user}"
+    recent_submissions = frappe.cache.hget(DASHBOARD_CACHE_KEY, recent_key)
+    if recent_submissions is None:
+        recent_submissions = frappe.get_all(
+            "Merit Score Submission",
+            filters={"docstatus": 1},
+            fields=[
+                "name", "applicant_name", "total_merit_score", "submission_status",
+                "validation_status", "submission_date"
+            ],
+            order_by="creation desc",
+            limit=10
+        )
+        frappe.cache.hset(DASHBOARD_CACHE_KEY, recent_key, recent_submissions)
+
+    return {**data, "recent_submissions": recent_submissions}
+
+
+def get_merit_dashboard_counts(group_by=None):
+    """Fold one grouped status count into dashboard totals and breakdowns"""
+    Submission = frappe.qb.DocType("Merit Score Submission")
+    status_fields = [
+        Submission.docstatus, Submission.validation_status,
+        Submission.submission_status, Submission.document_verification_status
+    ]
+    group_fields = [*status_fields, Submission[group_by]] if group_by else status_fields
+
+    rows = (
+        frappe.qb.from_(Submission)
+        .select(*group_fields, Count("*").as_("count"))
+        .groupby(*group_fields)
+        .run(as_dict=True)
+    )
+
     data = {
         "total_submissions": 0,
         "pending_validation": 0,
         "validated_submissions": 0,
         "rejected_submissions": 0,
-        "recent_submissions": []
+        "draft_submissions": 0,
+        "submission_status": {},
+        "document_verification_status": {},
+        "breakdown": {}
     }
 
-    # Get counts
-    data["total_submissions"] = frappe.db.count("Merit Score Submission", {"docstatus": 1})
-    data["pending_validation"] = frappe.db.count("Merit Score Submission", {
-        "docstatus": 1,
-        "validation_status": "Pending"
-    })
-    data["validated_submissions"] = frappe.db.count("Merit Score Submission", {
-        "docstatus": 1,
-        "validation_status": "Validated"
-    })
-    data["rejected_submissions"] = frappe.db.count("Merit Score Submission", {
-        "docstatus": 1,
-        "validation_status": "Rejected"
-    })
-
-    # Get recent submissions
-    data["recent_submissions"] = frappe.get_all(
-        "Merit Score Submission",
-        filters={"docstatus": 1},
-        fields=[
-            "name", "applicant_name", "total_merit_score", "submission_status",
-            "validation_status", "submission_date"
-        ],
-        order_by="creation desc",
-        limit=10
-    )
+    for row in rows:
+        if row.docstatus == 0:
+            data["draft_submissions"] += row.count
+        if row.docstatus != 1:
+            continue
+
+        counts = [data]
+        if group_by:
+            group = data["breakdown"].setdefault(row.get(group_by) or "", {
+                "total_submissions": 0,
+                "pending_validation": 0,
+                "validated_submissions": 0,
+                "rejected_submissions": 0
+            })
+            counts.append(group)
+
+        for target in counts:
+            target["total_submissions"] += row.count
+            if row.validation_status == "Pending":
+                target["pending_validation"] += row.count
+            elif row.validation_status == "Validated":
+                target["validated_submissions"] += row.count
+            elif row.validation_status == "Rejected":
+                target["rejected_submissions"] += row.count
+
+        for field in ("submission_status", "document_verification_status"):
+            data[field][row[field]] = data[field].get(row[field], 0) + row.count
 
     return data
 
 
-def send_merit_notification(submission_doc, notification_type):
-    """Send notifications for merit submissions"""
-    settings = get_education_management_settings()
+def clear_merit_dashboard_cache(doc=None, method=None):
+    """Drop cached dashboard data; hooked to Merit Score Submission changes"""
+    frappe.cache.delete_value(DASHBOARD_CACHE_KEY)
 
-    if not settings.get(f"notify_on_{notification_type}"):
-        return
 
-    # Get notification recipients
-    recipients = []
+def bulk_set_values(doctype, fields, rows, chunk_size=BULK_UPDATE_CHUNK_SIZE):
+    """Set `fields` on many documents with one UPDATE statement per chunk.
 
-    # Add student applicant email
-    if submission_doc.student_applicant:
-        applicant_doc = frappe.get_doc("Student Applicant", submission_doc.student_applicant)
-        if applicant_doc.student_email_id:
-            recipients.append(applicant_doc.student_email_id)
+    `rows` are `(name, value, ...)` tuples with values in `fields` order. Each
+    chunk is written as `SET field = CASE name WHEN .. THEN .. END`, so the whole
+    batch runs inside the caller's transaction without per-row round-trips.
+    `modified` is left untouched, as these are derived values.
+    """
+    rows = list(rows)
+    table = f"`tab{doctype}`"
 
-    # Add validators for validation notifications
-    if notification_type == "validation" and submission_doc.validated_by:
-        user_doc = frappe.get_doc("User", submission_doc.validated_by)
-        if user_doc.email:
-            recipients.append(user_doc.email)
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        set_clauses = []
+        values = []
 
-    if not recipients:
-        return
+        for idx, field in enumerate(fields, start=1):
+            cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+            set_clauses.append(f"`{field}` = CASE `name` {cases} END")
+            for row in chunk:
+                values.extend((row[0], row[idx]))
+
+        values.extend(row[0] for row in chunk)
+        placeholders = ", ".join(["%s"] * len(chunk))
 
-    # Prepare notification content
-    if notification_type == "submission":
-        subject = f"Merit Score Submitted - {submission_doc.applicant_name}"
-        message = f"""
-        Dear {submission_doc.applicant_name},
-
-        Your merit score submission has been received successfully.
-
-        Details:
-        - Merit Score: {submission_doc.total_merit_score}
-        - Percentage: {submission_doc.percentage_score}%
-        - Program: {submission_doc.program}
-        - Submission Date: {submission_doc.submission_date}
-
-        Your submission is now under review.
-
-        Best regards,
-        Education Management Team
-        """
-    else:  # validation
-        subject = f"Merit Score Validation Update - {submission_doc.applicant_name}"
-        status = submission_doc.validation_status
-        message = f"""
-        Dear {submission_doc.applicant_name},
-
-        Your merit score submission has been {status.lower()}.
-
-        Details:
-        - Merit Score: {submission_doc.total_merit_score}
-        - Status: {status}
-        - Validated By: {submission_doc.validated_by}
-        - Validation Date: {submission_doc.validation_date}
-
-        Best regards,
-        Education Management Team
-        """
-
-    # Send notification
-    try:
-        frappe.sendmail(
-            recipients=recipients,
-            subject=subject,
-            message=message,
-            reference_doctype="Merit Score Submission",
-            reference_name=submission_doc.name
+        frappe.db.sql(
+            f"UPDATE {table} SET {', '.join(set_clauses)} WHERE `name` IN ({placeholders})",
+            values
         )
-    except Exception as e:
-        frappe.log_error(f"Merit notification failed: {str(e)}", "Merit Notification Error")
\ No newline at end of file
+
+    return len(rows)
+
+
+def batched(iterable, size):
+    """Yield lists of up to `size` items from any iterable, consuming it lazily"""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def add_to_job_queue(queue_key, names, method, job_id):
+    """Add document names to the cache set `queue_key` and make sure `method` will drain it"""
+    if not names:
+        return
+
+    frappe.cache.sadd(queue_key, *names)
+    enqueue_job_queue(queue_key, method, job_id)
+
+
+def enqueue_job_queue(queue_key, method, job_id):
+    """Queue the deduplicated long job `method` if names are waiting in `queue_key`"""
+    if not frappe.cache.smembers(queue_key):
+        return
+
+    frappe.enqueue(
+        method,
+        queue="long",
+        timeout=3600,
+        job_id=job_id,
+        deduplicate=True,
+        enqueue_after_commit=True
+    )
+
+
+def drain_job_queue(queue_key, chunk_size):
+    """Yield sorted chunks of the names in `queue_key` until it is empty.
+
+    A chunk leaves the set once the caller asks for the next one, so names
+    queued during the run are picked up and a chunk whose handling raised
+    stays queued for the next run.
+    """
+    while queued := sorted(frappe.safe_decode(name) for name in frappe.cache.smembers(queue_key)):
+        for chunk in batched(queued, chunk_size):
+            yield chunk
+            frappe.cache.srem(queue_key, *chunk)